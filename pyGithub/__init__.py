@@ -4,21 +4,108 @@ Github API Wrapper
 
 A basic wrapper for the Github API.
 
+Names are resolved lazily: ``import pyGithub`` only sets up this module,
+and each submodule (and ``requests``, via the HTTP layer) is imported the
+first time one of its names is used.
+
 :copyright: (c) 2024-present Akami
 :license: MIT, see LICENSE for more details.
 """
-from .user import *
-from .repository import *
-from .issue import *
-from .client import *
-from .branch import *
-from .commit import *
-from .event import *
-from .issue import *
-from .label import *
-from .milestone import *
-from .release import *
-from .traffic import *
-
-from .ext.http import *
-from .ext.exceptions import *
\ No newline at end of file
+from __future__ import annotations
+from importlib import import_module
+from typing import Any, Dict, List, TYPE_CHECKING
+
+
+_EXPORTS: Dict[str, str] = {
+    "User": ".user",
+    "Repository": ".repository",
+    "Issue": ".issue",
+    "IssueComment": ".comment",
+    "PullRequest": ".pull",
+    "PullRequestBundle": ".pull",
+    "Review": ".pull",
+    "ReviewComment": ".pull",
+    "CheckRun": ".pull",
+    "Client": ".client",
+    "ClientSpec": ".client",
+    "Branch": ".branch",
+    "Commit": ".commit",
+    "CommitFile": ".commit",
+    "DiffStat": ".commit",
+    "Event": ".event",
+    "Label": ".label",
+    "Milestone": ".milestone",
+    "Release": ".release",
+    "Traffic": ".traffic",
+    "Tag": ".tag",
+    "ReleaseAsset": ".asset",
+    "GitTree": ".tree",
+    "GitTreeEntry": ".tree",
+    "Route": ".ext.http",
+    "Http": ".ext.http",
+    "GitHubError": ".ext.exceptions",
+    "NotFound": ".ext.exceptions",
+    "Unauthorized": ".ext.exceptions",
+    "Forbidden": ".ext.exceptions",
+    "BadRequest": ".ext.exceptions",
+    "Unprocessable": ".ext.exceptions",
+    "Unavailable": ".ext.exceptions",
+    "ServerError": ".ext.exceptions",
+    "Accepted": ".ext.exceptions",
+    "RateLimited": ".ext.exceptions",
+    "SecondaryRateLimited": ".ext.exceptions",
+    "UncertainWrite": ".ext.exceptions",
+    "ChecksumMismatch": ".ext.exceptions",
+    "DeadlineExceeded": ".ext.exceptions",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .user import User
+    from .repository import Repository
+    from .issue import Issue
+    from .comment import IssueComment
+    from .pull import PullRequest, PullRequestBundle, Review, ReviewComment, CheckRun
+    from .client import Client, ClientSpec
+    from .branch import Branch
+    from .commit import Commit, CommitFile, DiffStat
+    from .event import Event
+    from .label import Label
+    from .milestone import Milestone
+    from .release import Release
+    from .traffic import Traffic
+    from .tag import Tag
+    from .asset import ReleaseAsset
+    from .tree import GitTree, GitTreeEntry
+    from .ext.http import Route, Http
+    from .ext.exceptions import (
+        GitHubError, 
+        NotFound, 
+        Unauthorized, 
+        Forbidden, 
+        BadRequest, 
+        Unprocessable, 
+        Unavailable, 
+        ServerError, 
+        Accepted, 
+        RateLimited, 
+        SecondaryRateLimited, 
+        UncertainWrite, 
+        ChecksumMismatch, 
+        DeadlineExceeded
+    )
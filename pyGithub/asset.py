@@ -0,0 +1,94 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+class ReleaseAsset:
+    """
+    Represents a file attached to a GitHub release.
+    """
+    def __init__(self, asset_data: dict) -> None:
+        self._asset_data = asset_data or {}
+
+
+    @property
+    def id(self) -> int:
+        return self._asset_data.get("id")
+
+
+    @property
+    def name(self) -> str:
+        return self._asset_data.get("name")
+
+
+    @property
+    def label(self) -> str:
+        return self._asset_data.get("label")
+
+
+    @property
+    def content_type(self) -> str:
+        return self._asset_data.get("content_type")
+
+
+    @property
+    def state(self) -> str:
+        return self._asset_data.get("state")
+
+
+    @property
+    def size(self) -> int:
+        return self._asset_data.get("size")
+
+
+    @property
+    def digest(self) -> str:
+        return self._asset_data.get("digest")
+
+
+    @property
+    def download_count(self) -> int:
+        return self._asset_data.get("download_count")
+
+
+    @property
+    def url(self) -> str:
+        return self._asset_data.get("url")
+
+
+    @property
+    def browser_download_url(self) -> str:
+        return self._asset_data.get("browser_download_url")
+
+
+    @property
+    def created_at(self) -> str:
+        return self._asset_data.get("created_at")
+
+
+    @property
+    def updated_at(self) -> str:
+        return self._asset_data.get("updated_at")
+
+
+    def __repr__(self) -> str:
+        return f"ReleaseAsset(name={self.name}, size={self.size})"
@@ -23,25 +23,105 @@ furnished to do so, subject to the following conditions:
 """
 
 from __future__ import annotations
+from concurrent.futures import Future
+from datetime import datetime
+
+import os
 from typing import (
     List, 
     Dict, 
     Any, 
+    Iterable, 
+    Iterator, 
+    Callable, 
+    ContextManager, 
+    Sequence, 
+    BinaryIO, 
+    Union, 
+    Tuple, 
     Optional
 )
 
 from pyGithub.ext.http import Http
+from pyGithub.ext.cache import NegativeCache, RevalidationPolicy
+from pyGithub.ext.search import SearchEngine
+from pyGithub.ext.bulk import BulkWriter, WriteOp, WriteResult
+from pyGithub.ext.ratelimit import AdaptiveThrottle
+from pyGithub.ext.journal import WriteJournal
+from pyGithub.ext.history import CommitWalker
+from pyGithub.ext.pulls import PARTS, PullRequestBundler
+from pyGithub.ext.traffic import TrafficArchive, TrafficArchiver
+from pyGithub.ext.crawl import Crawler, CrawlResult
+from pyGithub.ext.stats import StatsPoller
+from pyGithub.ext.issues import IssueIndex
+from pyGithub.ext.fulltext import FullTextIndex
+from pyGithub.ext.blobcache import BlobCache
+from pyGithub.ext.shared import SharedState
+from pyGithub.ext import deadline as deadlines
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+from pyGithub.ext.exceptions import DeadlineExceeded, GitHubError, ServerError, UncertainWrite
 
 from pyGithub.user import User
 from pyGithub.repository import Repository
 from pyGithub.issue import Issue
-from pyGithub.commit import Commit  
+from pyGithub.comment import IssueComment
+from pyGithub.pull import PullRequest, PullRequestBundle
+from pyGithub.commit import Commit, CommitFile, DiffStat  
 from pyGithub.branch import Branch  
 from pyGithub.release import Release  
 from pyGithub.milestone import Milestone  
 from pyGithub.label import Label  
 from pyGithub.event import Event  
 from pyGithub.traffic import Traffic  
+from pyGithub.asset import ReleaseAsset
+from pyGithub.tree import GitTree
+
+
+class ClientSpec:
+    """
+    Picklable description of a :class:`Client`, for handing a client to
+    ``multiprocessing`` or ``ProcessPoolExecutor`` workers, which call
+    :meth:`build` to get their own instance.
+
+    Connections, threads and in-memory caches are per process and are not
+    carried over. Give the spec a :class:`SharedState` for the workers to
+    share cached responses and the rate-limit estimate. A journal is not
+    carried either, since a :class:`WriteJournal` must have a single writer.
+    """
+    def __init__(
+        self, 
+        token: Optional[str] = "", 
+        base: str = "https://api.github.com", 
+        shared: Optional[SharedState] = None, 
+        blob_cache: Optional[BlobCache] = None, 
+        negative_cache: Optional[NegativeCache] = None, 
+        revalidation: Optional[RevalidationPolicy] = None, 
+        timeout: Tuple[Optional[float], Optional[float]] = (10.0, 30.0)
+    ) -> None:
+        self.token = token
+        self.base = base
+        self.timeout = timeout
+        self.shared = shared
+        self.blob_cache = blob_cache
+        self.negative_cache = negative_cache
+        self.revalidation = revalidation
+
+
+    def build(self) -> Client:
+        client = Client(
+            self.token, 
+            blob_cache=self.blob_cache, 
+            shared=self.shared, 
+            negative_cache=self.negative_cache, 
+            revalidation=self.revalidation
+        )
+        client.http.base = self.base
+        client.http.timeout = self.timeout
+        return client
+
+
+    def __repr__(self) -> str:
+        return f"ClientSpec(base={self.base}, shared={self.shared})"
 
 
 class Client:
@@ -53,66 +133,306 @@ class Client:
     commits, branches, releases, and contributors. The Client utilizes an 
     authentication token to access the API, ensuring that the requests are 
     made securely and can include rate limits where applicable.
+
+    Searches that may exceed the API's 1,000 result cap go through
+    :attr:`search`, e.g. ``client.search.repositories("topic:python")``.
+
+    When a :class:`WriteJournal` is given, every ``create_*`` call is 
+    journaled, and operations the journal already records as done are 
+    skipped on a re-run. Pass ``idempotency_key`` to say which calls are
+    the same operation; otherwise identical calls are told apart by their
+    order. When a :class:`BlobCache` is given, git blobs are
+    served from it and only fetched once. When a :class:`NegativeCache` is
+    given, failed lookups and renames are remembered (see :class:`Http`).
+    A :class:`RevalidationPolicy` serves hot objects from the cache and
+    refreshes them in the background, e.g. ``RevalidationPolicy({
+    "/repos/{owner}/{repo}": (60, 3600)})``.
+
+    A single Client may be shared across worker threads; see :class:`Http`
+    for how connections, caches and rate-limit counters are shared. Across
+    processes, pass a :class:`SharedState` and send workers :meth:`spec`
+    (or the Client itself, which pickles as its spec).
     """
 
-    def __init__(self, token: Optional[str] = "") -> None:
+    def __init__(
+        self, 
+        token: Optional[str] = "", 
+        journal: Optional[WriteJournal] = None, 
+        blob_cache: Optional[BlobCache] = None, 
+        shared: Optional[SharedState] = None, 
+        negative_cache: Optional[NegativeCache] = None, 
+        revalidation: Optional[RevalidationPolicy] = None
+    ) -> None:
         self.token: Optional[str] = token
-        self.http: Http = Http()
+        self.journal: Optional[WriteJournal] = journal
+        self.blob_cache: Optional[BlobCache] = blob_cache
+        self.shared: Optional[SharedState] = shared
+        if shared is not None:
+            self.http: Http = Http(
+                cache=shared.cache, 
+                rate_limits=shared.rate_limits, 
+                negative_cache=negative_cache, 
+                revalidation=revalidation
+            )
+        else:
+            self.http = Http(negative_cache=negative_cache, revalidation=revalidation)
+        self.search: SearchEngine = SearchEngine(self.http, token=token)
+        self.throttle: AdaptiveThrottle = AdaptiveThrottle()
+        self.stats: StatsPoller = StatsPoller(self.http, token=token)
+
+
+    def spec(self) -> ClientSpec:
+        return ClientSpec(
+            self.token, 
+            self.http.base, 
+            shared=self.shared, 
+            blob_cache=self.blob_cache, 
+            negative_cache=self.http.negative_cache, 
+            revalidation=self.http.revalidation, 
+            timeout=self.http.timeout
+        )
+
+
+    def __reduce__(self) -> Tuple[Callable[[], Client], Tuple[()]]:
+        return self.spec().build, ()
+
+
+    def deadline(self, seconds: Optional[float]) -> ContextManager[Optional[float]]:
+        """
+        Bounds every API call made in the ``with`` block, in this thread
+        and in the worker pools it fans out to, to ``seconds`` from now::
+
+            with client.deadline(5.0):
+                issues = client.get_issues("owner", "repo")
+
+        Pagination, retries and rate-limit waits all draw from the same
+        budget; once it is spent, :class:`DeadlineExceeded` is raised.
+        """
+        return deadlines.deadline(seconds)
+
+
+    def close(self) -> None:
+        """
+        Stops background statistics polling and closes every thread's
+        pooled connections.
+        """
+        self.stats.close()
+        self.http.close()
+
+
+    def _write(
+        self, 
+        kind: str, 
+        owner: str, 
+        repo_name: str, 
+        fields: Dict[str, Any], 
+        call: Callable[[], Dict[str, Any]], 
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if self.journal is None:
+            return call()
+        key = self.journal.key(kind, owner, repo_name, fields, idempotency_key)
+        record = self.journal.get(key)
+        if self.journal.resume and record is not None:
+            if record["state"] == "done":
+                return dict(record.get("result") or {})
+            if record["state"] == "intent":
+                raise UncertainWrite(
+                    f"A previous {kind} write to {owner}/{repo_name} has no recorded outcome.", 
+                    key=key
+                )
+        self.journal.intent(key, {"kind": kind, "owner": owner, "repo_name": repo_name, "fields": fields})
+        try:
+            result = call()
+        except (ServerError, DeadlineExceeded):
+            # A 5xx (e.g. a proxy's 502) or a deadline that ran out while 
+            # waiting for the answer may follow a committed write, so the
+            # intent stays uncertain, as for a dropped connection or a 
+            # transport timeout.
+            raise
+        except GitHubError as error:
+            # Any other error answer means the write did not land.
+            self.journal.failed(key, error)
+            raise
+        self.journal.done(key, result)
+        return result
 
 
     def get_user(self, username: str) -> User:
         return self.http.fetch_user(username=username, token=self.token)
 
 
+    def user(self, username: str) -> User:
+        """
+        Returns a lazy :class:`User` handle without making a request.
+        The profile is fetched the first time an unknown field is read.
+        """
+        return User(
+            {"login": username}, 
+            http=self.http, 
+            token=self.token, 
+            completed=False
+        )
+
+
     def get_repo(self, owner: str, repo_name: str) -> Repository:
         return self.http.fetch_repo(owner=owner, repo_name=repo_name, token=self.token)
 
 
+    def repo(self, full_name: str) -> Repository:
+        """
+        Returns a lazy :class:`Repository` handle for ``owner/name`` without
+        making a request. The repository is fetched the first time an 
+        unknown field is read.
+        """
+        owner, repo_name = full_name.split("/", 1)
+        return Repository(
+            {"full_name": full_name, "name": repo_name, "owner": {"login": owner}},
+            http=self.http,
+            token=self.token,
+            completed=False
+        )
+
+
     def search_repos(self, query: str) -> List[Repository]:
+        """
+        Returns the first page of repositories matching ``query``. Use 
+        :attr:`search` to stream every match past the 1,000 result cap.
+        """
         repo_data: Dict[str, Any] = self.http.search_repositories(
             query=query, token=self.token
         )
         return [
-            Repository(
-                repo
-            ) 
-            for repo 
-            in repo_data.get(
-                "items", 
-                []
-            )
+            Repository(repo, http=self.http, token=self.token)
+            for repo in repo_data.get("items", [])
         ]
 
 
-    def get_issues(self, owner: str, repo_name: str) -> List[Issue]:
+    def get_issues(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        state: Optional[str] = None, 
+        since: Optional[str] = None, 
+        sort: Optional[str] = None, 
+        direction: Optional[str] = None
+    ) -> List[Issue]:
         issues_data: List[Dict[str, Any]] = self.http.fetch_issues(
-            owner=owner, repo_name=repo_name, token=self.token
+            owner=owner, 
+            repo_name=repo_name, 
+            token=self.token, 
+            state=state, 
+            since=since, 
+            sort=sort, 
+            direction=direction
         )
         return [
             Issue(
-                issue
+                issue, http=self.http, token=self.token
             ) 
             for issue 
             in issues_data
         ]
 
 
-    def get_pull_requests(self, owner: str, repo_name: str) -> List[Issue]:
+    def get_issue_index(self, owner: str, repo_name: str) -> IssueIndex:
+        """
+        Loads every issue and pull request of a repository into a local
+        :class:`IssueIndex`; call its ``sync()`` to pick up changes.
+        """
+        index = IssueIndex(self, owner, repo_name)
+        index.sync()
+        return index
+
+
+    def get_fulltext_index(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        path: Optional[str] = None, 
+        comments: bool = False, 
+        workers: int = 8
+    ) -> FullTextIndex:
+        """
+        Indexes the titles and bodies of every issue of a repository, and
+        with ``comments`` their comment threads, for offline search. With
+        a ``path`` the index is saved there and reopened memory-mapped.
+        """
+        index = FullTextIndex(path)
+        issues = self.get_issues(owner, repo_name, state="all")
+
+        def thread(issue: Issue) -> List[IssueComment]:
+            if not comments or not issue.comments:
+                return []
+            return self.get_issue_comments(owner, repo_name, issue.number)
+
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            for issue, issue_comments in zip(issues, executor.map(thread, issues)):
+                index.add_issue(issue, issue_comments)
+        if path is not None:
+            index.save()
+        return index
+
+
+    def get_pull_requests(self, owner: str, repo_name: str, state: Optional[str] = None) -> List[PullRequest]:
         pulls_data: List[Dict[str, Any]] = self.http.fetch_pull_requests(
-            owner=owner, repo_name=repo_name, token=self.token
+            owner=owner, repo_name=repo_name, token=self.token, state=state
         )
         return [
-            Issue(
-                pull
+            PullRequest(
+                pull, http=self.http, token=self.token
             )
             for pull 
             in pulls_data
         ]
 
 
-    def get_commits(self, owner: str, repo_name: str) -> List[Commit]:
+    def get_pull_request(self, owner: str, repo_name: str, pull_number: int) -> PullRequest:
+        pull_data: Dict[str, Any] = self.http.fetch_pull_request(
+            owner=owner, repo_name=repo_name, pull_number=pull_number, token=self.token
+        )
+        return PullRequest(pull_data, http=self.http, token=self.token)
+
+
+    def get_pull_request_bundles(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        pulls: Optional[Iterable[Union[int, PullRequest]]] = None, 
+        parts: Sequence[str] = PARTS, 
+        patches: bool = True, 
+        workers: int = 8
+    ) -> Iterator[PullRequestBundle]:
+        """
+        Yields each pull request with its reviews, review comments, files
+        and check runs, fetched concurrently; ``pulls`` defaults to every
+        pull request of the repository. See :class:`PullRequestBundler`.
+        """
+        if pulls is None:
+            pulls = self.get_pull_requests(owner, repo_name, state="all")
+        bundler = PullRequestBundler(self.http, token=self.token, workers=workers)
+        return bundler.bundles(owner, repo_name, pulls, parts=parts, patches=patches)
+
+
+    def get_commits(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        sha: Optional[str] = None, 
+        path: Optional[str] = None, 
+        since: Optional[str] = None, 
+        until: Optional[str] = None, 
+        author: Optional[str] = None
+    ) -> List[Commit]:
         commits_data: List[Dict[str, Any]] = self.http.fetch_commits(
-            owner=owner, repo_name=repo_name, token=self.token
+            owner=owner, 
+            repo_name=repo_name, 
+            token=self.token, 
+            sha=sha, 
+            path=path, 
+            since=since, 
+            until=until, 
+            author=author
         )
         return [
             Commit(commit)
@@ -120,6 +440,35 @@ class Client:
         ]
 
 
+    def get_commit_history(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        since: Optional[datetime] = None, 
+        until: Optional[datetime] = None, 
+        path: Optional[str] = None, 
+        author: Optional[str] = None, 
+        sha: Optional[str] = None, 
+        order: Optional[str] = None, 
+        workers: int = 8
+    ) -> Iterator[Commit]:
+        """
+        Streams a repository's full history, fetching time windows in
+        parallel. See :class:`CommitWalker` for the ``order`` options.
+        """
+        walker = CommitWalker(self.http, token=self.token, workers=workers)
+        return walker.walk(
+            owner, 
+            repo_name, 
+            since=since, 
+            until=until, 
+            path=path, 
+            author=author, 
+            sha=sha, 
+            order=order
+        )
+
+
     def get_branches(self, owner: str, repo_name: str) -> List[Branch]:
         branches_data: List[Dict[str, Any]] = self.http.fetch_branches(
             owner=owner, repo_name=repo_name, token=self.token
@@ -146,7 +495,7 @@ class Client:
         )
         return [
             User(
-                contributor
+                contributor, http=self.http, token=self.token, completed=False
             ) 
             for contributor
             in contributors_data
@@ -157,14 +506,41 @@ class Client:
         issue_data: Dict[str, Any] = self.http.fetch_issue(
             owner=owner, repo_name=repo_name, issue_number=issue_number, token=self.token
         )
-        return Issue(issue_data)
+        return Issue(issue_data, http=self.http, token=self.token)
 
 
-    def create_issue(self, owner: str, repo_name: str, title: str, body: Optional[str] = None) -> Issue:
-        issue_data: Dict[str, Any] = self.http.create_issue(
-            owner=owner, repo_name=repo_name, title=title, body=body, token=self.token
+    def get_issue_comments(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        issue_number: int, 
+        since: Optional[str] = None
+    ) -> List[IssueComment]:
+        comments_data: List[Dict[str, Any]] = self.http.fetch_issue_comments(
+            owner=owner, repo_name=repo_name, issue_number=issue_number, token=self.token, since=since
+        )
+        return [
+            IssueComment(comment, http=self.http, token=self.token)
+            for comment in comments_data
+        ]
+
+
+    def create_issue(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        title: str, 
+        body: Optional[str] = None, 
+        idempotency_key: Optional[str] = None
+    ) -> Issue:
+        issue_data: Dict[str, Any] = self._write(
+            "issue", owner, repo_name, {"title": title, "body": body},
+            lambda: self.http.create_issue(
+                owner=owner, repo_name=repo_name, title=title, body=body, token=self.token
+            ),
+            idempotency_key
         )
-        return Issue(issue_data)
+        return Issue(issue_data, http=self.http, token=self.token)
 
 
     def get_milestones(self, owner: str, repo_name: str) -> List[Milestone]:
@@ -183,15 +559,21 @@ class Client:
         repo_name: str, 
         title: str, 
         description: Optional[str] = None, 
-        due_on: Optional[str] = None
+        due_on: Optional[str] = None, 
+        idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
-        milestone_data: Dict[str, Any] = self.http.create_milestone(
-            owner=owner,
-            repo_name=repo_name, 
-            title=title, 
-            description=description, 
-            due_on=due_on, 
-            token=self.token
+        milestone_data: Dict[str, Any] = self._write(
+            "milestone", owner, repo_name, 
+            {"title": title, "description": description, "due_on": due_on},
+            lambda: self.http.create_milestone(
+                owner=owner,
+                repo_name=repo_name, 
+                title=title, 
+                description=description, 
+                due_on=due_on, 
+                token=self.token
+            ),
+            idempotency_key
         )
         return milestone_data
 
@@ -206,9 +588,20 @@ class Client:
         ]
 
 
-    def create_label(self, owner: str, repo_name: str, name: str, color: str) -> Dict[str, Any]:
-        label_data: Dict[str, Any] = self.http.create_label(
-            owner=owner, repo_name=repo_name, name=name, color=color, token=self.token
+    def create_label(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        name: str, 
+        color: str, 
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        label_data: Dict[str, Any] = self._write(
+            "label", owner, repo_name, {"name": name, "color": color},
+            lambda: self.http.create_label(
+                owner=owner, repo_name=repo_name, name=name, color=color, token=self.token
+            ),
+            idempotency_key
         )
         return label_data
 
@@ -230,6 +623,130 @@ class Client:
         return Commit(commit_data)
 
 
+    def get_commit_files(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        commit_sha: str, 
+        patches: bool = True
+    ) -> Iterator[CommitFile]:
+        """
+        Yields every file changed by a commit, fetching further pages as
+        the iteration reaches them. ``patches=False`` drops each file's 
+        diff text on arrival.
+        """
+        for file in self.http.fetch_commit_files(
+            owner=owner, repo_name=repo_name, commit_sha=commit_sha, token=self.token
+        ):
+            if not patches:
+                file = {name: value for name, value in file.items() if name != "patch"}
+            yield CommitFile(file)
+
+
+    def get_commit_stats(self, owner: str, repo_name: str, commit_sha: str) -> DiffStat:
+        return DiffStat(self.get_commit_files(owner, repo_name, commit_sha, patches=False))
+
+
+    def get_commit_diff(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        commit_sha: str, 
+        patch: bool = False
+    ) -> Iterator[str]:
+        """
+        Streams a commit's unified diff line by line; ``patch=True`` 
+        streams it in ``git format-patch`` form instead.
+        """
+        return self.http.stream_commit_diff(
+            owner=owner, 
+            repo_name=repo_name, 
+            commit_sha=commit_sha, 
+            token=self.token, 
+            media="patch" if patch else "diff"
+        )
+
+
+    def get_tree(self, owner: str, repo_name: str, tree_sha: str, recursive: bool = True) -> GitTree:
+        tree_data: Dict[str, Any] = self.http.fetch_tree(
+            owner=owner, repo_name=repo_name, tree_sha=tree_sha, token=self.token, recursive=recursive
+        )
+        return GitTree(tree_data)
+
+
+    def get_blob(self, owner: str, repo_name: str, blob_sha: str) -> bytes:
+        if self.blob_cache is not None:
+            content = self.blob_cache.get(blob_sha)
+            if content is not None:
+                return content
+        content = self.http.fetch_blob(
+            owner=owner, repo_name=repo_name, blob_sha=blob_sha, token=self.token
+        )
+        if self.blob_cache is not None:
+            self.blob_cache.put(blob_sha, content)
+        return content
+
+
+    def get_tree_contents(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        ref: str, 
+        workers: int = 8
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yields ``(path, content)`` for every file at ``ref``, in tree order.
+        Blobs are fetched concurrently; with a :attr:`blob_cache`, blobs
+        unchanged since an earlier scan are not downloaded again.
+        """
+        files = self._tree_files(owner, repo_name, ref, workers)
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            contents = executor.map(lambda file: self.get_blob(owner, repo_name, file[1]), files)
+            for (path, _), content in zip(files, contents):
+                yield path, content
+
+
+    def _tree_files(self, owner: str, repo_name: str, ref: str, workers: int) -> List[Tuple[str, str]]:
+        """
+        Returns ``(path, blob sha)`` for every file at ``ref``. When the API
+        truncates the recursive listing (large repositories), the tree is 
+        walked one level of subtrees at a time instead.
+        """
+        tree = self.get_tree(owner, repo_name, ref, recursive=True)
+        if not tree.truncated:
+            return [(entry.path, entry.sha) for entry in tree.blobs]
+
+        trees: Dict[str, GitTree] = {}
+        level = [ref]
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            while level:
+                fetched = executor.map(
+                    lambda sha: self.get_tree(owner, repo_name, sha, recursive=False), level
+                )
+                for sha, subtree in zip(level, fetched):
+                    if subtree.truncated:
+                        raise GitHubError(f"Tree {sha} of {owner}/{repo_name} is too large to list.")
+                    trees[sha] = subtree
+                level = list(dict.fromkeys(
+                    entry.sha 
+                    for sha in level 
+                    for entry in trees[sha].entries 
+                    if entry.type == "tree" and entry.sha not in trees
+                ))
+
+        files: List[Tuple[str, str]] = []
+
+        def walk(sha: str, prefix: str) -> None:
+            for entry in trees[sha].entries:
+                if entry.type == "blob":
+                    files.append((f"{prefix}{entry.path}", entry.sha))
+                elif entry.type == "tree":
+                    walk(entry.sha, f"{prefix}{entry.path}/")
+
+        walk(ref, "")
+        return files
+
+
     def get_release(self, owner: str, repo_name: str, release_id: int) -> Release:
         release_data: Dict[str, Any] = self.http.fetch_release(
             owner=owner, repo_name=repo_name, release_id=release_id, token=self.token
@@ -245,27 +762,131 @@ class Client:
         name: Optional[str] = None,
         body: Optional[str] = None,
         draft: bool = False, 
-        prerelease: bool = False
+        prerelease: bool = False, 
+        idempotency_key: Optional[str] = None
     ) -> Release:
-        release_data: Dict[str, Any] = self.http.create_release(
-            owner=owner, 
-            repo_name=repo_name,
-            tag_name=tag_name,
-            name=name,
-            body=body, 
-            draft=draft, 
-            prerelease=prerelease,
-            token=self.token
+        release_data: Dict[str, Any] = self._write(
+            "release", owner, repo_name, 
+            {"tag_name": tag_name, "name": name, "body": body, "draft": draft, "prerelease": prerelease},
+            lambda: self.http.create_release(
+                owner=owner, 
+                repo_name=repo_name,
+                tag_name=tag_name,
+                name=name,
+                body=body, 
+                draft=draft, 
+                prerelease=prerelease,
+                token=self.token
+            ),
+            idempotency_key
         )
         return Release(release_data)
 
 
+    def bulk_create(self, operations: Iterable[WriteOp], workers: int = 4) -> Iterator[WriteResult]:
+        """
+        Runs many create operations with adaptive pacing, in parallel
+        across repositories and in order within each. See :class:`BulkWriter`.
+        """
+        writer = BulkWriter(self, throttle=self.throttle, workers=workers)
+        return writer.run(operations)
+
+
+    def download_asset(
+        self, 
+        asset: ReleaseAsset, 
+        path: str, 
+        workers: int = 4, 
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """
+        Downloads ``asset`` to ``path`` with parallel, resumable range 
+        requests and verifies it. See :class:`AssetDownloader`.
+        """
+        from pyGithub.ext.transfer import AssetDownloader
+
+        downloader = AssetDownloader(self.http, token=self.token, workers=workers)
+        return downloader.download(asset, path, progress=progress)
+
+
+    def download_assets(self, assets: Iterable[ReleaseAsset], directory: str, workers: int = 4) -> List[str]:
+        """
+        Downloads several assets into ``directory`` concurrently.
+        """
+        with ContextThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.download_asset, asset, os.path.join(directory, asset.name))
+                for asset in assets
+            ]
+            return [future.result() for future in futures]
+
+
+    def upload_asset(
+        self, 
+        release: Release, 
+        source: Union[str, BinaryIO], 
+        name: Optional[str] = None, 
+        label: Optional[str] = None, 
+        content_type: Optional[str] = None, 
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> ReleaseAsset:
+        """
+        Streams a file path or binary file object to ``release`` as a new
+        asset. See :class:`AssetUploader`.
+        """
+        from pyGithub.ext.transfer import AssetUploader
+
+        uploader = AssetUploader(self.http, token=self.token)
+        return uploader.upload(release, source, name=name, label=label, content_type=content_type, progress=progress)
+
+
+    def upload_assets(self, release: Release, paths: Iterable[str], workers: int = 4) -> List[ReleaseAsset]:
+        from pyGithub.ext.transfer import AssetUploader
+
+        return AssetUploader(self.http, token=self.token, workers=workers).upload_many(release, paths)
+
+
+    def download_archive(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        dest: Optional[str] = None, 
+        ref: Optional[str] = None, 
+        format: str = "tarball"
+    ) -> Union[List[str], Iterator[Tuple[str, bytes]]]:
+        """
+        Streams a repository snapshot. With ``dest`` the files are written
+        there and their paths returned; otherwise ``(path, bytes)`` members
+        are yielded. See :class:`ArchiveDownloader`.
+        """
+        from pyGithub.ext.transfer import ArchiveDownloader
+
+        downloader = ArchiveDownloader(self.http, token=self.token)
+        if dest is None:
+            return downloader.members(owner, repo_name, ref=ref, format=format)
+        return downloader.extract(owner, repo_name, dest, ref=ref, format=format)
+
+
+    def download_archives(
+        self, 
+        repos: Iterable[str], 
+        dest: str, 
+        ref: Optional[str] = None, 
+        format: str = "tarball", 
+        workers: int = 4
+    ) -> Dict[str, List[str]]:
+        from pyGithub.ext.transfer import ArchiveDownloader
+
+        downloader = ArchiveDownloader(self.http, token=self.token, workers=workers)
+        return downloader.extract_many(repos, dest, ref=ref, format=format)
+
+
     def get_forks(self, owner: str, repo_name: str) -> List[Repository]:
         forks_data: List[Dict[str, Any]] = self.http.fetch_forks(
             owner=owner, repo_name=repo_name, token=self.token
         )
         return [
-            Repository(fork)
+            Repository(fork, http=self.http, token=self.token)
             for fork in forks_data
         ]
 
@@ -275,7 +896,7 @@ class Client:
             owner=owner, repo_name=repo_name, token=self.token
         )
         return [
-            User(stargazer)
+            User(stargazer, http=self.http, token=self.token, completed=False)
             for stargazer in stargazers_data
         ]
 
@@ -283,7 +904,7 @@ class Client:
     def get_watched_repos(self) -> List[Repository]:
         watched_data: List[Dict[str, Any]] = self.http.fetch_watched_repos(token=self.token)
         return [
-            Repository(repo)
+            Repository(repo, http=self.http, token=self.token)
             for repo in watched_data
         ]
 
@@ -291,7 +912,7 @@ class Client:
     def get_repositories_for_user(self, username: str) -> List[Repository]:
         user_repos_data: List[Dict[str, Any]] = self.http.fetch_repositories_for_user(username=username, token=self.token)
         return [
-            Repository(repo)
+            Repository(repo, http=self.http, token=self.token)
             for repo in user_repos_data
         ]
 
@@ -318,6 +939,34 @@ class Client:
         )
 
 
+    def get_contributor_stats(self, owner: str, repo_name: str) -> Future:
+        return self.stats.request(owner, repo_name, "contributors")
+
+
+    def get_commit_activity(self, owner: str, repo_name: str) -> Future:
+        return self.stats.request(owner, repo_name, "commit_activity")
+
+
+    def get_code_frequency(self, owner: str, repo_name: str) -> Future:
+        return self.stats.request(owner, repo_name, "code_frequency")
+
+
+    def get_participation(self, owner: str, repo_name: str) -> Future:
+        return self.stats.request(owner, repo_name, "participation")
+
+
+    def warm_stats(
+        self, 
+        repos: Iterable[str], 
+        kinds: Sequence[str] = ("contributors", "commit_activity", "code_frequency")
+    ) -> Dict[Any, Future]:
+        """
+        Starts computing statistics for many ``owner/name`` repositories at
+        once; 202 responses are polled in the background. See :class:`StatsPoller`.
+        """
+        return self.stats.warm(repos, kinds)
+
+
     def get_traffic_views(self, owner: str, repo_name: str) -> Dict[str, Any]:
         traffic_views_data: Dict[str, Any] = self.http.fetch_traffic_views(
             owner=owner, repo_name=repo_name, token=self.token
@@ -332,8 +981,51 @@ class Client:
         return traffic_clones_data
 
 
-    def get_traffic(self, owner: str, repo_name: str) -> Traffic:
+    def get_traffic(self, owner: str, repo_name: str, kind: str = "views") -> Traffic:
         traffic_data: Dict[str, Any] = self.http.fetch_traffic(
+            owner=owner, repo_name=repo_name, token=self.token, kind=kind
+        )
+        return Traffic(traffic_data)
+
+
+    def get_traffic_referrers(self, owner: str, repo_name: str) -> List[Dict[str, Any]]:
+        return self.http.fetch_traffic_referrers(
+            owner=owner, repo_name=repo_name, token=self.token
+        )
+
+
+    def get_traffic_paths(self, owner: str, repo_name: str) -> List[Dict[str, Any]]:
+        return self.http.fetch_traffic_paths(
             owner=owner, repo_name=repo_name, token=self.token
         )
-        return Traffic(traffic_data)
\ No newline at end of file
+
+
+    def crawl_org(
+        self, 
+        org: str, 
+        resources: Sequence[str] = ("branches", "releases", "contributors", "labels", "milestones"), 
+        workers: int = 16, 
+        checkpoint: Optional[str] = None
+    ) -> Iterator[CrawlResult]:
+        """
+        Streams the given resources for every repository of ``org``,
+        fetched concurrently. See :class:`Crawler`.
+        """
+        crawler = Crawler(self, resources=resources, workers=workers, checkpoint=checkpoint)
+        return crawler.crawl_org(org)
+
+
+    def archive_traffic(self, archive: TrafficArchive, org: str, workers: int = 16) -> Dict[str, Exception]:
+        """
+        Archives traffic for every repository of ``org`` into ``archive``.
+        Returns the errors by repository.
+        """
+        return TrafficArchiver(self, archive, workers=workers).archive_org(org)
+
+
+    def get_org_repos(self, org: str) -> List[Repository]:
+        org_repos_data: List[Dict[str, Any]] = self.http.fetch_org_repos(org=org, token=self.token)
+        return [
+            Repository(repo, http=self.http, token=self.token)
+            for repo in org_repos_data
+        ]
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+from pyGithub.user import User
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+class IssueComment:
+    """
+    Represents a comment on a GitHub issue or pull request.
+    """
+    def __init__(
+        self, 
+        comment_data: dict, 
+        http: Optional[Http] = None, 
+        token: Optional[str] = None
+    ) -> None:
+        self._comment_data = comment_data or {}
+        self._http = http
+        self._token = token
+        self._user: Optional[User] = None
+
+
+    @property
+    def id(self) -> int:
+        return self._comment_data.get("id")
+
+
+    @property
+    def body(self) -> str:
+        return self._comment_data.get("body")
+
+
+    @property
+    def user(self) -> Optional[User]:
+        if self._user is None and self._comment_data.get("user") is not None:
+            self._user = User(self._comment_data["user"], http=self._http, token=self._token, completed=False)
+        return self._user
+
+
+    @property
+    def author_association(self) -> str:
+        return self._comment_data.get("author_association")
+
+
+    @property
+    def created_at(self) -> str:
+        return self._comment_data.get("created_at")
+
+
+    @property
+    def updated_at(self) -> str:
+        return self._comment_data.get("updated_at")
+
+
+    @property
+    def html_url(self) -> str:
+        return self._comment_data.get("html_url")
+
+
+    def __repr__(self) -> str:
+        return f"IssueComment(id={self.id}, user={self.user.login if self.user else None})"
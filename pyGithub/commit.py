@@ -22,6 +22,168 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from __future__ import annotations
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+STATUSES = ("added", "removed", "modified", "renamed", "copied", "changed", "unchanged")
+
+
+class CommitFile:
+    """
+    Represents one file changed by a commit.
+    """
+    def __init__(self, file_data: dict) -> None:
+        self._file_data = file_data or {}
+
+
+    @property
+    def filename(self) -> str:
+        return self._file_data.get("filename")
+
+
+    @property
+    def previous_filename(self) -> Optional[str]:
+        return self._file_data.get("previous_filename")
+
+
+    @property
+    def status(self) -> str:
+        return self._file_data.get("status")
+
+
+    @property
+    def additions(self) -> int:
+        return self._file_data.get("additions", 0)
+
+
+    @property
+    def deletions(self) -> int:
+        return self._file_data.get("deletions", 0)
+
+
+    @property
+    def changes(self) -> int:
+        return self._file_data.get("changes", 0)
+
+
+    @property
+    def sha(self) -> str:
+        return self._file_data.get("sha")
+
+
+    @property
+    def patch(self) -> Optional[str]:
+        """
+        The file's unified diff; missing for binary or very large files.
+        """
+        return self._file_data.get("patch")
+
+
+    @property
+    def blob_url(self) -> str:
+        return self._file_data.get("blob_url")
+
+
+    @property
+    def raw_url(self) -> str:
+        return self._file_data.get("raw_url")
+
+
+    def __repr__(self) -> str:
+        return f"CommitFile(filename={self.filename}, status={self.status}, +{self.additions} -{self.deletions})"
+
+
+class DiffStat:
+    """
+    Per-file line counts of a commit, like ``git diff --stat``.
+
+    Counts are kept column-wise in typed arrays and statuses as one byte
+    each, so the stats of a commit touching thousands of files stay small
+    once their patches are dropped.
+    """
+    def __init__(self, files: Iterable[CommitFile] = ()) -> None:
+        self.filenames: List[str] = []
+        self._additions = array("I")
+        self._deletions = array("I")
+        self._statuses = bytearray()
+        self._positions: Dict[str, int] = {}
+        for file in files:
+            self.add(file)
+
+
+    def add(self, file: CommitFile) -> None:
+        self._positions[file.filename] = len(self.filenames)
+        self.filenames.append(file.filename)
+        self._additions.append(file.additions)
+        self._deletions.append(file.deletions)
+        status = file.status
+        self._statuses.append(STATUSES.index(status) if status in STATUSES else STATUSES.index("changed"))
+
+
+    @property
+    def additions(self) -> int:
+        return sum(self._additions)
+
+
+    @property
+    def deletions(self) -> int:
+        return sum(self._deletions)
+
+
+    @property
+    def total(self) -> int:
+        return self.additions + self.deletions
+
+
+    def get(self, filename: str) -> Optional[Tuple[str, int, int]]:
+        """
+        Returns ``(status, additions, deletions)`` for ``filename``.
+        """
+        position = self._positions.get(filename)
+        if position is None:
+            return None
+        return STATUSES[self._statuses[position]], self._additions[position], self._deletions[position]
+
+
+    def largest(self, count: int = 10) -> List[Tuple[str, int, int]]:
+        """
+        Returns ``(filename, additions, deletions)`` for the ``count`` 
+        files with the most changed lines.
+        """
+        order = sorted(
+            range(len(self.filenames)), 
+            key=lambda position: self._additions[position] + self._deletions[position], 
+            reverse=True
+        )
+        return [
+            (self.filenames[position], self._additions[position], self._deletions[position]) 
+            for position in order[:count]
+        ]
+
+
+    def __len__(self) -> int:
+        return len(self.filenames)
+
+
+    def __iter__(self) -> Iterator[Tuple[str, str, int, int]]:
+        """
+        Yields ``(filename, status, additions, deletions)`` per file.
+        """
+        for position, filename in enumerate(self.filenames):
+            yield (
+                filename, 
+                STATUSES[self._statuses[position]], 
+                self._additions[position], 
+                self._deletions[position]
+            )
+
+
+    def __repr__(self) -> str:
+        return f"DiffStat(files={len(self)}, +{self.additions} -{self.deletions})"
+
+
 class Commit:
     """
     Represents a GitHub commit.
@@ -55,5 +217,38 @@ class Commit:
         return self._commit_data.get("url")
 
 
+    @property
+    def html_url(self) -> str:
+        return self._commit_data.get("html_url")
+
+
+    @property
+    def parents(self) -> list:
+        return self._commit_data.get("parents") or []
+
+
+    @property
+    def stats(self) -> dict:
+        """
+        ``additions``, ``deletions`` and ``total`` for the whole commit;
+        only present on commits fetched one by one.
+        """
+        return self._commit_data.get("stats") or {}
+
+
+    @property
+    def files(self) -> List[CommitFile]:
+        """
+        The files of the first page only (up to 300); use 
+        :meth:`Client.get_commit_files` for large commits.
+        """
+        return [CommitFile(file) for file in self._commit_data.get("files") or []]
+
+
+    @property
+    def date(self) -> str:
+        return ((self._commit_data.get("commit") or {}).get("committer") or {}).get("date")
+
+
     def __repr__(self) -> str:
         return f"Commit(sha={self.sha})"
\ No newline at end of file
@@ -0,0 +1,177 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional, Tuple
+
+import hashlib
+import mmap
+import os
+import tempfile
+import threading
+import time
+import zlib
+
+
+RAW = b"\x00"
+DEFLATED = b"\x01"
+
+
+def blob_sha(content: bytes) -> str:
+    """
+    Returns the git object id of ``content`` as a blob.
+    """
+    digest = hashlib.sha1(b"blob %d\x00" % len(content))
+    digest.update(content)
+    return digest.hexdigest()
+
+
+class BlobCache:
+    """
+    Content-addressed local store for git blobs.
+
+    Blobs are immutable, so an entry keyed by its SHA never needs 
+    revalidation. Each blob is one file under ``root/ab/cdef...`` holding a
+    one-byte flag and the content, zlib-compressed unless that does not 
+    shrink it; files are read through ``mmap``. Content is checked against
+    its SHA before it is stored. When the store grows past ``max_bytes``,
+    the least recently read blobs are evicted (access times are kept in 
+    the files' mtimes, so recency survives restarts).
+    """
+    def __init__(self, root: str, max_bytes: int = 1024 ** 3, level: int = 6) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.level = level
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, float]] = {}
+        self._size = 0
+        os.makedirs(root, exist_ok=True)
+        for directory in os.scandir(root):
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory.path):
+                stat = entry.stat()
+                self._entries[directory.name + entry.name] = (stat.st_size, stat.st_mtime)
+                self._size += stat.st_size
+
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"root": self.root, "max_bytes": self.max_bytes, "level": self.level}
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+
+    def _path(self, sha: str) -> str:
+        return os.path.join(self.root, sha[:2], sha[2:])
+
+
+    def __contains__(self, sha: str) -> bool:
+        return sha in self._entries
+
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+    def get(self, sha: str) -> Optional[bytes]:
+        if sha not in self._entries:
+            return None
+        path = self._path(sha)
+        try:
+            with open(path, "rb") as handle:
+                if os.fstat(handle.fileno()).st_size <= 1:
+                    content = b""
+                else:
+                    with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        body = memoryview(data)[1:]
+                        try:
+                            content = zlib.decompress(body) if data[:1] == DEFLATED else bytes(body)
+                        finally:
+                            body.release()
+        except FileNotFoundError:
+            with self._lock:
+                size, _ = self._entries.pop(sha, (0, 0.0))
+                self._size -= size
+            return None
+        now = time.time()
+        with self._lock:
+            if sha in self._entries:
+                self._entries[sha] = (self._entries[sha][0], now)
+                try:
+                    os.utime(path, (now, now))
+                except FileNotFoundError:
+                    # Evicted by another process since it was read.
+                    pass
+        return content
+
+
+    def put(self, sha: str, content: bytes) -> None:
+        if sha in self._entries:
+            return
+        if blob_sha(content) != sha:
+            raise ValueError(f"Content does not match blob {sha}.")
+        compressed = zlib.compress(content, self.level)
+        data = DEFLATED + compressed if len(compressed) < len(content) else RAW + content
+        path = self._path(sha)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(data)
+        os.replace(temporary, path)
+        with self._lock:
+            if sha in self._entries:
+                return
+            self._entries[sha] = (len(data), time.time())
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+
+    def _evict(self) -> None:
+        target = self.max_bytes * 0.9
+        for sha, (size, _) in sorted(self._entries.items(), key=lambda item: item[1][1]):
+            if self._size <= target:
+                break
+            try:
+                os.remove(self._path(sha))
+            except FileNotFoundError:
+                pass
+            del self._entries[sha]
+            self._size -= size
+
+
+    def shas(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+
+    def __repr__(self) -> str:
+        return f"BlobCache(root={self.root}, blobs={len(self._entries)}, size={self._size})"
@@ -0,0 +1,241 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from collections import deque
+from contextvars import copy_context
+from typing import (
+    Any, 
+    Deque, 
+    Dict, 
+    Iterable, 
+    Iterator, 
+    Optional, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+import queue
+import threading
+
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+from pyGithub.ext.exceptions import SecondaryRateLimited
+from pyGithub.ext.ratelimit import AdaptiveThrottle
+
+if TYPE_CHECKING:
+    from pyGithub.client import Client
+
+
+class WriteOp:
+    """
+    A single create operation for :class:`BulkWriter`.
+
+    ``kind`` is one of ``issue``, ``label``, ``milestone`` or ``release``;
+    ``fields`` are passed to the matching ``Client.create_*`` method,
+    including an optional ``idempotency_key`` for the write journal.
+    """
+    METHODS: Dict[str, str] = {
+        "issue": "create_issue",
+        "label": "create_label",
+        "milestone": "create_milestone",
+        "release": "create_release",
+    }
+
+    def __init__(self, kind: str, owner: str, repo_name: str, **fields: Any) -> None:
+        if kind not in self.METHODS:
+            raise ValueError(f"Unknown write operation '{kind}'.")
+        self.kind = kind
+        self.owner = owner
+        self.repo_name = repo_name
+        self.fields = fields
+
+
+    @property
+    def repo(self) -> Tuple[str, str]:
+        return self.owner, self.repo_name
+
+
+    def __repr__(self) -> str:
+        return f"WriteOp(kind={self.kind}, repo={self.owner}/{self.repo_name})"
+
+
+class WriteResult:
+    """
+    The outcome of one :class:`WriteOp`: the created object, or the error.
+    ``index`` is the operation's position in the input stream.
+    """
+    def __init__(
+        self, 
+        index: int, 
+        op: WriteOp, 
+        value: Any = None, 
+        error: Optional[Exception] = None
+    ) -> None:
+        self.index = index
+        self.op = op
+        self.value = value
+        self.error = error
+
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+    def __repr__(self) -> str:
+        return f"WriteResult(index={self.index}, ok={self.ok})"
+
+
+class BulkWriter:
+    """
+    Runs a stream of create operations at the highest rate GitHub's
+    secondary limits sustain.
+
+    Operations for different repositories run in parallel on up to
+    ``workers`` threads; operations for the same repository run one at a
+    time in input order. All calls share one :class:`AdaptiveThrottle`, and
+    requests rejected by a secondary limit are retried up to ``retries``
+    times after backing off. At most ``max_pending`` operations are read
+    ahead of completion, so the input may be an unbounded generator.
+    """
+    def __init__(
+        self, 
+        client: Client, 
+        throttle: Optional[AdaptiveThrottle] = None, 
+        workers: int = 4, 
+        retries: int = 5, 
+        max_pending: int = 1000
+    ) -> None:
+        self.client = client
+        self.throttle = throttle if throttle is not None else AdaptiveThrottle()
+        self.workers = workers
+        self.retries = retries
+        self.max_pending = max_pending
+
+
+    def run(self, operations: Iterable[WriteOp]) -> Iterator[WriteResult]:
+        """
+        Yields a :class:`WriteResult` per operation, in completion order.
+        Closing the iterator early stops reading operations and sending 
+        writes; only writes already in flight complete.
+        """
+        results: queue.Queue = queue.Queue()
+        lanes: Dict[Tuple[str, str], Deque[Tuple[int, WriteOp]]] = {}
+        lock = threading.Lock()
+        slots = threading.BoundedSemaphore(self.max_pending)
+        stop = threading.Event()
+        executor = ContextThreadPoolExecutor(max_workers=self.workers)
+        total: list = [None]
+        failure: list = []
+
+        def drain(repo: Tuple[str, str]) -> None:
+            while True:
+                with lock:
+                    lane = lanes[repo]
+                    if not lane or stop.is_set():
+                        del lanes[repo]
+                        return
+                    index, op = lane.popleft()
+                result = self.execute(index, op, stop)
+                if result is not None:
+                    results.put(result)
+                slots.release()
+
+        def feed() -> None:
+            count = 0
+            try:
+                for count, op in enumerate(operations, 1):
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+                    with lock:
+                        lane = lanes.get(op.repo)
+                        start = lane is None
+                        if start:
+                            lane = lanes[op.repo] = deque()
+                        lane.append((count - 1, op))
+                    if start:
+                        executor.submit(drain, op.repo)
+            except Exception as error:
+                failure.append(error)
+            finally:
+                total[0] = count
+                results.put(None)
+
+        feeder = threading.Thread(target=copy_context().run, args=(feed,), daemon=True)
+        feeder.start()
+        produced = 0
+        try:
+            while total[0] is None or produced < total[0]:
+                result = results.get()
+                if result is not None:
+                    produced += 1
+                    yield result
+        finally:
+            stop.set()
+            try:
+                # Wakes the feeder if it is blocked waiting for a slot.
+                slots.release()
+            except ValueError:
+                pass
+            executor.shutdown(wait=False)
+        if failure:
+            raise failure[0]
+
+
+    def execute(
+        self, 
+        index: int, 
+        op: WriteOp, 
+        stop: Optional[threading.Event] = None
+    ) -> Optional[WriteResult]:
+        """
+        Performs ``op``, backing off on secondary limits. Returns None 
+        without writing when ``stop`` is set while waiting for the throttle.
+        """
+        method = getattr(self.client, WriteOp.METHODS[op.kind])
+        fields = dict(op.fields)
+        journal = self.client.journal
+        if journal is not None and fields.get("idempotency_key") is None:
+            # One key for every attempt, so a retry updates the journal 
+            # record of the attempt it repeats instead of starting another
+            # operation that a resumed run would execute again.
+            fields["idempotency_key"] = journal.key(op.kind, op.owner, op.repo_name, op.fields)
+        attempt = 0
+        while True:
+            self.throttle.acquire()
+            if stop is not None and stop.is_set():
+                return None
+            try:
+                value = method(owner=op.owner, repo_name=op.repo_name, **fields)
+            except SecondaryRateLimited as error:
+                self.throttle.backoff(error.retry_after)
+                attempt += 1
+                if attempt > self.retries:
+                    return WriteResult(index, op, error=error)
+            except Exception as error:
+                return WriteResult(index, op, error=error)
+            else:
+                self.throttle.success()
+                return WriteResult(index, op, value=value)
@@ -0,0 +1,276 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from urllib.parse import urlsplit
+
+import copy
+import re
+import threading
+import time
+
+
+class CachedResponse:
+    """
+    A cached GET response, revalidated with ``If-None-Match`` /
+    ``If-Modified-Since``. GitHub does not count ``304 Not Modified``
+    replies against the rate limit.
+
+    ``stored`` is the Unix time the response was fetched or last 
+    revalidated, which :class:`RevalidationPolicy` ages it from.
+    """
+    def __init__(
+        self, 
+        data: Any, 
+        links: Dict[str, Dict[str, str]], 
+        etag: Optional[str] = None, 
+        last_modified: Optional[str] = None, 
+        stored: Optional[float] = None
+    ) -> None:
+        self.data = data
+        self.links = links
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored = stored if stored is not None else time.time()
+
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored
+
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+    def __repr__(self) -> str:
+        return f"CachedResponse(etag={self.etag})"
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU store of :class:`CachedResponse` objects.
+
+    Safe to share between threads: keys are spread over ``shards``
+    independently locked LRU segments, so concurrent lookups of different
+    keys rarely contend. Each segment holds ``maxsize / shards`` entries,
+    which makes eviction approximately, rather than globally, LRU.
+    """
+    def __init__(self, maxsize: int = 1024, shards: int = 16) -> None:
+        self.maxsize = maxsize
+        self.shards = max(1, min(shards, maxsize))
+        self._shard_size = -(-maxsize // self.shards)
+        self._segments: List[OrderedDict[Hashable, CachedResponse]] = [
+            OrderedDict() for _ in range(self.shards)
+        ]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(self.shards)]
+
+
+    def _shard(self, key: Hashable) -> int:
+        return hash(key) % self.shards
+
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        index = self._shard(key)
+        entries = self._segments[index]
+        with self._locks[index]:
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+        return entry
+
+
+    def set(self, key: Hashable, entry: CachedResponse) -> None:
+        index = self._shard(key)
+        entries = self._segments[index]
+        with self._locks[index]:
+            entries[key] = entry
+            entries.move_to_end(key)
+            while len(entries) > self._shard_size:
+                entries.popitem(last=False)
+
+
+    def delete(self, key: Hashable) -> None:
+        index = self._shard(key)
+        with self._locks[index]:
+            self._segments[index].pop(key, None)
+
+
+    def clear(self) -> None:
+        for entries, lock in zip(self._segments, self._locks):
+            with lock:
+                entries.clear()
+
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._segments)
+
+
+class RevalidationPolicy:
+    """
+    Per-route stale-while-revalidate freshness for :class:`ResponseCache`.
+
+    Each rule maps a path pattern such as ``/repos/{owner}/{repo}`` to a
+    soft and a hard TTL in seconds. A cached response younger than its 
+    soft TTL is served without a request; one between the two TTLs is 
+    served as is while one of ``workers`` background threads revalidates
+    it; an older one is revalidated before being served. Routes matching
+    no rule fall back to ``default``, or to plain revalidation on every
+    request when it is ``None``.
+    """
+    def __init__(
+        self, 
+        rules: Optional[Dict[str, Tuple[float, float]]] = None, 
+        default: Optional[Tuple[float, float]] = None, 
+        workers: int = 4
+    ) -> None:
+        self.default = default
+        self.workers = workers
+        self._rules: List[Tuple[re.Pattern, Tuple[float, float]]] = []
+        for pattern, (soft_ttl, hard_ttl) in (rules or {}).items():
+            self.add(pattern, soft_ttl, hard_ttl)
+
+
+    def add(self, pattern: str, soft_ttl: float, hard_ttl: float) -> None:
+        """
+        Adds a rule. ``{name}`` in ``pattern`` matches one path segment;
+        earlier rules take precedence.
+        """
+        if hard_ttl < soft_ttl:
+            raise ValueError("hard_ttl must not be shorter than soft_ttl.")
+        regex = re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(pattern.rstrip("/")))
+        self._rules.append((re.compile(f"{regex}/?"), (soft_ttl, hard_ttl)))
+
+
+    def ttls(self, url: str) -> Optional[Tuple[float, float]]:
+        path = urlsplit(url).path
+        for regex, ttls in self._rules:
+            if regex.fullmatch(path):
+                return ttls
+        return self.default
+
+
+    def __repr__(self) -> str:
+        return f"RevalidationPolicy(rules={len(self._rules)}, default={self.default})"
+
+
+class NegativeCache:
+    """
+    Remembers lookups that failed with one of ``statuses`` for ``ttl``
+    seconds, so repeating them raises the same error without a request,
+    and remembers ``301 Moved Permanently`` targets (renamed users and
+    repositories) for ``redirect_ttl`` seconds, so later requests go to
+    the new location directly.
+
+    Entries expire rather than being invalidated: a resource created
+    while its 404 is cached stays missing until the entry's TTL is over.
+    Safe to share between threads.
+    """
+    def __init__(
+        self, 
+        ttl: float = 300.0, 
+        statuses: Iterable[int] = (404,), 
+        redirect_ttl: float = 3600.0, 
+        maxsize: int = 4096
+    ) -> None:
+        self.ttl = ttl
+        self.statuses = frozenset(statuses)
+        self.redirect_ttl = redirect_ttl
+        self.maxsize = maxsize
+        self._errors: OrderedDict[Hashable, Tuple[float, Exception]] = OrderedDict()
+        self._redirects: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def _lookup(self, entries: OrderedDict, key: Hashable) -> Any:
+        with self._lock:
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return entry[1]
+
+
+    def _store(self, entries: OrderedDict, key: Hashable, ttl: float, value: Any) -> None:
+        with self._lock:
+            entries[key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(key)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+
+
+    def get(self, key: Hashable) -> Optional[Exception]:
+        """
+        Returns a fresh copy of the error cached for ``key``, if any.
+        """
+        error = self._lookup(self._errors, key)
+        return copy.copy(error).with_traceback(None) if error is not None else None
+
+
+    def set(self, key: Hashable, status: int, error: Exception) -> None:
+        if status in self.statuses:
+            self._store(self._errors, key, self.ttl, error)
+
+
+    def target(self, url: str) -> Optional[str]:
+        return self._lookup(self._redirects, url)
+
+
+    def moved(self, url: str, target: str) -> None:
+        self._store(self._redirects, url, self.redirect_ttl, target)
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._errors.clear()
+            self._redirects.clear()
+
+
+    def __len__(self) -> int:
+        return len(self._errors)
+
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "ttl": self.ttl, 
+            "statuses": tuple(self.statuses), 
+            "redirect_ttl": self.redirect_ttl, 
+            "maxsize": self.maxsize
+        }
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
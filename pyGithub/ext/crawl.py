@@ -0,0 +1,201 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import (
+    Any, 
+    Dict, 
+    Iterator, 
+    List, 
+    Optional, 
+    Sequence, 
+    Set, 
+    TYPE_CHECKING
+)
+
+import json
+import os
+import threading
+
+from pyGithub.ext.scheduler import Task, TaskResult, TaskScheduler
+
+if TYPE_CHECKING:
+    from pyGithub.client import Client
+
+
+class CrawlResult:
+    """
+    One collected resource of one repository.
+    """
+    def __init__(
+        self, 
+        repo: str, 
+        resource: str, 
+        data: Any = None, 
+        error: Optional[Exception] = None
+    ) -> None:
+        self.repo = repo
+        self.resource = resource
+        self.data = data
+        self.error = error
+
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+    def __repr__(self) -> str:
+        return f"CrawlResult(repo={self.repo}, resource={self.resource}, ok={self.ok})"
+
+
+class CrawlCheckpoint:
+    """
+    Append-only record of the ``repo:resource`` pairs already delivered,
+    so an interrupted crawl resumes where it stopped.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._completed: Set[str] = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        self._completed.add(json.loads(line))
+                    except ValueError:
+                        continue
+        self._file = open(path, "a", encoding="utf-8")
+
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._completed
+
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            self._completed.add(key)
+            self._file.write(json.dumps(key) + "\n")
+            self._file.flush()
+
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class Crawler:
+    """
+    Collects a declared set of resources for every repository of an
+    organisation or user.
+
+    The repository listing and each ``(repo, resource)`` fetch are tasks
+    in one :class:`TaskScheduler`: resource tasks depend on the listing,
+    run in the order given by ``priorities`` (lower first, defaulting to 
+    the order of ``resources``), and share the client's rate-limit 
+    accounting, so throughput is bounded by the quota rather than by 
+    latency. With a ``checkpoint`` path, a result is recorded once the
+    consumer asks for the next one, and recorded pairs are skipped on the
+    next run (delivery is at-least-once).
+
+    A resource ``name`` is fetched with ``Http.fetch_<name>``, e.g.
+    ``branches``, ``releases``, ``contributors``, ``labels``, ``milestones``.
+    """
+    def __init__(
+        self, 
+        client: Client, 
+        resources: Sequence[str] = ("branches", "releases", "contributors", "labels", "milestones"), 
+        workers: int = 16, 
+        priorities: Optional[Dict[str, int]] = None, 
+        checkpoint: Optional[str] = None
+    ) -> None:
+        for resource in resources:
+            if not hasattr(client.http, f"fetch_{resource}"):
+                raise ValueError(f"Unknown crawl resource '{resource}'.")
+        self.client = client
+        self.resources = list(resources)
+        self.workers = workers
+        self.priorities = priorities or {resource: index for index, resource in enumerate(self.resources)}
+        self.checkpoint = CrawlCheckpoint(checkpoint) if checkpoint else None
+
+
+    def _fetch(self, full_name: str, resource: str) -> List[Dict[str, Any]]:
+        owner, repo_name = full_name.split("/", 1)
+        fetch = getattr(self.client.http, f"fetch_{resource}")
+        return fetch(owner=owner, repo_name=repo_name, token=self.client.token)
+
+
+    def _list_org(self, org: str) -> List[str]:
+        return [repo["full_name"] for repo in self.client.http.fetch_org_repos(org=org, token=self.client.token)]
+
+
+    def _list_user(self, username: str) -> List[str]:
+        return [
+            repo["full_name"] 
+            for repo in self.client.http.fetch_repositories_for_user(username=username, token=self.client.token)
+        ]
+
+
+    def crawl_org(self, org: str) -> Iterator[CrawlResult]:
+        return self._crawl(Task(("repos", org), self._list_org, (org,), priority=-1))
+
+
+    def crawl_user(self, username: str) -> Iterator[CrawlResult]:
+        return self._crawl(Task(("repos", username), self._list_user, (username,), priority=-1))
+
+
+    def crawl_repos(self, repos: Sequence[str]) -> Iterator[CrawlResult]:
+        return self._crawl(Task(("repos", None), list, (repos,), priority=-1))
+
+
+    def _crawl(self, listing: Task) -> Iterator[CrawlResult]:
+        scheduler = TaskScheduler(workers=self.workers)
+        scheduler.add(listing)
+        try:
+            for result in scheduler.run():
+                if result.task is listing:
+                    if not result.ok:
+                        raise result.error
+                    self._schedule(scheduler, listing, result)
+                    continue
+                full_name, resource = result.task.key
+                yield CrawlResult(full_name, resource, result.value, result.error)
+                if result.ok and self.checkpoint is not None:
+                    self.checkpoint.add(f"{full_name}:{resource}")
+        finally:
+            if self.checkpoint is not None:
+                self.checkpoint.close()
+
+
+    def _schedule(self, scheduler: TaskScheduler, listing: Task, result: TaskResult) -> None:
+        for full_name in result.value:
+            for resource in self.resources:
+                if self.checkpoint is not None and f"{full_name}:{resource}" in self.checkpoint:
+                    continue
+                scheduler.add(Task(
+                    (full_name, resource), 
+                    self._fetch, 
+                    (full_name, resource), 
+                    priority=self.priorities.get(resource, len(self.resources)), 
+                    after=(listing.key,)
+                ))
@@ -0,0 +1,101 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Iterator, Optional
+
+import time
+
+from pyGithub.ext.exceptions import DeadlineExceeded
+
+
+# Absolute time.monotonic() by which the current call chain must finish.
+_DEADLINE: ContextVar[Optional[float]] = ContextVar("pyGithub_deadline", default=None)
+
+
+@contextmanager
+def until(instant: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Bounds every API call made in the block by the ``time.monotonic()``
+    instant ``instant``. Nested deadlines can only shorten the outer one.
+    """
+    current = _DEADLINE.get()
+    if instant is None or (current is not None and current <= instant):
+        yield current
+        return
+    token = _DEADLINE.set(instant)
+    try:
+        yield instant
+    finally:
+        _DEADLINE.reset(token)
+
+
+def deadline(seconds: Optional[float]) -> Any:
+    """
+    Bounds every API call made in the block to ``seconds`` from now.
+    """
+    return until(time.monotonic() + seconds if seconds is not None else None)
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left before the current deadline, or ``None`` without one.
+    """
+    instant = _DEADLINE.get()
+    return instant - time.monotonic() if instant is not None else None
+
+
+def check() -> Optional[float]:
+    """
+    Like :func:`remaining`, but raises once the deadline has passed.
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded()
+    return left
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleeps for ``seconds``, or raises at once if that would overrun the
+    deadline, since waiting would only end in failure.
+    """
+    left = check()
+    if left is not None and seconds > left:
+        raise DeadlineExceeded(
+            f"Waiting {seconds:.1f}s would exceed the deadline ({left:.1f}s left)."
+        )
+    time.sleep(seconds)
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """
+    Thread pool that runs each task in a copy of the submitter's context,
+    so deadlines set by the caller also bound the work it fans out.
+    """
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        return super().submit(copy_context().run, fn, *args, **kwargs)
@@ -22,10 +22,93 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Mapping, Optional
+
+import time
+
+
 class GitHubError(Exception):
     """Base class for all GitHub errors.
+
+    Errors raised for an API response carry its metadata: ``status``, 
+    ``headers``, the decoded error ``body`` and the request's ``elapsed``
+    time in seconds. The remaining attributes are derived from them, and
+    :attr:`retry_in` tells a scheduler how long to wait before retrying.
     """
-    pass
+    def __init__(
+        self, 
+        message: Optional[str] = None, 
+        status: Optional[int] = None, 
+        headers: Optional[Mapping[str, str]] = None, 
+        body: Any = None, 
+        elapsed: Optional[float] = None, 
+        retry_after: Optional[float] = None
+    ) -> None:
+        super().__init__(*([message] if message is not None else []))
+        self.status = status
+        self.headers: Mapping[str, str] = headers if headers is not None else {}
+        self.body = body
+        self.elapsed = elapsed
+        self.retry_after = retry_after if retry_after is not None else self._retry_after()
+
+
+    def _retry_after(self) -> Optional[float]:
+        value = self.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+    @property
+    def request_id(self) -> Optional[str]:
+        return self.headers.get("X-GitHub-Request-Id")
+
+
+    @property
+    def reset(self) -> Optional[float]:
+        """
+        When the rate-limit window resets, as a Unix timestamp.
+        """
+        value = self.headers.get("X-RateLimit-Reset")
+        return float(value) if value else None
+
+
+    @property
+    def remaining(self) -> Optional[int]:
+        value = self.headers.get("X-RateLimit-Remaining")
+        return int(value) if value else None
+
+
+    @property
+    def documentation_url(self) -> Optional[str]:
+        return self.body.get("documentation_url") if isinstance(self.body, dict) else None
+
+
+    @property
+    def errors(self) -> List[Dict[str, Any]]:
+        return self.body.get("errors", []) if isinstance(self.body, dict) else []
+
+
+    @property
+    def retry_in(self) -> Optional[float]:
+        """
+        Seconds to wait before retrying: the server's ``Retry-After`` if
+        it sent one, otherwise the time left until the rate-limit reset
+        when the quota is exhausted, otherwise ``None``.
+        """
+        if self.retry_after is not None:
+            return self.retry_after
+        if self.remaining == 0 and self.reset is not None:
+            return max(0.0, self.reset - time.time())
+        return None
 
 
 class NotFound(GitHubError):
@@ -34,9 +117,10 @@ class NotFound(GitHubError):
     """
     def __init__(
         self, 
-        message: str = "Resource not found."
+        message: str = "Resource not found.", 
+        **metadata: Any
     ) -> None:
-        super().__init__(message)
+        super().__init__(message, **metadata)
 
 
 class Unauthorized(GitHubError):
@@ -45,9 +129,10 @@ class Unauthorized(GitHubError):
     """
     def __init__(
         self, 
-        message: str = "Unauthorized access."
+        message: str = "Unauthorized access.", 
+        **metadata: Any
     ) -> None:
-        super().__init__(message)
+        super().__init__(message, **metadata)
 
 
 class Forbidden(GitHubError):
@@ -56,9 +141,10 @@ class Forbidden(GitHubError):
     """
     def __init__(
         self, 
-        message: str = "Forbidden access."
+        message: str = "Forbidden access.", 
+        **metadata: Any
     ) -> None:
-        super().__init__(message)
+        super().__init__(message, **metadata)
 
 
 class BadRequest(GitHubError):
@@ -67,6 +153,127 @@ class BadRequest(GitHubError):
     """
     def __init__(
         self, 
-        message: str = "Bad request."
+        message: str = "Bad request.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class Unprocessable(GitHubError):
+    """
+    Exception raised for 422 errors, when the request was well-formed but
+    failed validation. :attr:`errors` lists the offending fields.
+    """
+    def __init__(
+        self, 
+        message: str = "Validation failed.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class Unavailable(GitHubError):
+    """
+    Exception raised for 451 errors, returned for repositories blocked for
+    legal reasons (e.g. a DMCA takedown).
+    """
+    def __init__(
+        self, 
+        message: str = "Unavailable for legal reasons.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class ServerError(GitHubError):
+    """
+    Exception raised for 5xx errors. These are usually transient and safe
+    to retry for idempotent requests.
+    """
+    def __init__(
+        self, 
+        message: str = "GitHub failed to process the request.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class Accepted(GitHubError):
+    """
+    Exception raised for a ``202 Accepted`` response without a body, sent
+    by endpoints (such as repository statistics) that are still computing
+    the result in the background.
+    """
+    def __init__(
+        self, 
+        message: str = "The result is still being computed.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class RateLimited(Forbidden):
+    """
+    Exception raised when the hourly quota of a rate-limit resource is
+    exhausted (403 or 429 with ``X-RateLimit-Remaining: 0``). 
+    :attr:`retry_in` is the time left until the quota resets.
+    """
+    def __init__(
+        self, 
+        message: str = "Rate limit exceeded.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class SecondaryRateLimited(RateLimited):
+    """
+    Exception raised when GitHub's secondary rate limits reject a request
+    (403 or 429 with ``Retry-After`` or a "secondary rate limit" message).
+    """
+    def __init__(
+        self, 
+        message: str = "Secondary rate limit exceeded.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
+
+
+class UncertainWrite(GitHubError):
+    """
+    Exception raised when a journaled write was started by an earlier run
+    but its outcome was never recorded, so repeating it may duplicate it.
+    """
+    def __init__(
+        self, 
+        message: str = "Outcome of a previous attempt is unknown.", 
+        key: Optional[str] = None
+    ) -> None:
+        super().__init__(message)
+        self.key = key
+
+
+class ChecksumMismatch(GitHubError):
+    """
+    Exception raised when downloaded content does not match the size or
+    digest published for it.
+    """
+    def __init__(
+        self, 
+        message: str = "Downloaded content does not match its checksum."
     ) -> None:
         super().__init__(message)
+
+
+class DeadlineExceeded(GitHubError):
+    """
+    Exception raised when a call runs out of the time budget set with
+    :meth:`Client.deadline` or a ``deadline=`` argument, including while
+    paginating, retrying or waiting for a rate limit to reset.
+    """
+    def __init__(
+        self, 
+        message: str = "Deadline exceeded.", 
+        **metadata: Any
+    ) -> None:
+        super().__init__(message, **metadata)
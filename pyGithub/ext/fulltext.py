@@ -0,0 +1,604 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+from typing import (
+    Any, 
+    BinaryIO, 
+    Dict, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Mapping, 
+    Optional, 
+    Sequence, 
+    Set, 
+    Tuple, 
+    Union
+)
+
+import heapq
+import math
+import mmap
+import os
+import re
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+
+from pyGithub.issue import Issue
+from pyGithub.comment import IssueComment
+
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have if in into is it its no not of on or "
+    "so such that the their then there these they this to was were will with".split()
+)
+
+MAGIC = b"PGFTS001"
+# magic, documents, terms, total length, k1, b, impact scale, section offsets
+HEADER = struct.Struct("<8sIIQddd13Q")
+MAX_UINT16 = 0xFFFF
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """
+    Splits ``text`` into case-folded word tokens, dropping single 
+    characters and common English stopwords.
+    """
+    if not text:
+        return []
+    return [
+        token for token in _TOKEN.findall(text.casefold()) 
+        if len(token) > 1 and token not in STOPWORDS
+    ]
+
+
+def _idf(documents: int, frequency: int) -> float:
+    return math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+
+
+class SearchHit:
+    """
+    A ranked :class:`FullTextIndex` result.
+    """
+    def __init__(self, key: int, score: float, ref: str) -> None:
+        self.key = key
+        self.score = score
+        self.ref = ref
+
+
+    def __repr__(self) -> str:
+        return f"SearchHit(key={self.key}, score={self.score:.3f}, ref={self.ref})"
+
+
+class _Segment:
+    """
+    Read-only, memory-mapped view of a saved index. Documents are 
+    numbered by ascending key; terms are sorted by their UTF-8 bytes, and
+    each term's postings are sorted by document number.
+    """
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._views: List[Union[memoryview, array]] = []
+        (
+            magic, self.doc_count, self.term_count, self.total_length, self.k1, self.b, self.scale, 
+            keys, lengths, ref_offsets, self._refs_at, comment_offsets, self._comments_at, 
+            term_offsets, self._terms_at, post_offsets, max_impacts, docs, tfs, impacts
+        ) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a full-text index.")
+        self.keys = self._array("q", keys, self.doc_count)
+        self.lengths = self._array("I", lengths, self.doc_count)
+        self._ref_offsets = self._array("Q", ref_offsets, self.doc_count + 1)
+        self._comment_offsets = self._array("Q", comment_offsets, self.doc_count + 1)
+        self._term_offsets = self._array("Q", term_offsets, self.term_count + 1)
+        self._post_offsets = self._array("Q", post_offsets, self.term_count + 1)
+        self.max_impacts = self._array("H", max_impacts, self.term_count)
+        total = self._post_offsets[self.term_count]
+        self.docs = self._array("I", docs, total)
+        self.tfs = self._array("H", tfs, total)
+        self.impacts = self._array("H", impacts, total)
+
+
+    def _array(self, typecode: str, offset: int, count: int) -> Union[memoryview, array]:
+        size = array(typecode).itemsize * count
+        if sys.byteorder == "little":
+            view: Union[memoryview, array] = memoryview(self._map)[offset:offset + size].cast(typecode)
+        else:
+            view = array(typecode, self._map[offset:offset + size])
+            view.byteswap()
+        self._views.append(view)
+        return view
+
+
+    def term(self, index: int) -> bytes:
+        start = self._terms_at + self._term_offsets[index]
+        return self._map[start:self._terms_at + self._term_offsets[index + 1]]
+
+
+    def find(self, word: str) -> int:
+        """
+        Returns the index of ``word`` by binary search, or -1.
+        """
+        target = word.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.term(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self.term_count and self.term(low) == target else -1
+
+
+    def frequency(self, index: int) -> int:
+        return self._post_offsets[index + 1] - self._post_offsets[index]
+
+
+    def postings(self, index: int) -> Tuple[Sequence[int], Sequence[int], Sequence[int]]:
+        start, end = self._post_offsets[index], self._post_offsets[index + 1]
+        return self.docs[start:end], self.tfs[start:end], self.impacts[start:end]
+
+
+    def ordinal(self, key: int) -> int:
+        position = bisect_left(self.keys, key)
+        return position if position < self.doc_count and self.keys[position] == key else -1
+
+
+    def ref(self, ordinal: int) -> str:
+        start = self._refs_at + self._ref_offsets[ordinal]
+        return self._map[start:self._refs_at + self._ref_offsets[ordinal + 1]].decode("utf-8")
+
+
+    def comments(self, ordinal: int) -> str:
+        """
+        Returns the document's comment terms as ``term:count`` pairs 
+        separated by spaces.
+        """
+        start = self._comments_at + self._comment_offsets[ordinal]
+        return self._map[start:self._comments_at + self._comment_offsets[ordinal + 1]].decode("utf-8")
+
+
+    def close(self) -> None:
+        for view in self._views:
+            if isinstance(view, memoryview):
+                view.release()
+        self._views.clear()
+        self._map.close()
+        self._file.close()
+
+
+class FullTextIndex:
+    """
+    Offline BM25 search over issue titles, bodies and comments.
+
+    Documents are identified by an integer ``key`` (the issue ``id`` for
+    :meth:`add_issue`) and carry a ``ref`` string, such as the issue's 
+    URL, returned with each hit. Titles count ``title_weight`` times.
+    Comment terms are also kept per document, so re-adding an issue 
+    without its comments keeps the ones indexed before.
+
+    :meth:`save` writes a compact, term-sorted file whose postings hold
+    4-byte document numbers, 2-byte term frequencies and 2-byte 
+    precomputed BM25 impacts. Opening it memory-maps the file, so loading
+    is instant and queries only touch the pages of the terms they use.
+    Ranking is exact top-``limit``: terms are scored rarest first, and 
+    once the remaining terms cannot lift a new document into the results
+    they only rescore existing candidates by binary search.
+
+    Documents added or removed after loading live in an in-memory 
+    overlay and are searchable at once; saved impacts keep the collection
+    statistics of the last save until the next :meth:`save` merges the 
+    overlay into a new file.
+    """
+    def __init__(
+        self, 
+        path: Optional[str] = None, 
+        k1: float = 1.2, 
+        b: float = 0.75, 
+        title_weight: int = 2
+    ) -> None:
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self.title_weight = title_weight
+        self._segment: Optional[_Segment] = None
+        if path is not None and os.path.exists(path):
+            self._segment = _Segment(path)
+            self.k1, self.b = self._segment.k1, self._segment.b
+        self._dead: Set[int] = set()
+        self._dead_length = 0
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._terms: Dict[int, Counter] = {}
+        self._comments: Dict[int, Counter] = {}
+        self._lengths: Dict[int, int] = {}
+        self._refs: Dict[int, str] = {}
+        self._length = 0
+        self._lock = threading.RLock()
+
+
+    def add(self, key: int, text: str, ref: str = "") -> None:
+        """
+        Indexes ``text`` under ``key``, replacing any earlier version.
+        """
+        self._add(key, Counter(tokenize(text)), Counter(), ref)
+
+
+    def _add(self, key: int, counts: Counter, comments: Counter, ref: str) -> None:
+        with self._lock:
+            self.remove(key)
+            counts = counts + comments
+            for term, count in counts.items():
+                self._postings.setdefault(term, {})[key] = count
+            self._terms[key] = counts
+            self._comments[key] = comments
+            self._lengths[key] = sum(counts.values())
+            self._length += self._lengths[key]
+            self._refs[key] = ref
+
+
+    def add_issue(
+        self, 
+        issue: Issue, 
+        comments: Optional[Iterable[Union[IssueComment, str]]] = None
+    ) -> None:
+        """
+        Indexes ``issue`` with its ``comments``; when they are not given,
+        the comments already indexed for the issue are kept.
+        """
+        counts = Counter(tokenize("\n".join([issue.title or ""] * self.title_weight + [issue.body or ""])))
+        with self._lock:
+            if comments is None:
+                comment_counts = self._comment_counts(issue.id)
+            else:
+                comment_counts = Counter(tokenize("\n".join(
+                    comment if isinstance(comment, str) else comment.body or "" for comment in comments
+                )))
+            self._add(issue.id, counts, comment_counts, issue.html_url or f"#{issue.number}")
+
+
+    def update(
+        self, 
+        issues: Iterable[Issue], 
+        comments: Optional[Mapping[int, Iterable[Union[IssueComment, str]]]] = None
+    ) -> None:
+        """
+        Re-indexes changed ``issues``. ``comments`` maps issue numbers to
+        their current comment threads; issues missing from it keep their
+        indexed comments.
+        """
+        comments = comments or {}
+        with self._lock:
+            for issue in issues:
+                self.add_issue(issue, comments.get(issue.number))
+
+
+    def _comment_counts(self, key: int) -> Counter:
+        counts = self._comments.get(key)
+        if counts is not None:
+            return counts
+        segment = self._segment
+        ordinal = segment.ordinal(key) if segment is not None else -1
+        if ordinal < 0 or ordinal in self._dead:
+            return Counter()
+        pairs = (pair.rsplit(":", 1) for pair in segment.comments(ordinal).split())
+        return Counter({term: int(count) for term, count in pairs})
+
+
+    def remove(self, key: int) -> bool:
+        with self._lock:
+            counts = self._terms.pop(key, None)
+            if counts is not None:
+                for term in counts:
+                    postings = self._postings[term]
+                    del postings[key]
+                    if not postings:
+                        del self._postings[term]
+                self._length -= self._lengths.pop(key)
+                del self._refs[key]
+                del self._comments[key]
+                return True
+            segment = self._segment
+            ordinal = segment.ordinal(key) if segment is not None else -1
+            if ordinal < 0 or ordinal in self._dead:
+                return False
+            self._dead.add(ordinal)
+            self._dead_length += segment.lengths[ordinal]
+            return True
+
+
+    def __len__(self) -> int:
+        saved = self._segment.doc_count - len(self._dead) if self._segment is not None else 0
+        return saved + len(self._terms)
+
+
+    def __contains__(self, key: int) -> bool:
+        if key in self._terms:
+            return True
+        ordinal = self._segment.ordinal(key) if self._segment is not None else -1
+        return ordinal >= 0 and ordinal not in self._dead
+
+
+    def search(self, query: str, limit: int = 10) -> List[SearchHit]:
+        """
+        Returns the ``limit`` best BM25 matches for ``query``.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            documents = len(self)
+            if not terms or not documents or limit <= 0:
+                return []
+            hits = self._search_segment(terms, limit)
+            hits.extend(self._search_overlay(terms, limit, documents))
+        return heapq.nlargest(limit, hits, key=lambda hit: hit.score)
+
+
+    def _search_segment(self, terms: List[str], limit: int) -> List[SearchHit]:
+        segment = self._segment
+        if segment is None:
+            return []
+        found = [index for index in map(segment.find, terms) if index >= 0]
+        found.sort(key=segment.frequency)
+        dead = self._dead
+        scores: Dict[int, int] = {}
+        rest = sum(segment.max_impacts[index] for index in found)
+        for position, index in enumerate(found):
+            if len(scores) >= limit:
+                threshold = heapq.nlargest(limit, scores.values())[-1]
+                if rest < threshold:
+                    # No unseen document can reach the results any more.
+                    self._rescore(found[position:], scores, threshold - rest)
+                    break
+            rest -= segment.max_impacts[index]
+            docs, _, impacts = segment.postings(index)
+            get = scores.get
+            if not scores:
+                scores = dict(zip(docs, impacts))
+                for doc in dead.intersection(scores):
+                    del scores[doc]
+            elif dead:
+                for doc, impact in zip(docs, impacts):
+                    if doc not in dead:
+                        scores[doc] = get(doc, 0) + impact
+            else:
+                for doc, impact in zip(docs, impacts):
+                    scores[doc] = get(doc, 0) + impact
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [
+            SearchHit(segment.keys[doc], score * segment.scale, segment.ref(doc)) 
+            for doc, score in best
+        ]
+
+
+    def _rescore(self, found: List[int], scores: Dict[int, int], floor: int) -> None:
+        segment = self._segment
+        candidates = [doc for doc, score in scores.items() if score >= floor]
+        for index in found:
+            docs, _, impacts = segment.postings(index)
+            size = len(docs)
+            for doc in candidates:
+                position = bisect_left(docs, doc)
+                if position < size and docs[position] == doc:
+                    scores[doc] += impacts[position]
+
+
+    def _search_overlay(self, terms: List[str], limit: int, documents: int) -> List[SearchHit]:
+        if not self._terms:
+            return []
+        segment = self._segment
+        total = self._length + (segment.total_length - self._dead_length if segment is not None else 0)
+        average = total / documents or 1.0
+        k1, b = self.k1, self.b
+        scores: Dict[int, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            frequency = len(postings)
+            if segment is not None:
+                index = segment.find(term)
+                frequency += segment.frequency(index) if index >= 0 else 0
+            idf = _idf(documents, frequency)
+            for key, tf in postings.items():
+                norm = k1 * (1 - b + b * self._lengths[key] / average)
+                scores[key] = scores.get(key, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [SearchHit(key, score, self._refs[key]) for key, score in best]
+
+
+    def _documents(self) -> Iterator[Tuple[int, int, str, int]]:
+        """
+        Yields ``(key, length, ref, saved ordinal or -1)`` for every live 
+        document in key order.
+        """
+        segment = self._segment
+        saved = (
+            (segment.keys[ordinal], segment.lengths[ordinal], ordinal)
+            for ordinal in range(segment.doc_count) if ordinal not in self._dead
+        ) if segment is not None else iter(())
+        added = ((key, self._lengths[key], -1) for key in sorted(self._terms))
+        for key, length, ordinal in heapq.merge(saved, added):
+            ref = segment.ref(ordinal) if ordinal >= 0 else self._refs[key]
+            yield key, length, ref, ordinal
+
+
+    def _term_postings(self, remap: array, numbers: Dict[int, int]) -> Iterator[Tuple[bytes, List[Tuple[int, int]]]]:
+        """
+        Yields every term with its merged ``(document, tf)`` postings, in
+        byte order and renumbered to the new segment.
+        """
+        segment = self._segment
+        saved = ((segment.term(index), index) for index in range(segment.term_count)) if segment is not None else iter(())
+        added = sorted((term.encode("utf-8"), -1) for term in self._postings)
+        current: Optional[bytes] = None
+        merged: List[Tuple[int, int]] = []
+        for term, index in heapq.merge(saved, added):
+            if term != current:
+                if merged:
+                    yield current, sorted(merged)
+                current, merged = term, []
+            if index >= 0:
+                docs, tfs, _ = segment.postings(index)
+                merged.extend((remap[doc], tf) for doc, tf in zip(docs, tfs) if remap[doc] >= 0)
+            else:
+                merged.extend((numbers[key], tf) for key, tf in self._postings[term.decode("utf-8")].items())
+        if merged:
+            yield current, sorted(merged)
+
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Merges the saved segment and the overlay into a new file at 
+        ``path`` (default: :attr:`path`), replaced atomically, and reopens
+        the index from it.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the index to.")
+        with self._lock:
+            segment = self._segment
+            remap = array("i", [-1]) * (segment.doc_count if segment is not None else 0)
+            numbers: Dict[int, int] = {}
+            keys, lengths = array("q"), array("I")
+            ref_offsets, refs = array("Q", [0]), bytearray()
+            comment_offsets = array("Q", [0])
+            directory = os.path.dirname(os.path.abspath(path))
+            term_offsets, post_offsets, max_impacts = array("Q", [0]), array("Q", [0]), array("H")
+            with tempfile.TemporaryFile(dir=directory) as comment_data, \
+                    tempfile.TemporaryFile(dir=directory) as term_data, \
+                    tempfile.TemporaryFile(dir=directory) as doc_data, \
+                    tempfile.TemporaryFile(dir=directory) as tf_data, \
+                    tempfile.TemporaryFile(dir=directory) as impact_data:
+                for number, (key, length, ref, ordinal) in enumerate(self._documents()):
+                    if ordinal >= 0:
+                        remap[ordinal] = number
+                        comments = segment.comments(ordinal).encode("utf-8")
+                    else:
+                        numbers[key] = number
+                        comments = " ".join(
+                            f"{term}:{count}" for term, count in sorted(self._comments[key].items())
+                        ).encode("utf-8")
+                    keys.append(key)
+                    lengths.append(length)
+                    refs += ref.encode("utf-8")
+                    ref_offsets.append(len(refs))
+                    comment_data.write(comments)
+                    comment_offsets.append(comment_offsets[-1] + len(comments))
+                documents = len(keys)
+                average = (sum(lengths) / documents) if documents else 1.0
+                k1, b = self.k1, self.b
+                scale = _idf(max(documents, 1), 1) * (k1 + 1) / MAX_UINT16
+
+                for term, postings in self._term_postings(remap, numbers):
+                    idf = _idf(documents, len(postings))
+                    docs, tfs, impacts = array("I"), array("H"), array("H")
+                    for doc, tf in postings:
+                        norm = k1 * (1 - b + b * lengths[doc] / average)
+                        score = idf * tf * (k1 + 1) / (tf + norm)
+                        docs.append(doc)
+                        tfs.append(min(tf, MAX_UINT16))
+                        impacts.append(max(1, min(MAX_UINT16, round(score / scale))))
+                    for values, handle in ((docs, doc_data), (tfs, tf_data), (impacts, impact_data)):
+                        self._write(handle, values)
+                    term_data.write(term)
+                    term_offsets.append(term_offsets[-1] + len(term))
+                    post_offsets.append(post_offsets[-1] + len(docs))
+                    max_impacts.append(max(impacts))
+
+                temporary = f"{path}.tmp"
+                with open(temporary, "wb") as handle:
+                    handle.write(bytes(HEADER.size))
+                    offsets = []
+                    for section in (
+                        keys, lengths, ref_offsets, bytes(refs), comment_offsets, comment_data, 
+                        term_offsets, term_data, post_offsets, max_impacts, doc_data, tf_data, impact_data
+                    ):
+                        handle.write(bytes(-handle.tell() % 8))
+                        offsets.append(handle.tell())
+                        if isinstance(section, array):
+                            self._write(handle, section)
+                        elif isinstance(section, bytes):
+                            handle.write(section)
+                        else:
+                            section.seek(0)
+                            shutil.copyfileobj(section, handle)
+                    handle.seek(0)
+                    handle.write(HEADER.pack(
+                        MAGIC, documents, len(max_impacts), sum(lengths), k1, b, scale, *offsets
+                    ))
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            os.replace(temporary, path)
+
+            if segment is not None:
+                segment.close()
+            self.path = path
+            self._segment = _Segment(path)
+            self._dead.clear()
+            self._dead_length = 0
+            self._postings.clear()
+            self._terms.clear()
+            self._comments.clear()
+            self._lengths.clear()
+            self._refs.clear()
+            self._length = 0
+
+
+    @staticmethod
+    def _write(handle: BinaryIO, values: array) -> None:
+        if sys.byteorder != "little":
+            values = array(values.typecode, values)
+            values.byteswap()
+        values.tofile(handle)
+
+
+    def close(self) -> None:
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+
+    def __enter__(self) -> FullTextIndex:
+        return self
+
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+    def __repr__(self) -> str:
+        return f"FullTextIndex(path={self.path}, documents={len(self)})"
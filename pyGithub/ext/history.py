@@ -0,0 +1,290 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any, 
+    Dict, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Sequence, 
+    Set, 
+    Tuple, 
+    TYPE_CHECKING
+)
+from urllib.parse import parse_qs, urlparse
+
+import heapq
+
+from pyGithub.commit import Commit
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+from pyGithub.ext.http import Route
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(commit: dict) -> float:
+    date = Commit(commit).date
+    if not date:
+        return 0.0
+    return datetime.fromisoformat(date.replace("Z", "+00:00")).timestamp()
+
+
+def _isoformat(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _last_page(links: Dict[str, Dict[str, str]]) -> int:
+    last = links.get("last", {}).get("url")
+    if last is None:
+        return 1
+    return int(parse_qs(urlparse(last).query).get("page", ["1"])[0])
+
+
+class _Window:
+    def __init__(self, low: datetime, high: datetime) -> None:
+        self.low = low
+        self.high = high
+        self.items: Optional[List[dict]] = None
+
+
+class CommitWalker:
+    """
+    Walks large commit histories concurrently.
+
+    :meth:`walk` splits ``[since, until]`` into time windows by bisection
+    until each window spans at most ``max_pages`` pages, then fetches the
+    windows on a thread pool. :meth:`walk_heads` follows the history of
+    several branch heads in parallel and stops each walk once every 
+    parent it still needs has been produced by another walk.
+
+    Commits are de-duplicated by SHA. ``order=None`` streams them as they
+    arrive; ``order="date"`` streams newest first (windows are disjoint,
+    so only out-of-order windows are buffered); ``order="topo"`` buffers
+    the whole walk and yields children before parents.
+    """
+    PER_PAGE = 100
+
+    def __init__(
+        self, 
+        http: Http, 
+        token: Optional[str] = None, 
+        workers: int = 8, 
+        max_pages: int = 4
+    ) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+        self.max_pages = max_pages
+
+
+    def walk(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        since: Optional[datetime] = None, 
+        until: Optional[datetime] = None, 
+        path: Optional[str] = None, 
+        author: Optional[str] = None, 
+        sha: Optional[str] = None, 
+        order: Optional[str] = None
+    ) -> Iterator[Commit]:
+        params = {
+            key: value 
+            for key, value in {"sha": sha, "path": path, "author": author}.items() 
+            if value is not None
+        }
+        window = _Window(
+            since or UNIX_EPOCH, 
+            until or datetime.now(timezone.utc).replace(microsecond=0)
+        )
+        commits = self._windows(f"/repos/{owner}/{repo_name}/commits", params, window, order == "date")
+        if order == "topo":
+            commits = self.topological(commits)
+        for commit in commits:
+            yield Commit(commit)
+
+
+    def walk_heads(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        heads: Optional[Sequence[str]] = None, 
+        path: Optional[str] = None, 
+        order: Optional[str] = None
+    ) -> Iterator[Commit]:
+        """
+        Walks back from ``heads`` (SHAs or branch names), by default the 
+        head of every branch.
+        """
+        if heads is None:
+            heads = [
+                branch["commit"]["sha"] 
+                for branch in self.http.fetch_branches(owner=owner, repo_name=repo_name, token=self.token)
+            ]
+        base = {"path": path} if path is not None else {}
+        commits = self._heads(f"/repos/{owner}/{repo_name}/commits", base, heads)
+        if order == "date":
+            commits = iter(sorted(commits, key=_timestamp, reverse=True))
+        elif order == "topo":
+            commits = self.topological(commits)
+        for commit in commits:
+            yield Commit(commit)
+
+
+    def _page(self, path: str, params: Dict[str, Any]) -> Tuple[List[dict], Dict[str, Dict[str, str]]]:
+        return self.http.send(
+            Route('GET', path, self.token, params={**params, "per_page": self.PER_PAGE})
+        )
+
+
+    def _probe(self, path: str, params: Dict[str, Any], window: _Window) -> Optional[datetime]:
+        """
+        Fetches ``window`` completely, or returns the split point if it
+        spans too many pages.
+        """
+        params = {**params, "since": _isoformat(window.low), "until": _isoformat(window.high)}
+        items, links = self._page(path, params)
+        pages = _last_page(links)
+        seconds = int((window.high - window.low).total_seconds())
+        if pages > self.max_pages and seconds > 1:
+            return window.low + timedelta(seconds=seconds // 2)
+        for page in range(2, pages + 1):
+            items.extend(self._page(path, {**params, "page": page})[0])
+        window.items = sorted(items, key=_timestamp, reverse=True)
+        return None
+
+
+    def _windows(self, path: str, params: Dict[str, Any], root: _Window, ordered: bool) -> Iterator[dict]:
+        seen: Set[str] = set()
+        frontier: List[_Window] = [root]
+        executor = ContextThreadPoolExecutor(max_workers=self.workers)
+        pending: Dict[Future, _Window] = {executor.submit(self._probe, path, params, root): root}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = pending.pop(future)
+                    middle = future.result()
+                    if middle is not None:
+                        newer = _Window(middle + timedelta(seconds=1), window.high)
+                        older = _Window(window.low, middle)
+                        position = frontier.index(window)
+                        frontier[position:position + 1] = [newer, older]
+                        for child in (newer, older):
+                            pending[executor.submit(self._probe, path, params, child)] = child
+                    elif not ordered:
+                        frontier.remove(window)
+                        yield from self._unseen(window.items, seen)
+                while ordered and frontier and frontier[0].items is not None:
+                    yield from self._unseen(frontier.pop(0).items, seen)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def _heads(self, path: str, params: Dict[str, Any], heads: Iterable[str]) -> Iterator[dict]:
+        """
+        Each walk keeps a frontier of the parents of the commits it 
+        produced that no walk has produced yet; a commit another walk 
+        produced is that walk's to follow. A walk ends when its frontier 
+        is empty, since pages can be all shared commits while older ones
+        only reachable from its head are still to come. With a ``path``
+        filter, parents that do not touch it never show up, so walks run
+        to the end of their listing.
+        """
+        seen: Set[str] = set()
+        executor = ContextThreadPoolExecutor(max_workers=self.workers)
+        # The frontier of a walk is None until its first page names the head commit.
+        pending: Dict[Future, Optional[Set[str]]] = {
+            executor.submit(self._page, path, {**params, "sha": head}): None 
+            for head in heads
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    frontier = pending.pop(future)
+                    items, links = future.result()
+                    if frontier is None:
+                        frontier = {items[0]["sha"]} if items else set()
+                    for item in items:
+                        frontier.discard(item["sha"])
+                        if item["sha"] in seen:
+                            continue
+                        seen.add(item["sha"])
+                        frontier.update(
+                            parent["sha"] for parent in item.get("parents", ()) if parent["sha"] not in seen
+                        )
+                        yield item
+                    frontier -= seen
+                    next_url = links.get("next", {}).get("url")
+                    if frontier and next_url:
+                        pending[executor.submit(self.http.send, Route('GET', next_url, self.token))] = frontier
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    @staticmethod
+    def _unseen(items: Iterable[dict], seen: Set[str]) -> Iterator[dict]:
+        for item in items:
+            if item["sha"] not in seen:
+                seen.add(item["sha"])
+                yield item
+
+
+    @staticmethod
+    def topological(commits: Iterable[dict]) -> Iterator[dict]:
+        """
+        Orders commits children-first, newest first among ready commits.
+        Parents outside the walked set are ignored.
+        """
+        by_sha = {commit["sha"]: commit for commit in commits}
+        children: Dict[str, int] = {sha: 0 for sha in by_sha}
+        for commit in by_sha.values():
+            for parent in Commit(commit).parents:
+                if parent["sha"] in children:
+                    children[parent["sha"]] += 1
+        ready = [(-_timestamp(by_sha[sha]), sha) for sha, count in children.items() if count == 0]
+        heapq.heapify(ready)
+        while ready:
+            _, sha = heapq.heappop(ready)
+            commit = by_sha[sha]
+            yield commit
+            for parent in Commit(commit).parents:
+                if parent["sha"] in children:
+                    children[parent["sha"]] -= 1
+                    if children[parent["sha"]] == 0:
+                        heapq.heappush(ready, (-_timestamp(by_sha[parent["sha"]]), parent["sha"]))
@@ -23,18 +23,35 @@ furnished to do so, subject to the following conditions:
 """
 
 from __future__ import annotations
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Any, Dict, Hashable, Iterator, Set, Tuple
 
 import requests
 import json
+import threading
+import time
+import weakref
 
 from pyGithub.user import User
 from pyGithub.repository import Repository
+from pyGithub.ext import deadline as deadlines
+from pyGithub.ext.cache import CachedResponse, NegativeCache, ResponseCache, RevalidationPolicy
+from pyGithub.ext.ratelimit import RateLimiter
+from pyGithub.ext.routes import ROUTES, Endpoint, Registry
+from pyGithub.ext.uritemplate import expand
 from pyGithub.ext.exceptions import (
+    GitHubError, 
     NotFound, 
     Unauthorized, 
     Forbidden, 
-    BadRequest
+    BadRequest,
+    Unprocessable,
+    Unavailable,
+    ServerError,
+    Accepted,
+    RateLimited,
+    SecondaryRateLimited,
+    DeadlineExceeded
 )
 
 
@@ -42,136 +59,515 @@ class Route:
     """
     Represents an API route with method and path.
 
+    ``path`` is either relative to :attr:`Http.base` or an absolute URL,
+    such as a ``next`` pagination link or an expanded ``*_url`` field.
+    ``resource`` names the rate-limit bucket the route draws from, and 
+    ``endpoint`` the declaration whose policies apply (resolved from the
+    URL when omitted).
     """
-    def __init__(self, method: str, path: str, token: Optional[str] = None) -> None:
+    def __init__(
+        self, 
+        method: str, 
+        path: str, 
+        token: Optional[str] = None, 
+        params: Optional[Dict[str, Any]] = None,
+        resource: str = "core", 
+        endpoint: Optional[Endpoint] = None
+    ) -> None:
         self.method = method
         self.path = path
         self.token = token
+        self.params = params
+        self.resource = resource
+        self.endpoint = endpoint
 
 
 class Http:
     """
     Requests manager for the GitHub API.
 
+    GET responses carrying an ``ETag`` or ``Last-Modified`` validator are 
+    kept in :attr:`cache` and revalidated with conditional requests. Quotas
+    reported by the API are tracked in :attr:`rate_limits`; a request for
+    an exhausted resource waits for its reset instead of failing. With a
+    :attr:`negative_cache`, GET failures such as 404 are replayed without a
+    request for a while, and renamed resources are requested at their new
+    location. With a :attr:`revalidation` policy, cached responses are
+    served stale-while-revalidate within per-route TTLs.
+
+    Every request has a ``(connect, read)`` :attr:`timeout`. Calls made
+    under :meth:`Client.deadline` (or with ``deadline=``) also share an
+    overall time budget: timeouts are cut to what is left, and a 
+    rate-limit wait that would overrun it raises :class:`DeadlineExceeded`
+    immediately.
+
+    One instance may be shared by any number of threads. The cache and the
+    rate-limit counters are internally locked, while connections are not
+    shared at all: every thread gets its own :class:`requests.Session`
+    (and so its own keep-alive pool) on first use, since sessions are not
+    safe for concurrent use.
+
+    Endpoints are declared in :attr:`routes` (see :mod:`pyGithub.ext.routes`),
+    which :meth:`call` dispatches on and which sets per-route caching,
+    TTLs and retries for every request, including hand-built routes. Each
+    instance starts from its own copy of the default table, so 
+    ``routes.configure`` on one client leaves the others alone.
     """
-    def __init__(self) -> None:
+    def __init__(
+        self, 
+        cache: Optional[ResponseCache] = None, 
+        rate_limits: Optional[RateLimiter] = None, 
+        negative_cache: Optional[NegativeCache] = None, 
+        revalidation: Optional[RevalidationPolicy] = None, 
+        timeout: Tuple[Optional[float], Optional[float]] = (10.0, 30.0)
+    ) -> None:
         self.base: str = "https://api.github.com"
+        self.timeout = timeout
+        self.cache: ResponseCache = cache if cache is not None else ResponseCache()
+        self.rate_limits: RateLimiter = rate_limits if rate_limits is not None else RateLimiter()
+        self.negative_cache: Optional[NegativeCache] = negative_cache
+        self.revalidation: Optional[RevalidationPolicy] = revalidation
+        self.routes: Registry = ROUTES.copy()
+        self._refresher: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[Hashable] = set()
+        self._refresh_lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._sessions_lock = threading.Lock()
+
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The calling thread's session, created on first use.
+        """
+        session: Optional[requests.Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+            with self._sessions_lock:
+                self._sessions.add(session)
+        return session
+
+
+    def close(self) -> None:
+        """
+        Stops background revalidation and closes the pooled connections of
+        every thread's session.
+        """
+        if self._refresher is not None:
+            self._refresher.shutdown(wait=False)
+        with self._sessions_lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            session.close()
+
+
+    def url(self, route: Route) -> str:
+        if route.path.startswith(("http://", "https://")):
+            return route.path
+        return f"{self.base}{route.path}"
+
+
+    def endpoint(self, route: Route) -> Optional[Endpoint]:
+        if route.endpoint is not None:
+            return route.endpoint
+        return self.routes.resolve(route.method, self.url(route), self.base)
+
+
+    def call(
+        self, 
+        name: str, 
+        token: Optional[str] = None, 
+        params: Optional[Dict[str, Any]] = None, 
+        body: Any = None, 
+        **variables: Any
+    ) -> Any:
+        """
+        Performs endpoint ``name`` of :attr:`routes` with its path 
+        variables. Paginated endpoints return a lazy iterator over all 
+        items, streamed ones the raw response, others the decoded body.
+        """
+        endpoint = self.routes[name]
+        route = Route(
+            endpoint.method, 
+            endpoint.expand(**variables), 
+            token, 
+            params, 
+            endpoint.resource, 
+            endpoint
+        )
+        if endpoint.stream:
+            return self.open(route, headers=endpoint.headers)
+        if endpoint.paginated:
+            return self.paginate(route, key=endpoint.key, per_page=endpoint.per_page, headers=endpoint.headers)
+        if body is not None:
+            return self.request(route, headers=endpoint.headers, json=body)
+        return self.request(route, headers=endpoint.headers)
 
 
     def request(self, route: Route, **kwargs: Any) -> json:
-        response = requests.request(
-            method = route.method,
-            url=f"{self.base}{route.path}",
-            headers={
-                "Accept": "application/vnd.github.v3+json",
-                "Authorization": f"token {route.token}" if route.token else None
-            },
-            **kwargs
-        )
-        return self.handle(response)
+        return self.send(route, **kwargs)[0]
+
+
+    def send(
+        self, 
+        route: Route, 
+        revalidate: bool = False, 
+        deadline: Optional[float] = None, 
+        **kwargs: Any
+    ) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """
+        Performs ``route`` and returns the decoded body together with the
+        parsed ``Link`` header. ``revalidate`` bypasses :attr:`revalidation`
+        and always checks a cached response with the server; ``deadline``
+        bounds the call, rate-limit waits included, to that many seconds.
+        Idempotent endpoints are retried with backoff on 5xx errors and 
+        dropped connections, as many times as their ``retries``.
+        """
+        endpoint = self.endpoint(route)
+        retries = endpoint.retries if endpoint is not None and endpoint.idempotent else 0
+        with deadlines.deadline(deadline):
+            for attempt in range(retries + 1):
+                try:
+                    return self._send(route, endpoint, revalidate, **kwargs)
+                except (ServerError, requests.ConnectionError):
+                    if attempt == retries:
+                        raise
+                deadlines.sleep(0.5 * 2 ** attempt)
+
+
+    def _send(
+        self, 
+        route: Route, 
+        endpoint: Optional[Endpoint], 
+        revalidate: bool = False, 
+        **kwargs: Any
+    ) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        url = self.url(route)
+        extra_headers = kwargs.pop("headers", None)
+        headers = {
+            "Accept": "application/vnd.github.v3+json",
+            "Authorization": f"token {route.token}" if route.token else None
+        }
+        headers.update(extra_headers or {})
+
+        key = None
+        entry: Optional[CachedResponse] = None
+        ttls: Optional[Tuple[float, float]] = None
+        target = url
+        if route.method == "GET" and (endpoint is None or endpoint.cacheable):
+            key = (route.token, url, tuple(sorted((route.params or {}).items())))
+            if self.negative_cache is not None:
+                error = self.negative_cache.get(key)
+                if error is not None:
+                    raise error
+                target = self._moved(url)
+            if self.revalidation is not None:
+                ttls = self.revalidation.ttls(url)
+            if ttls is None and endpoint is not None:
+                ttls = endpoint.ttls
+            entry = self.cache.get(key)
+            if entry is not None:
+                if ttls is not None and not revalidate and entry.age < ttls[1]:
+                    if entry.age >= ttls[0]:
+                        self._refresh(key, route, dict(kwargs, headers=extra_headers))
+                    return entry.data, entry.links
+                headers.update(entry.validators)
+
+        response = self._perform(route, target, headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            if ttls is not None:
+                self.cache.set(key, CachedResponse(entry.data, entry.links, entry.etag, entry.last_modified))
+            return entry.data, entry.links
+
+        if key is not None and self.negative_cache is not None:
+            if response.history and response.history[0].status_code == 301:
+                self.negative_cache.moved(url.partition("?")[0], response.url.partition("?")[0])
+            try:
+                data = self.handle(response)
+            except (NotFound, Forbidden, Unavailable) as error:
+                if not isinstance(error, RateLimited):
+                    self.negative_cache.set(key, response.status_code, error)
+                raise
+        else:
+            data = self.handle(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if key is not None and (etag or last_modified or ttls is not None):
+            self.cache.set(key, CachedResponse(data, response.links, etag, last_modified))
+        return data, response.links
+
+
+    def _refresh(self, key: Hashable, route: Route, kwargs: Dict[str, Any]) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(
+                    max_workers=self.revalidation.workers if self.revalidation is not None else 4, 
+                    thread_name_prefix="revalidate"
+                )
+        self._refresher.submit(self._revalidate, key, route, kwargs)
+
+
+    def _revalidate(self, key: Hashable, route: Route, kwargs: Dict[str, Any]) -> None:
+        try:
+            self.send(route, revalidate=True, **kwargs)
+        except (RateLimited, ServerError, requests.RequestException):
+            # Transient: keep serving the stale copy until its hard TTL.
+            pass
+        except GitHubError:
+            self.cache.delete(key)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+
+    def _moved(self, url: str) -> str:
+        base, separator, query = url.partition("?")
+        target = self.negative_cache.target(base)
+        return f"{target}{separator}{query}" if target else url
+
+
+    def _perform(self, route: Route, url: str, headers: Dict[str, Any], **kwargs: Any) -> requests.Response:
+        """
+        Waits for the rate limit, then sends the request with its timeouts
+        shortened to what is left of the current deadline.
+        """
+        timeout = kwargs.pop("timeout", self.timeout)
+        deadlines.check()
+        self.rate_limits.wait(route.resource)
+        left = deadlines.check()
+        if left is not None:
+            connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+            timeout = (
+                min(connect, left) if connect is not None else left, 
+                min(read, left) if read is not None else left
+            )
+        try:
+            response = self.session.request(
+                method=route.method,
+                url=url,
+                params=route.params,
+                headers=headers,
+                timeout=timeout,
+                **kwargs
+            )
+        except requests.Timeout as error:
+            left = deadlines.remaining()
+            if left is not None and left <= 0:
+                raise DeadlineExceeded(f"Request to '{url}' ran past the deadline.") from error
+            raise
+        self.rate_limits.update(response.headers)
+        return response
+
+
+    def open(
+        self, 
+        route: Route, 
+        headers: Optional[Dict[str, str]] = None, 
+        deadline: Optional[float] = None, 
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Performs ``route`` with a streamed body and returns the raw 
+        response, for binary downloads. Error statuses raise as usual.
+        """
+        request_headers = {
+            "Accept": "application/octet-stream",
+            "Authorization": f"token {route.token}" if route.token else None
+        }
+        request_headers.update(headers or {})
+        with deadlines.deadline(deadline):
+            response = self._perform(route, self.url(route), request_headers, stream=True, **kwargs)
+        if response.status_code >= 400:
+            try:
+                self.handle(response)
+            finally:
+                response.close()
+        return response
+
+
+    def paginate(
+        self, 
+        route: Route, 
+        key: Optional[str] = None, 
+        per_page: Optional[int] = 100, 
+        deadline: Optional[float] = None, 
+        **kwargs: Any
+    ) -> Iterator[Any]:
+        """
+        Yields every item of a paginated listing, following ``next`` links.
+        ``key`` selects the item list when pages are objects (e.g. search).
+        A ``per_page`` of None keeps the endpoint's own page size.
+        ``deadline`` bounds fetching all the pages, counted from this call.
+        """
+        instant = time.monotonic() + deadline if deadline is not None else None
+        params = {"per_page": per_page} if per_page is not None else {}
+        params.update(route.params or {})
+        next_route: Optional[Route] = Route(route.method, route.path, route.token, params, route.resource, route.endpoint)
+        while next_route is not None:
+            with deadlines.until(instant):
+                data, links = self.send(next_route, **kwargs)
+            yield from (data.get(key, []) if key else data)
+            next_url = links.get("next", {}).get("url")
+            next_route = Route(
+                route.method, next_url, route.token, resource=route.resource, endpoint=route.endpoint
+            ) if next_url else None
+
+
+    def follow(
+        self, 
+        template: str, 
+        token: Optional[str] = None, 
+        key: Optional[str] = None, 
+        **variables: Any
+    ) -> Iterator[Any]:
+        """
+        Expands a ``*_url`` template from an API payload and paginates it.
+        """
+        return self.paginate(Route('GET', expand(template, **variables), token), key=key)
+
+
+    def fetch_url(self, template: str, token: Optional[str] = None, **variables: Any) -> Any:
+        return self.request(Route('GET', expand(template, **variables), token))
 
 
     def fetch_user(self, username: str, token: str) -> User:
-        user_data = self.request(
-            Route(
-                'GET', 
-                f"/users/{username}", 
-                token
-            )
-        )
-        return User(user_data)
+        user_data = self.call("user", token, username=username)
+        return User(user_data, http=self, token=token)
 
 
 
     def fetch_repo(self, owner: str, repo_name: str, token: str) -> Repository:
-        repository_data = self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}",
-                token=token
-            )
-        )
-        return Repository(repository_data)
+        repository_data = self.call("repo", token, owner=owner, repo_name=repo_name)
+        return Repository(repository_data, http=self, token=token)
 
 
     def search_repositories(self, query: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/search/repositories?q={query}",
-                token=token
-            )
-        )
+        return self.search(kind="repositories", query=query, token=token)
 
 
-    def fetch_issues(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/issues",
-                token=token
-            )
-        )
+    def search(
+        self, 
+        kind: str, 
+        query: str, 
+        token: str, 
+        page: int = 1, 
+        per_page: int = 100, 
+        sort: Optional[str] = None, 
+        order: Optional[str] = None
+    ) -> dict:
+        params: Dict[str, Any] = {"q": query, "page": page, "per_page": per_page}
+        if sort is not None:
+            params["sort"] = sort
+        if order is not None:
+            params["order"] = order
+        return self.call("search_code" if kind == "code" else "search", token, params, kind=kind)
 
 
-    def fetch_pull_requests(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/pulls",
-                token=token
-            )
-        )
+    def fetch_issues(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        token: str, 
+        state: Optional[str] = None, 
+        since: Optional[str] = None, 
+        sort: Optional[str] = None, 
+        direction: Optional[str] = None
+    ) -> list[dict]:
+        params = {
+            key: value 
+            for key, value in {
+                "state": state, "since": since, "sort": sort, "direction": direction
+            }.items() 
+            if value is not None
+        }
+        return list(self.call("issues", token, params, owner=owner, repo_name=repo_name))
+
+
+    def fetch_pull_requests(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        token: str, 
+        state: Optional[str] = None
+    ) -> list[dict]:
+        params = {"state": state} if state is not None else None
+        return list(self.call("pulls", token, params, owner=owner, repo_name=repo_name))
 
 
-    def fetch_commits(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/commits",
-                token=token
-            )
-        )
+    def fetch_pull_request(self, owner: str, repo_name: str, pull_number: int, token: str) -> dict:
+        return self.call("pull", token, owner=owner, repo_name=repo_name, pull_number=pull_number)
+
+
+    def fetch_pull_reviews(self, owner: str, repo_name: str, pull_number: int, token: str) -> list[dict]:
+        return list(self.call("pull_reviews", token, owner=owner, repo_name=repo_name, pull_number=pull_number))
+
+
+    def fetch_pull_review_comments(self, owner: str, repo_name: str, pull_number: int, token: str) -> list[dict]:
+        return list(self.call("pull_review_comments", token, owner=owner, repo_name=repo_name, pull_number=pull_number))
+
+
+    def fetch_pull_files(self, owner: str, repo_name: str, pull_number: int, token: str) -> list[dict]:
+        return list(self.call("pull_files", token, owner=owner, repo_name=repo_name, pull_number=pull_number))
+
+
+    def fetch_check_runs(self, owner: str, repo_name: str, ref: str, token: str) -> list[dict]:
+        return list(self.call("check_runs", token, owner=owner, repo_name=repo_name, ref=ref))
+
+
+    def fetch_commits(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        token: str, 
+        sha: Optional[str] = None, 
+        path: Optional[str] = None, 
+        since: Optional[str] = None, 
+        until: Optional[str] = None, 
+        author: Optional[str] = None
+    ) -> list[dict]:
+        params = {
+            key: value 
+            for key, value in {
+                "sha": sha, "path": path, "since": since, "until": until, "author": author
+            }.items() 
+            if value is not None
+        }
+        return list(self.call("commits", token, params, owner=owner, repo_name=repo_name))
 
 
     def fetch_branches(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/branches",
-                token=token
-            )
-        )
+        return list(self.call("branches", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_releases(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/releases",
-                token=token
-            )
-        )
+        return list(self.call("releases", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_contributors(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/contributors",
-                token=token
-            )
-        )
+        return list(self.call("contributors", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_issue(self, owner: str, repo_name: str, issue_number: int, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/issues/{issue_number}",
-                token=token
-            )
-        )
+        return self.call("issue", token, owner=owner, repo_name=repo_name, issue_number=issue_number)
+
+
+    def fetch_issue_comments(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        issue_number: int, 
+        token: str, 
+        since: Optional[str] = None
+    ) -> list[dict]:
+        params = {"since": since} if since is not None else None
+        return list(self.call(
+            "issue_comments", token, params, owner=owner, repo_name=repo_name, issue_number=issue_number
+        ))
 
 
     def create_issue(
@@ -182,24 +578,13 @@ class Http:
         title: str, 
         body: Optional[str] = None
     ) -> dict:
-        return self.request(
-            Route(
-                method='POST',
-                path=f"/repos/{owner}/{repo_name}/issues",
-                token=token
-            ),
-            json={"title": title, "body": body}
+        return self.call(
+            "create_issue", token, body={"title": title, "body": body}, owner=owner, repo_name=repo_name
         )
 
 
     def fetch_milestones(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/milestones",
-                token=token
-            )
-        )
+        return list(self.call("milestones", token, owner=owner, repo_name=repo_name))
 
 
     def create_milestone(
@@ -211,65 +596,79 @@ class Http:
         description: Optional[str] = None, 
         due_on: Optional[str] = None
     ) -> dict:
-        return self.request(
-            Route(
-                method='POST',
-                path=f"/repos/{owner}/{repo_name}/milestones",
-                token=token
-            ),
-            json={"title": title, "description": description, "due_on": due_on}
+        return self.call(
+            "create_milestone", 
+            token, 
+            body={"title": title, "description": description, "due_on": due_on}, 
+            owner=owner, 
+            repo_name=repo_name
         )
 
 
     def fetch_labels(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/labels",
-                token=token
-            )
-        )
+        return list(self.call("labels", token, owner=owner, repo_name=repo_name))
 
 
     def create_label(self, owner: str, repo_name: str, name: str, color: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='POST',
-                path=f"/repos/{owner}/{repo_name}/labels",
-                token=token
-            ),
-            json={"name": name, "color": color}
+        return self.call(
+            "create_label", token, body={"name": name, "color": color}, owner=owner, repo_name=repo_name
         )
 
 
     def fetch_events(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/events",
-                token=token
-            )
-        )
+        return list(self.call("events", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_commit(self, owner: str, repo_name: str, commit_sha: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/commits/{commit_sha}",
-                token=token
-            )
-        )
+        return self.call("commit", token, owner=owner, repo_name=repo_name, commit_sha=commit_sha)
+
+
+    def fetch_commit_files(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        commit_sha: str, 
+        token: str, 
+        per_page: Optional[int] = None
+    ) -> Iterator[dict]:
+        """
+        Yields the changed files of a commit page by page. The API lists
+        300 files per page by default and at most 3000 in total.
+        """
+        params = {"per_page": per_page} if per_page is not None else None
+        return self.call("commit_files", token, params, owner=owner, repo_name=repo_name, commit_sha=commit_sha)
+
+
+    def stream_commit_diff(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        commit_sha: str, 
+        token: str, 
+        media: str = "diff", 
+        chunk_size: int = 65536
+    ) -> Iterator[str]:
+        """
+        Yields the lines of a commit's ``diff`` or ``patch`` (with commit 
+        headers, as ``git format-patch``) as they arrive, without their 
+        line endings, so memory stays bounded by ``chunk_size``.
+        """
+        if media not in ("diff", "patch"):
+            raise ValueError(f"Unknown diff media type '{media}'.")
+        response = self.call(f"commit_{media}", token, owner=owner, repo_name=repo_name, commit_sha=commit_sha)
+        with response:
+            pending = b""
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line.decode("utf-8", "replace")
+            if pending:
+                yield pending.decode("utf-8", "replace")
 
 
     def fetch_release(self, owner: str, repo_name: str, release_id: int, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/releases/{release_id}",
-                token=token
-            )
-        )
+        return self.call("release", token, owner=owner, repo_name=repo_name, release_id=release_id)
 
 
     def create_release(
@@ -283,138 +682,198 @@ class Http:
         draft: bool = False,
         prerelease: bool = False
     ) -> dict:
-        return self.request(
-            Route(
-                method='POST',
-                path=f"/repos/{owner}/{repo_name}/releases",
-                token=token
-            ),
-            json={
+        return self.call(
+            "create_release", 
+            token, 
+            body={
                 "tag_name": tag_name, 
                 "name": name, 
                 "body": body,
                 "draft": draft,
                 "prerelease": prerelease
-            }
+            }, 
+            owner=owner, 
+            repo_name=repo_name
         )
 
 
     def fetch_forks(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/forks",
-                token=token
-            )
-        )
+        return list(self.call("forks", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_stargazers(self, owner: str, repo_name: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/stargazers",
-                token=token
-            )
-        )
+        return list(self.call("stargazers", token, owner=owner, repo_name=repo_name))
 
 
     def fetch_watched_repos(self, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path="/user/subscriptions",
-                token=token
-            )
-        )
+        return list(self.call("watched_repos", token))
 
 
     def fetch_repositories_for_user(self, username: str, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/users/{username}/repos",
-                token=token
-            )
-        )
+        return list(self.call("user_repos", token, username=username))
 
 
     def fetch_notifications(self, token: str) -> list[dict]:
-        return self.request(
-            Route(
-                method='GET',
-                path="/notifications",
-                token=token
-            )
-        )
+        return list(self.call("notifications", token))
 
 
     def mark_notifications_as_read(self, token: str) -> dict:
-        return self.request(
-            Route(
-                method='PUT',
-                path="/notifications",
-                token=token
-            )
-        )
+        return self.call("mark_notifications_read", token)
 
 
     def fetch_repo_topics(self, owner: str, repo_name: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/topics",
-                token=token
-            )
-        )
+        return self.call("topics", token, owner=owner, repo_name=repo_name)
 
 
     def replace_repo_topics(self, owner: str, repo_name: str, names: list[str], token: str) -> dict:
-        return self.request(
-            Route(
-                method='PUT',
-                path=f"/repos/{owner}/{repo_name}/topics",
-                token=token
-            ),
-            json={"names": names}
-        )
+        return self.call("replace_topics", token, body={"names": names}, owner=owner, repo_name=repo_name)
 
 
     def fetch_traffic_views(self, owner: str, repo_name: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/traffic/views",
-                token=token
-            )
-        )
+        return self.call("traffic", token, owner=owner, repo_name=repo_name, kind="views")
 
 
     def fetch_traffic_clones(self, owner: str, repo_name: str, token: str) -> dict:
-        return self.request(
-            Route(
-                method='GET',
-                path=f"/repos/{owner}/{repo_name}/traffic/clones",
-                token=token
-            )
+        return self.call("traffic", token, owner=owner, repo_name=repo_name, kind="clones")
+
+
+    def fetch_traffic(self, owner: str, repo_name: str, token: str, kind: str = "views") -> dict:
+        return self.call("traffic", token, owner=owner, repo_name=repo_name, kind=kind)
+
+
+    def fetch_traffic_referrers(self, owner: str, repo_name: str, token: str) -> list[dict]:
+        return self.call("traffic_referrers", token, owner=owner, repo_name=repo_name)
+
+
+    def fetch_traffic_paths(self, owner: str, repo_name: str, token: str) -> list[dict]:
+        return self.call("traffic_paths", token, owner=owner, repo_name=repo_name)
+
+
+    def fetch_stats(self, owner: str, repo_name: str, kind: str, token: str) -> Any:
+        return self.call("stats", token, owner=owner, repo_name=repo_name, kind=kind)
+
+
+    def fetch_tree(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        tree_sha: str, 
+        token: str, 
+        recursive: bool = False
+    ) -> dict:
+        return self.call(
+            "tree", 
+            token, 
+            {"recursive": 1} if recursive else None, 
+            owner=owner, 
+            repo_name=repo_name, 
+            tree_sha=tree_sha
         )
 
 
+    def fetch_blob(self, owner: str, repo_name: str, blob_sha: str, token: str) -> bytes:
+        with self.call("blob", token, owner=owner, repo_name=repo_name, blob_sha=blob_sha) as response:
+            return response.content
+
+
+    def fetch_org_repos(self, org: str, token: str) -> list[dict]:
+        return list(self.call("org_repos", token, org=org))
+
+
     def handle(self, response: requests.Response) -> json:
-        if response.status_code == 404:
+        """
+        Decodes a successful response, or raises the error matching its
+        status with the response's metadata attached.
+        """
+        status = response.status_code
+        if status == 204:
+            return None
+        if status < 400 and not (status == 202 and response.content.strip() in (b"", b"{}")):
+            return response.json()
+
+        metadata = self._metadata(response)
+        if status in (403, 429) and response.headers.get("X-RateLimit-Remaining") == "0":
+            raise RateLimited(
+                f"Rate limit of resource '{response.headers.get('X-RateLimit-Resource', 'core')}' exceeded.",
+                **metadata
+            )
+        elif status in (403, 429) and self._is_secondary_limit(response):
+            raise SecondaryRateLimited(
+                "Secondary rate limit exceeded.",
+                **metadata
+            )
+        elif status == 404:
             raise NotFound(
-                f"Endpoint '{response.url}' not found."
+                f"Endpoint '{response.url}' not found.",
+                **metadata
             )
-        elif response.status_code == 401:
+        elif status == 401:
             raise Unauthorized(
-                "Invalid or missing authentication token."
+                "Invalid or missing authentication token.",
+                **metadata
             )
-        elif response.status_code == 403:
+        elif status == 403:
             raise Forbidden(
-                "You do not have permission to access this resource."
+                "You do not have permission to access this resource.",
+                **metadata
             )
-        elif response.status_code == 400:
+        elif status == 400:
             raise BadRequest(
-                "The request was malformed."
+                "The request was malformed.",
+                **metadata
             )
-        return response.json()
\ No newline at end of file
+        elif status == 422:
+            raise Unprocessable(
+                f"Validation failed: {self._message(metadata['body'])}",
+                **metadata
+            )
+        elif status == 451:
+            raise Unavailable(
+                f"'{response.url}' is unavailable for legal reasons.",
+                **metadata
+            )
+        elif status >= 500:
+            raise ServerError(
+                f"Request to '{response.url}' failed with status {status}.",
+                **metadata
+            )
+        elif status == 202:
+            raise Accepted(
+                f"'{response.url}' is still being computed.",
+                **metadata
+            )
+        raise GitHubError(
+            f"Request to '{response.url}' failed with status {status}.",
+            **metadata
+        )
+
+
+    @staticmethod
+    def _metadata(response: requests.Response) -> Dict[str, Any]:
+        try:
+            body = response.json() if response.content else None
+        except ValueError:
+            body = response.text
+        return {
+            "status": response.status_code,
+            "headers": response.headers,
+            "body": body,
+            "elapsed": response.elapsed.total_seconds()
+        }
+
+
+    @staticmethod
+    def _message(body: Any) -> str:
+        return str(body.get("message", "")) if isinstance(body, dict) else str(body or "")
+
+
+    @staticmethod
+    def _is_secondary_limit(response: requests.Response) -> bool:
+        if response.status_code == 429 or "Retry-After" in response.headers:
+            return True
+        try:
+            body = response.json()
+        except ValueError:
+            return False
+        message = body.get("message", "") if isinstance(body, dict) else ""
+        return "secondary rate limit" in str(message).lower()
@@ -0,0 +1,352 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import (
+    Any, 
+    Callable, 
+    Dict, 
+    FrozenSet, 
+    Hashable, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Set, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+import bisect
+import heapq
+import threading
+
+from pyGithub.issue import Issue
+
+if TYPE_CHECKING:
+    from pyGithub.client import Client
+
+
+FIELDS = ("state", "label", "assignee", "milestone", "author", "kind")
+
+
+class IssueQuery:
+    """
+    An immutable, composable query over an :class:`IssueIndex`. Every
+    filter returns a new query, and nothing runs until the query is 
+    iterated (or :meth:`all`, :meth:`count`, :meth:`first` is called)::
+
+        index.query().issues().state("open").label("bug").assignee("octocat")
+
+    Filters on indexed fields are answered by intersecting posting sets,
+    smallest first; :meth:`where` predicates only see the survivors.
+    """
+    def __init__(
+        self, 
+        index: IssueIndex, 
+        terms: Tuple[Tuple[str, FrozenSet[Hashable], bool], ...] = (), 
+        updated: Tuple[Optional[str], Optional[str]] = (None, None), 
+        predicates: Tuple[Callable[[Issue], bool], ...] = (), 
+        order: Optional[Tuple[str, bool]] = None, 
+        limit: Optional[int] = None
+    ) -> None:
+        self._index = index
+        self._terms = terms
+        self._updated = updated
+        self._predicates = predicates
+        self._order = order
+        self._limit = limit
+
+
+    def _with(self, **changes: Any) -> IssueQuery:
+        state = {
+            "terms": self._terms, 
+            "updated": self._updated, 
+            "predicates": self._predicates, 
+            "order": self._order, 
+            "limit": self._limit
+        }
+        state.update(changes)
+        return IssueQuery(self._index, **state)
+
+
+    def _term(self, field: str, values: Iterable[Hashable], every: bool = False) -> IssueQuery:
+        return self._with(terms=self._terms + ((field, frozenset(values), every),))
+
+
+    def state(self, *states: str) -> IssueQuery:
+        return self._term("state", states)
+
+
+    def label(self, *names: str) -> IssueQuery:
+        """
+        Issues carrying every one of ``names``.
+        """
+        return self._term("label", names, every=True)
+
+
+    def any_label(self, *names: str) -> IssueQuery:
+        return self._term("label", names)
+
+
+    def assignee(self, *logins: Optional[str]) -> IssueQuery:
+        """
+        Issues assigned to any of ``logins``; ``None`` matches unassigned.
+        """
+        return self._term("assignee", logins)
+
+
+    def milestone(self, *titles: Optional[str]) -> IssueQuery:
+        return self._term("milestone", titles)
+
+
+    def author(self, *logins: str) -> IssueQuery:
+        return self._term("author", logins)
+
+
+    def issues(self) -> IssueQuery:
+        return self._term("kind", ("issue",))
+
+
+    def pulls(self) -> IssueQuery:
+        return self._term("kind", ("pull",))
+
+
+    def updated(self, since: Optional[str] = None, before: Optional[str] = None) -> IssueQuery:
+        """
+        Issues with ``since <= updated_at < before`` (ISO 8601 timestamps).
+        """
+        low, high = self._updated
+        if since is not None:
+            low = max(low, since) if low is not None else since
+        if before is not None:
+            high = min(high, before) if high is not None else before
+        return self._with(updated=(low, high))
+
+
+    def where(self, predicate: Callable[[Issue], bool]) -> IssueQuery:
+        return self._with(predicates=self._predicates + (predicate,))
+
+
+    def sort(self, key: str = "updated_at", reverse: bool = True) -> IssueQuery:
+        """
+        Orders results by an :class:`Issue` attribute, newest or largest
+        first by default. Unsorted results come in ascending number order.
+        """
+        return self._with(order=(key, reverse))
+
+
+    def limit(self, count: int) -> IssueQuery:
+        return self._with(limit=count)
+
+
+    def __iter__(self) -> Iterator[Issue]:
+        return iter(self.all())
+
+
+    def all(self) -> List[Issue]:
+        return self._index._run(self)
+
+
+    def count(self) -> int:
+        return len(self.all())
+
+
+    def first(self) -> Optional[Issue]:
+        results = self.limit(1).all()
+        return results[0] if results else None
+
+
+    def __repr__(self) -> str:
+        return f"IssueQuery(terms={len(self._terms)}, order={self._order}, limit={self._limit})"
+
+
+class IssueIndex:
+    """
+    In-memory index of a repository's issues and pull requests, with 
+    posting sets on state, labels, assignees, milestone, author and kind
+    and an ordered ``updated_at`` index, queried with :meth:`query`.
+
+    :meth:`sync` loads every issue on first call and afterwards fetches 
+    only those updated since the newest one seen. Issues transferred or
+    deleted upstream are not detected; :meth:`remove` drops them. Safe to
+    query from several threads while another one syncs.
+    """
+    def __init__(
+        self, 
+        client: Optional[Client] = None, 
+        owner: Optional[str] = None, 
+        repo_name: Optional[str] = None
+    ) -> None:
+        self.client = client
+        self.owner = owner
+        self.repo_name = repo_name
+        self._issues: Dict[int, Issue] = {}
+        self._keys: Dict[int, Dict[str, FrozenSet[Hashable]]] = {}
+        self._postings: Dict[str, Dict[Hashable, Set[int]]] = {field: {} for field in FIELDS}
+        self._updated: List[Tuple[str, int]] = []
+        self._synced: Optional[str] = None
+        self._lock = threading.RLock()
+
+
+    def sync(self) -> int:
+        """
+        Fetches issues changed since the last sync and returns how many.
+        """
+        if self.client is None:
+            raise ValueError("IssueIndex is not bound to a client.")
+        issues = self.client.get_issues(
+            self.owner, 
+            self.repo_name, 
+            state="all", 
+            since=self._synced, 
+            sort="updated", 
+            direction="asc"
+        )
+        self.update(issues)
+        return len(issues)
+
+
+    @staticmethod
+    def _index_keys(issue: Issue) -> Dict[str, FrozenSet[Hashable]]:
+        milestone = issue.milestone
+        return {
+            "state": frozenset((issue.state,)), 
+            "label": frozenset(issue.label_names), 
+            "assignee": frozenset(user.login for user in issue.assignees) or frozenset((None,)), 
+            "milestone": frozenset((milestone.title if milestone else None,)), 
+            "author": frozenset((issue.user.login if issue.user else None,)), 
+            "kind": frozenset(("pull" if issue.is_pull_request else "issue",))
+        }
+
+
+    def add(self, issue: Issue) -> None:
+        """
+        Indexes ``issue``, replacing an earlier version with its number.
+        """
+        with self._lock:
+            self.remove(issue.number)
+            keys = self._index_keys(issue)
+            for field, values in keys.items():
+                postings = self._postings[field]
+                for value in values:
+                    postings.setdefault(value, set()).add(issue.number)
+            self._issues[issue.number] = issue
+            self._keys[issue.number] = keys
+            if issue.updated_at:
+                bisect.insort(self._updated, (issue.updated_at, issue.number))
+                if self._synced is None or issue.updated_at > self._synced:
+                    self._synced = issue.updated_at
+
+
+    def update(self, issues: Iterable[Issue]) -> None:
+        with self._lock:
+            for issue in issues:
+                self.add(issue)
+
+
+    def remove(self, number: int) -> Optional[Issue]:
+        with self._lock:
+            issue = self._issues.pop(number, None)
+            if issue is None:
+                return None
+            for field, values in self._keys.pop(number).items():
+                postings = self._postings[field]
+                for value in values:
+                    postings[value].discard(number)
+                    if not postings[value]:
+                        del postings[value]
+            if issue.updated_at:
+                position = bisect.bisect_left(self._updated, (issue.updated_at, number))
+                del self._updated[position]
+            return issue
+
+
+    def get(self, number: int) -> Optional[Issue]:
+        return self._issues.get(number)
+
+
+    def values(self, field: str) -> List[Hashable]:
+        """
+        The distinct values indexed for ``field``, e.g. every label name.
+        """
+        with self._lock:
+            return list(self._postings[field])
+
+
+    def query(self) -> IssueQuery:
+        return IssueQuery(self)
+
+
+    def _run(self, query: IssueQuery) -> List[Issue]:
+        with self._lock:
+            matches: List[Set[int]] = []
+            for field, values, every in query._terms:
+                postings = self._postings[field]
+                sets = [postings.get(value, set()) for value in values]
+                if not sets:
+                    matches.append(set())
+                elif every:
+                    matches.append(set.intersection(*sorted(sets, key=len)))
+                else:
+                    matches.append(set().union(*sets))
+            low, high = query._updated
+            if low is not None or high is not None:
+                start = bisect.bisect_left(self._updated, (low,)) if low is not None else 0
+                end = bisect.bisect_left(self._updated, (high,)) if high is not None else len(self._updated)
+                matches.append({number for _, number in self._updated[start:end]})
+            if matches:
+                matches.sort(key=len)
+                numbers = matches[0].intersection(*matches[1:])
+            else:
+                numbers = set(self._issues)
+            issues = [self._issues[number] for number in sorted(numbers)]
+
+        for predicate in query._predicates:
+            issues = [issue for issue in issues if predicate(issue)]
+        if query._order is None:
+            return issues[:query._limit] if query._limit is not None else issues
+
+        attribute, reverse = query._order
+
+        def key(issue: Issue) -> Tuple[bool, Any]:
+            value = getattr(issue, attribute)
+            return (value is None) != reverse, value
+
+        if query._limit is not None:
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            return select(query._limit, issues, key=key)
+        return sorted(issues, key=key, reverse=reverse)
+
+
+    def __len__(self) -> int:
+        return len(self._issues)
+
+
+    def __contains__(self, number: int) -> bool:
+        return number in self._issues
+
+
+    def __repr__(self) -> str:
+        return f"IssueIndex(repo={self.owner}/{self.repo_name}, issues={len(self._issues)})"
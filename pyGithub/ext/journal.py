@@ -0,0 +1,217 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Optional
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class WriteJournal:
+    """
+    Append-only, crash-safe journal of mutating API calls.
+
+    Every write is logged as an ``intent`` record before the request and a
+    ``done`` (with the server-assigned id) or ``failed`` record after it.
+    Reopening the journal replays the file, so a restarted process can
+    skip operations that already landed (``resume=True``) and report the
+    ones whose outcome is unknown because the process died mid-request.
+
+    Records are flushed to the OS as they are written, which survives a
+    process crash; ``fsync`` runs every ``sync_every`` records or
+    ``sync_interval`` seconds, whichever comes first, and on :meth:`close`.
+    """
+    RESULT_FIELDS = ("id", "number", "node_id", "url", "html_url", "tag_name", "name", "title")
+
+    def __init__(
+        self, 
+        path: str, 
+        resume: bool = True, 
+        sync_every: int = 64, 
+        sync_interval: float = 1.0
+    ) -> None:
+        self.path = path
+        self.resume = resume
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._sequences: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+        self._load()
+        self._file = open(path, "a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            self._file.write("\n")
+
+
+    @staticmethod
+    def operation_key(
+        kind: str, 
+        owner: str, 
+        repo_name: str, 
+        fields: Dict[str, Any], 
+        idempotency_key: Optional[str] = None, 
+        sequence: int = 0
+    ) -> str:
+        """
+        Identifies an operation. With an ``idempotency_key`` the caller 
+        decides which calls are the same operation; without one, the 
+        ``sequence``-th operation with identical content gets the same key
+        on every run.
+        """
+        payload: List[Any] = [kind, owner, repo_name, fields]
+        if idempotency_key is not None:
+            payload += ["key", idempotency_key]
+        elif sequence:
+            payload += ["seq", sequence]
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+    def key(
+        self, 
+        kind: str, 
+        owner: str, 
+        repo_name: str, 
+        fields: Dict[str, Any], 
+        idempotency_key: Optional[str] = None
+    ) -> str:
+        """
+        Returns the key of the next operation. Identical operations without
+        an ``idempotency_key`` are numbered in the order this journal sees
+        them, so creating the same issue twice makes two operations, while
+        re-running the same input resumes both.
+        """
+        if idempotency_key is not None:
+            return self.operation_key(kind, owner, repo_name, fields, idempotency_key=idempotency_key)
+        content = self.operation_key(kind, owner, repo_name, fields)
+        with self._lock:
+            sequence = self._sequences.get(content, 0)
+            self._sequences[content] = sequence + 1
+        return self.operation_key(kind, owner, repo_name, fields, sequence=sequence)
+
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as journal:
+            for line in journal:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write.
+                    continue
+                self._records[record["key"]] = record
+
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as journal:
+            journal.seek(-1, os.SEEK_END)
+            return journal.read(1) == b"\n"
+
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self._records[record["key"]] = record
+            self._file.write(json.dumps(record, default=str) + "\n")
+            self._file.flush()
+            self._unsynced += 1
+            if (
+                self._unsynced >= self.sync_every 
+                or time.monotonic() - self._synced_at >= self.sync_interval
+            ):
+                self._sync()
+
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._synced_at = time.monotonic()
+
+
+    def intent(self, key: str, operation: Dict[str, Any]) -> None:
+        self._append({"key": key, "state": "intent", "op": operation, "ts": time.time()})
+
+
+    def done(self, key: str, result: Dict[str, Any]) -> None:
+        self._append({
+            "key": key, 
+            "state": "done", 
+            "id": result.get("id"),
+            "result": {field: result[field] for field in self.RESULT_FIELDS if field in result},
+            "ts": time.time()
+        })
+
+
+    def failed(self, key: str, error: Exception) -> None:
+        self._append({"key": key, "state": "failed", "error": repr(error), "ts": time.time()})
+
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._records.get(key)
+
+
+    def status(self, key: str) -> Optional[str]:
+        record = self._records.get(key)
+        return record["state"] if record else None
+
+
+    def uncertain(self) -> List[str]:
+        """
+        Keys of operations that were started but never recorded an outcome.
+        """
+        return [key for key, record in self._records.items() if record["state"] == "intent"]
+
+
+    def sync(self) -> None:
+        with self._lock:
+            self._sync()
+
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._sync()
+                self._file.close()
+
+
+    def __enter__(self) -> WriteJournal:
+        return self
+
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+    def __repr__(self) -> str:
+        return f"WriteJournal(path={self.path}, records={len(self._records)})"
@@ -0,0 +1,188 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import Future
+from typing import (
+    Deque, 
+    Dict, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Sequence, 
+    Tuple, 
+    Union, 
+    TYPE_CHECKING
+)
+
+from pyGithub.commit import CommitFile
+from pyGithub.pull import CheckRun, PullRequest, PullRequestBundle, Review, ReviewComment
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+PARTS = ("reviews", "comments", "files", "checks")
+
+
+class PullRequestBundler:
+    """
+    Fetches pull requests together with their sub-resources concurrently.
+
+    Every part of every pull request (reviews, review comments, files, 
+    and the pull request followed by its head's check runs) is its own 
+    task on one thread pool, each paginated to the end, so workers stay
+    busy whether the input is one large pull request or thousands of 
+    small ones. Bundles come out in input order with at most ``window``
+    pull requests in flight, which bounds memory on long runs. Pages go
+    through :class:`Http`, so cached ones are revalidated with 
+    conditional requests instead of being downloaded again.
+    """
+    def __init__(
+        self, 
+        http: Http, 
+        token: Optional[str] = None, 
+        workers: int = 8, 
+        window: Optional[int] = None
+    ) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+        self.window = window or workers * 4
+
+
+    def bundle(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        pull: Union[int, PullRequest], 
+        parts: Sequence[str] = PARTS
+    ) -> PullRequestBundle:
+        return next(self.bundles(owner, repo_name, [pull], parts))
+
+
+    def bundles(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        pulls: Iterable[Union[int, PullRequest]], 
+        parts: Sequence[str] = PARTS, 
+        patches: bool = True
+    ) -> Iterator[PullRequestBundle]:
+        """
+        Yields a bundle per pull request number or :class:`PullRequest`;
+        pull requests passed as objects are not fetched again. 
+        ``patches=False`` drops the diff text of changed files.
+        """
+        unknown = set(parts) - set(PARTS)
+        if unknown:
+            raise ValueError(f"Unknown pull request parts: {', '.join(sorted(unknown))}.")
+        pending: Deque[Dict[str, Future]] = deque()
+        with ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for pull in pulls:
+                    pending.append(self._submit(executor, owner, repo_name, pull, parts, patches))
+                    if len(pending) >= self.window:
+                        yield self._collect(pending.popleft())
+                while pending:
+                    yield self._collect(pending.popleft())
+            finally:
+                for futures in pending:
+                    for future in futures.values():
+                        future.cancel()
+
+
+    def _submit(
+        self, 
+        executor: ContextThreadPoolExecutor, 
+        owner: str, 
+        repo_name: str, 
+        pull: Union[int, PullRequest], 
+        parts: Sequence[str], 
+        patches: bool
+    ) -> Dict[str, Future]:
+        number = pull.number if isinstance(pull, PullRequest) else pull
+        futures = {"pull": executor.submit(self._pull, owner, repo_name, pull, "checks" in parts)}
+        fetchers = {
+            "reviews": self._reviews, 
+            "comments": self._comments, 
+            "files": lambda owner, repo_name, number: self._files(owner, repo_name, number, patches)
+        }
+        for part, fetch in fetchers.items():
+            if part in parts:
+                futures[part] = executor.submit(fetch, owner, repo_name, number)
+        return futures
+
+
+    @staticmethod
+    def _collect(futures: Dict[str, Future]) -> PullRequestBundle:
+        pull, checks = futures.pop("pull").result()
+        parts = {part: future.result() for part, future in futures.items()}
+        return PullRequestBundle(pull, checks=checks, **parts)
+
+
+    def _pull(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        pull: Union[int, PullRequest], 
+        checks: bool
+    ) -> Tuple[PullRequest, Optional[List[CheckRun]]]:
+        if not isinstance(pull, PullRequest):
+            pull_data = self.http.fetch_pull_request(
+                owner=owner, repo_name=repo_name, pull_number=pull, token=self.token
+            )
+            pull = PullRequest(pull_data, http=self.http, token=self.token)
+        if not checks or not pull.head_sha:
+            return pull, None
+        checks_data = self.http.fetch_check_runs(
+            owner=owner, repo_name=repo_name, ref=pull.head_sha, token=self.token
+        )
+        return pull, [CheckRun(check) for check in checks_data]
+
+
+    def _reviews(self, owner: str, repo_name: str, number: int) -> List[Review]:
+        reviews_data = self.http.fetch_pull_reviews(
+            owner=owner, repo_name=repo_name, pull_number=number, token=self.token
+        )
+        return [Review(review, http=self.http, token=self.token) for review in reviews_data]
+
+
+    def _comments(self, owner: str, repo_name: str, number: int) -> List[ReviewComment]:
+        comments_data = self.http.fetch_pull_review_comments(
+            owner=owner, repo_name=repo_name, pull_number=number, token=self.token
+        )
+        return [ReviewComment(comment, http=self.http, token=self.token) for comment in comments_data]
+
+
+    def _files(self, owner: str, repo_name: str, number: int, patches: bool) -> List[CommitFile]:
+        files_data = self.http.fetch_pull_files(
+            owner=owner, repo_name=repo_name, pull_number=number, token=self.token
+        )
+        if not patches:
+            files_data = [{name: value for name, value in file.items() if name != "patch"} for file in files_data]
+        return [CommitFile(file) for file in files_data]
@@ -0,0 +1,171 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import Dict, Mapping, Optional
+
+import threading
+import time
+
+from pyGithub.ext import deadline as deadlines
+
+
+class RateLimit:
+    """
+    The quota of one rate-limit resource (``core``, ``search``, ...),
+    as last reported by the ``X-RateLimit-*`` response headers.
+    """
+    def __init__(self, resource: str, limit: int, remaining: int, reset: float) -> None:
+        self.resource = resource
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> Optional[RateLimit]:
+        if "X-RateLimit-Remaining" not in headers:
+            return None
+        return cls(
+            resource=headers.get("X-RateLimit-Resource", "core"),
+            limit=int(headers.get("X-RateLimit-Limit", 0)),
+            remaining=int(headers["X-RateLimit-Remaining"]),
+            reset=float(headers.get("X-RateLimit-Reset", 0))
+        )
+
+
+    def __repr__(self) -> str:
+        return f"RateLimit(resource={self.resource}, remaining={self.remaining}, limit={self.limit})"
+
+
+class RateLimiter:
+    """
+    Tracks the quota of every resource seen in responses and blocks
+    callers of :meth:`wait` while a resource is exhausted.
+
+    Each :meth:`wait` reserves one request from the last known quota, so 
+    threads sharing the limiter cannot overrun it between responses; the 
+    next response's headers then replace the estimate.
+    """
+    def __init__(self) -> None:
+        self._limits: Dict[str, RateLimit] = {}
+        self._lock = threading.Lock()
+
+
+    def get(self, resource: str) -> Optional[RateLimit]:
+        return self._limits.get(resource)
+
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        limit = RateLimit.from_headers(headers)
+        if limit is not None:
+            with self._lock:
+                self._limits[limit.resource] = limit
+
+
+    def wait(self, resource: Optional[str]) -> None:
+        while True:
+            with self._lock:
+                limit = self._limits.get(resource) if resource else None
+                if limit is None:
+                    return
+                delay = limit.reset - time.time()
+                if limit.remaining > 0 or delay <= 0:
+                    limit.remaining -= 1
+                    return
+            deadlines.sleep(delay)
+
+
+class TokenBucket:
+    """
+    Paces calls to at most ``rate`` per ``per`` seconds, allowing short
+    bursts of up to ``rate`` calls. Safe to share between threads.
+    """
+    def __init__(self, rate: float, per: float = 60.0) -> None:
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) * self.per / self.rate
+            deadlines.sleep(delay)
+
+
+class AdaptiveThrottle:
+    """
+    Paces content-creating requests, which GitHub guards with secondary
+    rate limits rather than the hourly quota.
+
+    Calls are spaced ``interval`` seconds apart across all threads. Each
+    success shortens the interval by ``step`` down to ``min_interval``;
+    each secondary-limit rejection multiplies it by ``factor`` and pauses
+    every caller for the server's ``Retry-After``.
+    """
+    def __init__(
+        self, 
+        interval: float = 1.0, 
+        min_interval: float = 0.75, 
+        max_interval: float = 60.0, 
+        step: float = 0.05, 
+        factor: float = 2.0
+    ) -> None:
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.step = step
+        self.factor = factor
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            deadlines.sleep(start - now)
+
+
+    def success(self) -> None:
+        with self._lock:
+            self.interval = max(self.min_interval, self.interval - self.step)
+
+
+    def backoff(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            self.interval = min(self.max_interval, self.interval * self.factor)
+            pause = retry_after if retry_after is not None else self.interval
+            self._next = max(self._next, time.monotonic() + pause)
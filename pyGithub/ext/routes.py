@@ -0,0 +1,267 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import re
+
+from pyGithub.ext.uritemplate import compile_template
+
+
+IDEMPOTENT = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+
+_VARIABLE = re.compile(r"\{(\+?)(\w+)\}")
+
+
+class Endpoint:
+    """
+    Declares one REST endpoint and the policies applied to its requests.
+
+    ``path`` is an RFC 6570 template; ``{name}`` expands to one escaped 
+    path segment and ``{+name}`` keeps slashes (for refs such as 
+    ``heads/main``). ``paginated`` listings are followed to the end, with
+    ``key`` selecting the item list when pages are objects. ``media`` is
+    sent as ``Accept``, and ``stream`` returns the raw response instead 
+    of decoded JSON. ``cacheable`` (GET only by default) responses go to
+    the response cache, where ``ttls`` gives their soft and hard 
+    stale-while-revalidate TTLs unless the client's revalidation policy 
+    has a rule for them. ``idempotent`` requests are retried up to 
+    ``retries`` times on 5xx errors and dropped connections.
+    """
+    def __init__(
+        self, 
+        name: str, 
+        method: str, 
+        path: str, 
+        paginated: bool = False, 
+        key: Optional[str] = None, 
+        per_page: Optional[int] = 100, 
+        media: Optional[str] = None, 
+        stream: bool = False, 
+        resource: str = "core", 
+        cacheable: Optional[bool] = None, 
+        ttls: Optional[Tuple[float, float]] = None, 
+        idempotent: Optional[bool] = None, 
+        retries: Optional[int] = None
+    ) -> None:
+        self.name = name
+        self.method = method
+        self.path = path
+        self.paginated = paginated
+        self.key = key
+        self.per_page = per_page
+        self.media = media
+        self.stream = stream
+        self.resource = resource
+        self.cacheable = method == "GET" if cacheable is None else cacheable
+        self.ttls = ttls
+        self.idempotent = method in IDEMPOTENT if idempotent is None else idempotent
+        self.retries = (2 if self.idempotent else 0) if retries is None else retries
+        if self.retries and not self.idempotent:
+            raise ValueError(f"Endpoint '{name}' is not idempotent and cannot be retried.")
+        if ttls is not None and ttls[1] < ttls[0]:
+            raise ValueError("hard TTL must not be shorter than soft TTL.")
+        self.template = compile_template(path)
+        self.variables = frozenset(self.template.variables)
+        self.pattern = "".join(
+            "[^?#]+" if piece.startswith("{+") else "[^/?#]+" if piece.startswith("{") else re.escape(piece)
+            for piece in re.split(r"(\{\+?\w+\})", path) if piece
+        )
+
+
+    def expand(self, **variables: Any) -> str:
+        missing = self.variables.difference(variables)
+        if missing:
+            raise ValueError(f"Endpoint '{self.name}' is missing {', '.join(sorted(missing))}.")
+        return self.template.expand(**variables)
+
+
+    @property
+    def headers(self) -> Optional[Dict[str, str]]:
+        return {"Accept": self.media} if self.media else None
+
+
+    def replace(self, **changes: Any) -> Endpoint:
+        """
+        Returns a copy of this endpoint with some settings changed.
+        """
+        settings = {
+            name: getattr(self, name) 
+            for name in (
+                "name", "method", "path", "paginated", "key", "per_page", "media", 
+                "stream", "resource", "cacheable", "ttls", "idempotent", "retries"
+            )
+        }
+        if "method" in changes and "idempotent" not in changes:
+            settings["idempotent"] = None
+        settings.update(changes)
+        return Endpoint(**settings)
+
+
+    def __repr__(self) -> str:
+        return f"Endpoint(name={self.name}, method={self.method}, path={self.path})"
+
+
+class Registry:
+    """
+    A table of :class:`Endpoint` declarations by name.
+
+    Besides lookups by name, :meth:`resolve` maps a request's method and
+    URL back to its endpoint, so routes built from ``next`` links or 
+    ``*_url`` fields get the same policies. The templates of each method 
+    are precompiled into one alternation, most specific first, so 
+    resolving is a single regex match.
+    """
+    def __init__(self, endpoints: Optional[List[Endpoint]] = None) -> None:
+        self._endpoints: Dict[str, Endpoint] = {}
+        self._matchers: Optional[Dict[str, Tuple[re.Pattern, Dict[str, Endpoint]]]] = None
+        for endpoint in endpoints or []:
+            self.add(endpoint)
+
+
+    def add(self, endpoint: Endpoint) -> None:
+        self._endpoints[endpoint.name] = endpoint
+        self._matchers = None
+
+
+    def configure(self, name: str, **changes: Any) -> Endpoint:
+        """
+        Changes the policies of endpoint ``name``, e.g. 
+        ``configure("repo", ttls=(60, 600))``.
+        """
+        endpoint = self._endpoints[name].replace(**changes)
+        self.add(endpoint)
+        return endpoint
+
+
+    def copy(self) -> Registry:
+        return Registry(list(self._endpoints.values()))
+
+
+    def __getitem__(self, name: str) -> Endpoint:
+        return self._endpoints[name]
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._endpoints
+
+
+    def __iter__(self) -> Iterator[Endpoint]:
+        return iter(self._endpoints.values())
+
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+
+    def resolve(self, method: str, url: str, base: str = "") -> Optional[Endpoint]:
+        """
+        Returns the endpoint serving ``method`` on ``url``; ``base`` is 
+        the API root, whose path prefix (as on GitHub Enterprise) is 
+        ignored.
+        """
+        matchers = self._matchers
+        if matchers is None:
+            matchers = self._matchers = self._compile()
+        matcher = matchers.get(method)
+        if matcher is None:
+            return None
+        path = urlsplit(url).path
+        prefix = urlsplit(base).path.rstrip("/")
+        if prefix and path.startswith(prefix):
+            path = path[len(prefix):]
+        match = matcher[0].fullmatch(path.rstrip("/") or "/")
+        return matcher[1][match.lastgroup] if match else None
+
+
+    def _compile(self) -> Dict[str, Tuple[re.Pattern, Dict[str, Endpoint]]]:
+        by_method: Dict[str, List[Endpoint]] = {}
+        for endpoint in self._endpoints.values():
+            # Plain JSON endpoints win over media variants of the same path.
+            if endpoint.stream or endpoint.media:
+                continue
+            by_method.setdefault(endpoint.method, []).append(endpoint)
+        matchers = {}
+        for method, endpoints in by_method.items():
+            endpoints.sort(key=lambda endpoint: len(_VARIABLE.sub("", endpoint.path)), reverse=True)
+            groups = {f"e{position}": endpoint for position, endpoint in enumerate(endpoints)}
+            regex = "|".join(f"(?P<{group}>{endpoint.pattern})" for group, endpoint in groups.items())
+            matchers[method] = (re.compile(regex), groups)
+        return matchers
+
+
+    def __repr__(self) -> str:
+        return f"Registry(endpoints={len(self)})"
+
+
+REPO = "/repos/{owner}/{repo_name}"
+
+ROUTES = Registry([
+    Endpoint("user", "GET", "/users/{username}"),
+    Endpoint("user_repos", "GET", "/users/{username}/repos", paginated=True),
+    Endpoint("watched_repos", "GET", "/user/subscriptions", paginated=True),
+    Endpoint("org_repos", "GET", "/orgs/{org}/repos", paginated=True),
+    Endpoint("notifications", "GET", "/notifications", paginated=True),
+    Endpoint("mark_notifications_read", "PUT", "/notifications"),
+    Endpoint("search", "GET", "/search/{kind}", resource="search"),
+    Endpoint("search_code", "GET", "/search/code", resource="code_search"),
+    Endpoint("repo", "GET", REPO),
+    Endpoint("issues", "GET", f"{REPO}/issues", paginated=True),
+    Endpoint("issue", "GET", f"{REPO}/issues/{{issue_number}}"),
+    Endpoint("issue_comments", "GET", f"{REPO}/issues/{{issue_number}}/comments", paginated=True),
+    Endpoint("create_issue", "POST", f"{REPO}/issues"),
+    Endpoint("pulls", "GET", f"{REPO}/pulls", paginated=True),
+    Endpoint("pull", "GET", f"{REPO}/pulls/{{pull_number}}"),
+    Endpoint("pull_reviews", "GET", f"{REPO}/pulls/{{pull_number}}/reviews", paginated=True),
+    Endpoint("pull_review_comments", "GET", f"{REPO}/pulls/{{pull_number}}/comments", paginated=True),
+    Endpoint("pull_files", "GET", f"{REPO}/pulls/{{pull_number}}/files", paginated=True),
+    Endpoint("commits", "GET", f"{REPO}/commits", paginated=True),
+    Endpoint("commit", "GET", f"{REPO}/commits/{{+commit_sha}}"),
+    Endpoint("commit_files", "GET", f"{REPO}/commits/{{+commit_sha}}", paginated=True, key="files", per_page=None),
+    Endpoint("commit_diff", "GET", f"{REPO}/commits/{{+commit_sha}}", media="application/vnd.github.diff", stream=True),
+    Endpoint("commit_patch", "GET", f"{REPO}/commits/{{+commit_sha}}", media="application/vnd.github.patch", stream=True),
+    Endpoint("check_runs", "GET", f"{REPO}/commits/{{+ref}}/check-runs", paginated=True, key="check_runs"),
+    Endpoint("branches", "GET", f"{REPO}/branches", paginated=True),
+    Endpoint("contributors", "GET", f"{REPO}/contributors", paginated=True),
+    Endpoint("events", "GET", f"{REPO}/events", paginated=True),
+    Endpoint("forks", "GET", f"{REPO}/forks", paginated=True),
+    Endpoint("stargazers", "GET", f"{REPO}/stargazers", paginated=True),
+    Endpoint("milestones", "GET", f"{REPO}/milestones", paginated=True),
+    Endpoint("create_milestone", "POST", f"{REPO}/milestones"),
+    Endpoint("labels", "GET", f"{REPO}/labels", paginated=True),
+    Endpoint("create_label", "POST", f"{REPO}/labels"),
+    Endpoint("releases", "GET", f"{REPO}/releases", paginated=True),
+    Endpoint("release", "GET", f"{REPO}/releases/{{release_id}}"),
+    Endpoint("create_release", "POST", f"{REPO}/releases"),
+    Endpoint("topics", "GET", f"{REPO}/topics"),
+    Endpoint("replace_topics", "PUT", f"{REPO}/topics"),
+    Endpoint("traffic", "GET", f"{REPO}/traffic/{{kind}}"),
+    Endpoint("traffic_referrers", "GET", f"{REPO}/traffic/popular/referrers"),
+    Endpoint("traffic_paths", "GET", f"{REPO}/traffic/popular/paths"),
+    Endpoint("stats", "GET", f"{REPO}/stats/{{kind}}"),
+    Endpoint("tree", "GET", f"{REPO}/git/trees/{{+tree_sha}}"),
+    Endpoint("blob", "GET", f"{REPO}/git/blobs/{{blob_sha}}", media="application/vnd.github.raw", stream=True),
+])
@@ -0,0 +1,169 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import (
+    Any, 
+    Callable, 
+    Dict, 
+    Hashable, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Set, 
+    Tuple
+)
+
+import heapq
+import itertools
+
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+
+
+class Task:
+    """
+    A unit of work for :class:`TaskScheduler`. Lower ``priority`` values 
+    run first; ``after`` lists the keys of tasks that must finish first.
+    """
+    def __init__(
+        self, 
+        key: Hashable, 
+        function: Callable[..., Any], 
+        args: tuple = (), 
+        priority: int = 0, 
+        after: Iterable[Hashable] = ()
+    ) -> None:
+        self.key = key
+        self.function = function
+        self.args = args
+        self.priority = priority
+        self.after = set(after)
+
+
+    def __repr__(self) -> str:
+        return f"Task(key={self.key}, priority={self.priority})"
+
+
+class TaskResult:
+    """
+    The outcome of a :class:`Task`: its return value, or the error.
+    """
+    def __init__(self, task: Task, value: Any = None, error: Optional[Exception] = None) -> None:
+        self.task = task
+        self.value = value
+        self.error = error
+
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+    def __repr__(self) -> str:
+        return f"TaskResult(key={self.task.key}, ok={self.ok})"
+
+
+class TaskScheduler:
+    """
+    Runs a dynamic DAG of tasks on a thread pool.
+
+    Ready tasks are started in priority order, never more than ``workers``
+    at a time. :meth:`run` yields each :class:`TaskResult` as it completes;
+    the consumer may :meth:`add` more tasks while iterating, so a task's 
+    result can fan out into new work. A task whose dependency failed is 
+    skipped and yielded as a failed result with the dependency's error, 
+    as are the tasks waiting on it in turn.
+    """
+    def __init__(self, workers: int = 16) -> None:
+        self.workers = workers
+        self._ready: List[Tuple[int, int, Task]] = []
+        self._waiting: Dict[Hashable, Task] = {}
+        self._done: Set[Hashable] = set()
+        self._failed: Dict[Hashable, Exception] = {}
+        self._skipped: List[TaskResult] = []
+        self._order = itertools.count()
+
+
+    def add(self, task: Task) -> None:
+        for key in task.after:
+            if key in self._failed:
+                self._skip(task, self._failed[key])
+                return
+        task.after -= self._done
+        if task.after:
+            self._waiting[task.key] = task
+        else:
+            heapq.heappush(self._ready, (task.priority, next(self._order), task))
+
+
+    def _skip(self, task: Task, error: Exception) -> None:
+        self._failed[task.key] = error
+        self._skipped.append(TaskResult(task, error=error))
+
+
+    def _finish(self, key: Hashable, error: Optional[Exception]) -> None:
+        if error is None:
+            self._done.add(key)
+            for task in list(self._waiting.values()):
+                if key in task.after:
+                    task.after.discard(key)
+                    if not task.after:
+                        del self._waiting[task.key]
+                        heapq.heappush(self._ready, (task.priority, next(self._order), task))
+            return
+        self._failed[key] = error
+        failed = [key]
+        while failed:
+            key = failed.pop()
+            for task in list(self._waiting.values()):
+                if key in task.after:
+                    del self._waiting[task.key]
+                    self._skip(task, error)
+                    failed.append(task.key)
+
+
+    def run(self) -> Iterator[TaskResult]:
+        executor = ContextThreadPoolExecutor(max_workers=self.workers)
+        running: Dict[Future, Task] = {}
+        try:
+            while self._ready or running or self._skipped:
+                while self._skipped:
+                    yield self._skipped.pop(0)
+                if not self._ready and not running:
+                    continue
+                while self._ready and len(running) < self.workers:
+                    _, _, task = heapq.heappop(self._ready)
+                    running[executor.submit(task.function, *task.args)] = task
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    error = future.exception()
+                    self._finish(task.key, error)
+                    yield TaskResult(task, None if error else future.result(), error)
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
@@ -0,0 +1,243 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any, 
+    Callable, 
+    Dict, 
+    Hashable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Sequence, 
+    Set, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+import math
+
+from pyGithub.repository import Repository
+from pyGithub.issue import Issue
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+from pyGithub.ext.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+# A shard maps a qualifier to an inclusive (low, high) range; a high of
+# None is open-ended.
+Shard = Dict[str, Tuple[Any, Any]]
+Task = Tuple[Callable[..., Tuple[List[dict], List[Any]]], tuple]
+
+GITHUB_EPOCH = datetime(2008, 1, 1, tzinfo=timezone.utc)
+DATE_QUALIFIERS = ("created", "updated", "pushed")
+
+
+def _format_range(qualifier: str, low: Any, high: Any) -> str:
+    if qualifier in DATE_QUALIFIERS:
+        return f"{qualifier}:{low.isoformat()}..{high.isoformat()}"
+    if high is None:
+        return f"{qualifier}:>={low}"
+    return f"{qualifier}:{low}..{high}"
+
+
+def _split_range(qualifier: str, low: Any, high: Any) -> Optional[Tuple[Tuple[Any, Any], Tuple[Any, Any]]]:
+    if qualifier in DATE_QUALIFIERS:
+        seconds = int((high - low).total_seconds())
+        if seconds < 1:
+            return None
+        middle = low + timedelta(seconds=seconds // 2)
+        return (low, middle), (middle + timedelta(seconds=1), high)
+    if high is None:
+        middle = max(low * 2, low + 1)
+    elif high > low:
+        middle = (low + high) // 2
+    else:
+        return None
+    return (low, middle), (middle + 1, high)
+
+
+class SearchEngine:
+    """
+    Search for repositories, issues and code past the 1,000 result cap.
+
+    When a query matches more results than the API will return, it is
+    split into disjoint ranges of a qualifier (for example ``created`` or
+    ``stars``) and each half is probed again until every shard fits under
+    the cap. Shards and their pages are fetched concurrently, paced by a
+    token bucket per search quota (code search has its own, smaller one),
+    and results are streamed as they arrive with duplicates removed. 
+    Ordering across shards is not preserved.
+    """
+    CAP = 1000
+    PER_PAGE = 100
+    DIMENSIONS: Dict[str, Sequence[str]] = {
+        "repositories": ("created", "stars", "size"),
+        "issues": ("created", "comments"),
+        "code": ("size",),
+    }
+    # Requests per minute of each rate-limit resource, with and without a token.
+    RATES: Dict[str, Tuple[int, int]] = {
+        "search": (30, 10),
+        "code_search": (10, 10),
+    }
+
+    def __init__(
+        self, 
+        http: Http, 
+        token: Optional[str] = None, 
+        workers: int = 4, 
+        buckets: Optional[Dict[str, TokenBucket]] = None
+    ) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+        self.buckets: Dict[str, TokenBucket] = {
+            resource: TokenBucket(authenticated if token else anonymous, 60.0)
+            for resource, (authenticated, anonymous) in self.RATES.items()
+        }
+        self.buckets.update(buckets or {})
+
+
+    def repositories(self, query: str, **kwargs: Any) -> Iterator[Repository]:
+        for item in self.stream("repositories", query, **kwargs):
+            yield Repository(item, http=self.http, token=self.token)
+
+
+    def issues(self, query: str, **kwargs: Any) -> Iterator[Issue]:
+        for item in self.stream("issues", query, **kwargs):
+            yield Issue(item, http=self.http, token=self.token)
+
+
+    def code(self, query: str, **kwargs: Any) -> Iterator[dict]:
+        return self.stream("code", query, **kwargs)
+
+
+    def stream(
+        self, 
+        kind: str, 
+        query: str, 
+        dimensions: Optional[Sequence[str]] = None, 
+        sort: Optional[str] = None, 
+        order: Optional[str] = None
+    ) -> Iterator[dict]:
+        """
+        Yields every raw search item for ``query``, sharding as needed.
+        Qualifiers already present in ``query`` are never sharded on.
+        """
+        dimensions = [
+            qualifier
+            for qualifier in (dimensions or self.DIMENSIONS.get(kind, ()))
+            if f"{qualifier}:" not in query
+        ]
+        shard: Shard = {}
+        for qualifier in dimensions:
+            if qualifier in DATE_QUALIFIERS:
+                now = datetime.now(timezone.utc).replace(microsecond=0)
+                shard[qualifier] = (GITHUB_EPOCH, now)
+            else:
+                shard[qualifier] = (0, None)
+        options = {"sort": sort, "order": order}
+
+        seen: Set[Hashable] = set()
+        executor = ContextThreadPoolExecutor(max_workers=self.workers)
+        pending: Set[Future] = {executor.submit(self._probe, kind, query, {}, shard, dimensions, options)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    items, tasks = future.result()
+                    for function, args in tasks:
+                        pending.add(executor.submit(function, *args))
+                    for item in items:
+                        key = self._key(item)
+                        if key not in seen:
+                            seen.add(key)
+                            yield item
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+
+    def _fetch(self, kind: str, query: str, page: int, options: Dict[str, Any]) -> dict:
+        self.buckets["code_search" if kind == "code" else "search"].acquire()
+        return self.http.search(
+            kind=kind, 
+            query=query, 
+            token=self.token, 
+            page=page, 
+            per_page=self.PER_PAGE, 
+            **options
+        )
+
+
+    def _page(self, kind: str, query: str, page: int, options: Dict[str, Any]) -> Tuple[List[dict], List[Task]]:
+        return self._fetch(kind, query, page, options).get("items", []), []
+
+
+    def _probe(
+        self, 
+        kind: str, 
+        query: str, 
+        fixed: Shard, 
+        shard: Shard, 
+        dimensions: List[str], 
+        options: Dict[str, Any]
+    ) -> Tuple[List[dict], List[Task]]:
+        qualified = " ".join([query] + [_format_range(q, *fixed[q]) for q in fixed])
+        data = self._fetch(kind, qualified, 1, options)
+        total = data.get("total_count", 0)
+        tasks: List[Task] = []
+
+        if total > self.CAP:
+            for qualifier in dimensions:
+                if qualifier not in shard:
+                    continue
+                halves = _split_range(qualifier, *shard[qualifier])
+                if halves is None:
+                    continue
+                for half in halves:
+                    tasks.append((
+                        self._probe, 
+                        (kind, query, {**fixed, qualifier: half}, {**shard, qualifier: half}, dimensions, options)
+                    ))
+                return data.get("items", []), tasks
+
+        pages = math.ceil(min(total, self.CAP) / self.PER_PAGE)
+        for page in range(2, pages + 1):
+            tasks.append((self._page, (kind, qualified, page, options)))
+        return data.get("items", []), tasks
+
+
+    @staticmethod
+    def _key(item: dict) -> Hashable:
+        if item.get("id") is not None:
+            return item["id"]
+        return ((item.get("repository") or {}).get("full_name"), item.get("path"), item.get("sha"))
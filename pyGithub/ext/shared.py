@@ -0,0 +1,232 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator, Mapping, Optional
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from pyGithub.ext import deadline as deadlines
+from pyGithub.ext.cache import CachedResponse, ResponseCache
+from pyGithub.ext.ratelimit import RateLimit, RateLimiter
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    links TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored REAL NOT NULL,
+    used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_used ON responses (used);
+CREATE TABLE IF NOT EXISTS limits (
+    resource TEXT PRIMARY KEY,
+    "limit" INTEGER NOT NULL,
+    remaining INTEGER NOT NULL,
+    reset REAL NOT NULL
+);
+"""
+
+
+class SharedState:
+    """
+    Response cache and rate-limit counters kept in a local SQLite file,
+    so that every process on a host that opens the same ``path`` shares
+    cache hits and draws from one quota estimate.
+
+    The database runs in WAL mode; each thread of each process opens its
+    own connection on first use. Instances pickle as their configuration
+    and reconnect in the receiving process.
+    """
+    def __init__(self, path: str, maxsize: int = 4096, timeout: float = 30.0) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._local = threading.local()
+        self.cache: SharedResponseCache = SharedResponseCache(self)
+        self.rate_limits: SharedRateLimiter = SharedRateLimiter(self)
+        self.connection().executescript(SCHEMA)
+
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        The calling thread's connection, reopened after a ``fork``.
+        """
+        pid, connection = getattr(self._local, "connection", (None, None))
+        if connection is None or pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = (os.getpid(), connection)
+        return connection
+
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs the block under SQLite's write lock, which serialises it
+        against every other thread and process using the file.
+        """
+        connection = self.connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": self.path, "maxsize": self.maxsize, "timeout": self.timeout}
+
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+
+    def __repr__(self) -> str:
+        return f"SharedState(path={self.path})"
+
+
+class SharedResponseCache(ResponseCache):
+    """
+    :class:`ResponseCache` backed by a :class:`SharedState` file. Keys are
+    stored as SHA-256 digests, so tokens never reach the disk.
+    """
+    def __init__(self, state: SharedState) -> None:
+        self.state = state
+        self.maxsize = state.maxsize
+
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        return hashlib.sha256(json.dumps(key, default=str).encode("utf-8")).hexdigest()
+
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        digest = self._digest(key)
+        connection = self.state.connection()
+        row = connection.execute(
+            "SELECT data, links, etag, last_modified, stored FROM responses WHERE key = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        connection.execute("UPDATE responses SET used = ? WHERE key = ?", (time.time(), digest))
+        data, links, etag, last_modified, stored = row
+        return CachedResponse(json.loads(data), json.loads(links), etag, last_modified, stored)
+
+
+    def set(self, key: Hashable, entry: CachedResponse) -> None:
+        with self.state.transaction() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, data, links, etag, last_modified, stored, used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._digest(key), 
+                    json.dumps(entry.data), 
+                    json.dumps(entry.links), 
+                    entry.etag, 
+                    entry.last_modified, 
+                    entry.stored, 
+                    time.time()
+                )
+            )
+            (count,) = connection.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if count > self.maxsize:
+                connection.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY used LIMIT ?)",
+                    (count - self.maxsize,)
+                )
+
+
+    def delete(self, key: Hashable) -> None:
+        with self.state.transaction() as connection:
+            connection.execute("DELETE FROM responses WHERE key = ?", (self._digest(key),))
+
+
+    def clear(self) -> None:
+        with self.state.transaction() as connection:
+            connection.execute("DELETE FROM responses")
+
+
+    def __len__(self) -> int:
+        (count,) = self.state.connection().execute("SELECT COUNT(*) FROM responses").fetchone()
+        return count
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    :class:`RateLimiter` backed by a :class:`SharedState` file. A
+    reservation made by :meth:`wait` is visible to every process at once.
+    """
+    def __init__(self, state: SharedState) -> None:
+        self.state = state
+
+
+    def get(self, resource: str) -> Optional[RateLimit]:
+        row = self.state.connection().execute(
+            'SELECT "limit", remaining, reset FROM limits WHERE resource = ?', (resource,)
+        ).fetchone()
+        return RateLimit(resource, *row) if row is not None else None
+
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        limit = RateLimit.from_headers(headers)
+        if limit is not None:
+            with self.state.transaction() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO limits VALUES (?, ?, ?, ?)",
+                    (limit.resource, limit.limit, limit.remaining, limit.reset)
+                )
+
+
+    def wait(self, resource: Optional[str]) -> None:
+        if not resource:
+            return
+        while True:
+            with self.state.transaction() as connection:
+                row = connection.execute(
+                    "SELECT remaining, reset FROM limits WHERE resource = ?", (resource,)
+                ).fetchone()
+                if row is None:
+                    return
+                remaining, reset = row
+                delay = reset - time.time()
+                if remaining > 0 or delay <= 0:
+                    connection.execute(
+                        "UPDATE limits SET remaining = remaining - 1 WHERE resource = ?", (resource,)
+                    )
+                    return
+            deadlines.sleep(delay)
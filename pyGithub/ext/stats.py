@@ -0,0 +1,174 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Dict, 
+    Iterable, 
+    List, 
+    Optional, 
+    Sequence, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+import heapq
+import itertools
+import random
+import threading
+import time
+
+from pyGithub.ext.exceptions import Accepted
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+STATS = ("contributors", "commit_activity", "code_frequency", "participation", "punch_card")
+
+
+class _Job:
+    def __init__(self, owner: str, repo_name: str, kind: str, deadline: float) -> None:
+        self.owner = owner
+        self.repo_name = repo_name
+        self.kind = kind
+        self.deadline = deadline
+        self.delay = 0.0
+        self.future: Future = Future()
+
+
+class StatsPoller:
+    """
+    Fetches repository statistics, which GitHub computes in the background
+    and answers with ``202 Accepted`` until they are ready.
+
+    :meth:`request` returns a :class:`~concurrent.futures.Future` at once.
+    Fetches run on a thread pool; a 202 reschedules the job on a single
+    timer thread with exponential back-off (``initial_delay`` doubling up 
+    to ``max_delay``, with jitter), so warming many repositories takes 
+    about as long as the slowest one. A job still pending after ``timeout``
+    seconds fails with :class:`Accepted`.
+    """
+    def __init__(
+        self, 
+        http: Http, 
+        token: Optional[str] = None, 
+        workers: int = 8, 
+        initial_delay: float = 1.0, 
+        max_delay: float = 30.0, 
+        timeout: float = 600.0
+    ) -> None:
+        self.http = http
+        self.token = token
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._timers: List[Tuple[float, int, _Job]] = []
+        self._order = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+
+    def request(self, owner: str, repo_name: str, kind: str) -> Future:
+        if kind not in STATS:
+            raise ValueError(f"Unknown statistics '{kind}'.")
+        job = _Job(owner, repo_name, kind, time.monotonic() + self.timeout)
+        self._executor.submit(self._fetch, job)
+        return job.future
+
+
+    def warm(
+        self, 
+        repos: Iterable[str], 
+        kinds: Sequence[str] = ("contributors", "commit_activity", "code_frequency")
+    ) -> Dict[Tuple[str, str], Future]:
+        """
+        Starts computing ``kinds`` for every ``owner/name`` in ``repos`` and
+        returns their futures keyed by ``(repo, kind)``.
+        """
+        return {
+            (full_name, kind): self.request(*full_name.split("/", 1), kind)
+            for full_name in repos
+            for kind in kinds
+        }
+
+
+    def _fetch(self, job: _Job) -> None:
+        if job.future.done():
+            return
+        try:
+            data = self.http.fetch_stats(
+                owner=job.owner, repo_name=job.repo_name, kind=job.kind, token=self.token
+            )
+        except Accepted as error:
+            if time.monotonic() >= job.deadline:
+                job.future.set_exception(error)
+            else:
+                self._schedule(job)
+        except Exception as error:
+            job.future.set_exception(error)
+        else:
+            job.future.set_result(data if data is not None else [])
+
+
+    def _schedule(self, job: _Job) -> None:
+        job.delay = min(self.max_delay, job.delay * 2 if job.delay else self.initial_delay)
+        due = min(job.deadline, time.monotonic() + job.delay * random.uniform(0.8, 1.2))
+        with self._condition:
+            if self._closed:
+                job.future.cancel()
+                return
+            heapq.heappush(self._timers, (due, next(self._order), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="StatsPoller", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+
+    def _run(self) -> None:
+        with self._condition:
+            while not self._closed:
+                if not self._timers:
+                    self._condition.wait()
+                    continue
+                due, _, job = self._timers[0]
+                delay = due - time.monotonic()
+                if delay > 0:
+                    self._condition.wait(delay)
+                    continue
+                heapq.heappop(self._timers)
+                self._executor.submit(self._fetch, job)
+
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            for _, _, job in self._timers:
+                job.future.cancel()
+            self._timers.clear()
+            self._condition.notify()
+        self._executor.shutdown(wait=False)
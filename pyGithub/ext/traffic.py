@@ -0,0 +1,354 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from array import array
+from concurrent.futures import as_completed
+from datetime import date, datetime
+from typing import (
+    Any, 
+    Callable, 
+    Dict, 
+    Iterable, 
+    List, 
+    Optional, 
+    Set, 
+    Tuple, 
+    TYPE_CHECKING
+)
+
+import bisect
+import json
+import os
+
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+
+if TYPE_CHECKING:
+    from pyGithub.client import Client
+
+
+EPOCH = date(1970, 1, 1).toordinal()
+COLUMNS = ("repo", "day", "count", "uniques")
+METRICS = ("views", "clones")
+
+
+def to_day(value: Any) -> int:
+    """
+    Converts a date, datetime or API timestamp to days since 1970-01-01.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.toordinal() - EPOCH
+
+
+def from_day(day: int) -> date:
+    return date.fromordinal(day + EPOCH)
+
+
+class _Series:
+    """
+    One metric as four parallel int32 columns, with a per-repository 
+    index of rows sorted by day.
+
+    A flush interrupted by a crash can leave the columns at different 
+    lengths; loading truncates every column to the complete rows before
+    the first one whose repository id is not below ``repos``.
+    """
+    def __init__(self, root: str, metric: str, repos: int) -> None:
+        self.paths = {column: os.path.join(root, f"{metric}.{column}") for column in COLUMNS}
+        self.columns: Dict[str, array] = {column: array("i") for column in COLUMNS}
+        for column, path in self.paths.items():
+            if os.path.exists(path):
+                with open(path, "rb") as handle:
+                    data = handle.read()
+                values = self.columns[column]
+                values.frombytes(data[:len(data) - len(data) % values.itemsize])
+        size = min(len(values) for values in self.columns.values())
+        size = next((row for row, repo in enumerate(self.columns["repo"][:size]) if repo >= repos), size)
+        for column, path in self.paths.items():
+            values = self.columns[column]
+            if os.path.exists(path) and os.path.getsize(path) != size * values.itemsize:
+                del values[size:]
+                with open(path, "r+b") as handle:
+                    handle.truncate(size * values.itemsize)
+        self.persisted = size
+        self.dirty: Set[int] = set()
+        self.days: Dict[int, List[int]] = {}
+        self.rows: Dict[int, List[int]] = {}
+        for row, (repo, day) in enumerate(zip(self.columns["repo"], self.columns["day"])):
+            self._index(repo, day, row)
+
+
+    def _index(self, repo: int, day: int, row: int) -> None:
+        days = self.days.setdefault(repo, [])
+        rows = self.rows.setdefault(repo, [])
+        position = bisect.bisect_left(days, day)
+        days.insert(position, day)
+        rows.insert(position, row)
+
+
+    def find(self, repo: int, day: int) -> Optional[int]:
+        days = self.days.get(repo, [])
+        position = bisect.bisect_left(days, day)
+        if position < len(days) and days[position] == day:
+            return self.rows[repo][position]
+        return None
+
+
+    def upsert(self, repo: int, day: int, count: int, uniques: int) -> bool:
+        row = self.find(repo, day)
+        if row is None:
+            row = len(self.columns["day"])
+            for column, value in zip(COLUMNS, (repo, day, count, uniques)):
+                self.columns[column].append(value)
+            self._index(repo, day, row)
+            return True
+        if self.columns["count"][row] == count and self.columns["uniques"][row] == uniques:
+            return False
+        self.columns["count"][row] = count
+        self.columns["uniques"][row] = uniques
+        if row < self.persisted:
+            self.dirty.add(row)
+        return True
+
+
+    def flush(self) -> None:
+        size = len(self.columns["day"])
+        for column, path in self.paths.items():
+            values = self.columns[column]
+            with open(path, "r+b" if os.path.exists(path) else "wb") as handle:
+                for row in sorted(self.dirty):
+                    handle.seek(row * values.itemsize)
+                    handle.write(values[row:row + 1].tobytes())
+                handle.seek(self.persisted * values.itemsize)
+                handle.write(values[self.persisted:size].tobytes())
+        self.persisted = size
+        self.dirty.clear()
+
+
+class TrafficArchive:
+    """
+    Local store for repository traffic, which GitHub only keeps for 14 days.
+
+    Daily ``views`` and ``clones`` are kept as append-only int32 column 
+    files (repository, day, count, uniques). Re-archiving overlapping days
+    is de-duplicated: an unchanged day is skipped and a day whose counts 
+    grew since the last run is corrected in place. Popular referrers and 
+    paths, which are 14-day aggregates rather than series, are appended
+    as daily JSON snapshots.
+
+    Writes are buffered until :meth:`flush`, which saves the repository 
+    list (atomically) before the columns that refer to it, so a crash 
+    mid-flush loses at most the rows being written.
+    """
+    def __init__(self, root: str) -> None:
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self._repos_path = os.path.join(root, "repos.json")
+        self._popular_path = os.path.join(root, "popular.jsonl")
+        self.repos: List[str] = []
+        if os.path.exists(self._repos_path):
+            with open(self._repos_path, "r", encoding="utf-8") as handle:
+                self.repos = json.load(handle)
+        self._repo_ids = {name: index for index, name in enumerate(self.repos)}
+        self._series = {metric: _Series(root, metric, len(self.repos)) for metric in METRICS}
+        self._popular: Dict[Tuple[str, str, int], List[dict]] = {}
+        self._popular_pending: List[dict] = []
+        if os.path.exists(self._popular_path):
+            with open(self._popular_path, "r+b") as handle:
+                complete = 0
+                for line in handle:
+                    if not line.endswith(b"\n"):
+                        # A snapshot cut short by a crash; the next append
+                        # would otherwise be glued to it.
+                        handle.truncate(complete)
+                        break
+                    complete += len(line)
+                    record = json.loads(line)
+                    self._popular[(record["repo"], record["kind"], record["day"])] = record["entries"]
+
+
+    def _repo_id(self, repo: str) -> int:
+        if repo not in self._repo_ids:
+            self._repo_ids[repo] = len(self.repos)
+            self.repos.append(repo)
+        return self._repo_ids[repo]
+
+
+    def merge(self, repo: str, metric: str, points: Iterable[Dict[str, Any]]) -> int:
+        """
+        Merges a ``views`` or ``clones`` payload's daily points for
+        ``repo`` and returns the number of new or corrected days.
+        """
+        series = self._series[metric]
+        repo_id = self._repo_id(repo)
+        return sum(
+            series.upsert(repo_id, to_day(point["timestamp"]), point["count"], point["uniques"])
+            for point in points
+        )
+
+
+    def record_popular(self, repo: str, kind: str, entries: List[dict], day: Optional[int] = None) -> None:
+        day = to_day(date.today()) if day is None else day
+        if self._popular.get((repo, kind, day)) != entries:
+            self._popular[(repo, kind, day)] = entries
+            self._popular_pending.append({"repo": repo, "kind": kind, "day": day, "entries": entries})
+
+
+    def popular(self, repo: str, kind: str) -> Dict[date, List[dict]]:
+        return {
+            from_day(day): entries 
+            for (name, entry_kind, day), entries in sorted(self._popular.items()) 
+            if name == repo and entry_kind == kind
+        }
+
+
+    def series(
+        self, 
+        repo: str, 
+        metric: str = "views", 
+        start: Optional[Any] = None, 
+        end: Optional[Any] = None
+    ) -> Tuple[array, array, array]:
+        """
+        Returns ``(days, counts, uniques)`` for ``repo`` within the 
+        inclusive ``[start, end]`` range, sorted by day.
+        """
+        series = self._series[metric]
+        repo_id = self._repo_ids.get(repo)
+        days = series.days.get(repo_id, [])
+        low = 0 if start is None else bisect.bisect_left(days, to_day(start))
+        high = len(days) if end is None else bisect.bisect_right(days, to_day(end))
+        rows = series.rows.get(repo_id, [])[low:high]
+        counts, uniques = series.columns["count"], series.columns["uniques"]
+        return (
+            array("i", days[low:high]), 
+            array("i", (counts[row] for row in rows)), 
+            array("i", (uniques[row] for row in rows))
+        )
+
+
+    def rollup(
+        self, 
+        metric: str = "views", 
+        start: Optional[Any] = None, 
+        end: Optional[Any] = None, 
+        by: str = "repo", 
+        field: str = "count", 
+        repos: Optional[Iterable[str]] = None
+    ) -> Dict[Any, int]:
+        """
+        Sums ``field`` over ``[start, end]`` grouped ``by`` repo, day,
+        week (ISO Monday) or month, in one pass over the columns.
+        """
+        series = self._series[metric]
+        low = -2 ** 31 if start is None else to_day(start)
+        high = 2 ** 31 - 1 if end is None else to_day(end)
+        wanted = None if repos is None else {self._repo_ids.get(repo) for repo in repos}
+        groups: Dict[str, Callable[[int, int], Any]] = {
+            "repo": lambda repo, day: self.repos[repo],
+            "day": lambda repo, day: from_day(day),
+            "week": lambda repo, day: from_day(day - (day + 3) % 7),
+            "month": lambda repo, day: from_day(day).replace(day=1),
+        }
+        group = groups[by]
+        totals: Dict[Any, int] = {}
+        for repo, day, value in zip(series.columns["repo"], series.columns["day"], series.columns[field]):
+            if low <= day <= high and (wanted is None or repo in wanted):
+                key = group(repo, day)
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+
+    def flush(self) -> None:
+        temporary = f"{self._repos_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            json.dump(self.repos, handle)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, self._repos_path)
+        for series in self._series.values():
+            series.flush()
+        if self._popular_pending:
+            with open(self._popular_path, "a", encoding="utf-8") as handle:
+                for record in self._popular_pending:
+                    handle.write(json.dumps(record) + "\n")
+            self._popular_pending.clear()
+
+
+    def __repr__(self) -> str:
+        return f"TrafficArchive(root={self.root}, repos={len(self.repos)})"
+
+
+class TrafficArchiver:
+    """
+    Fetches views, clones, referrers and paths for many repositories 
+    concurrently and merges them into a :class:`TrafficArchive`.
+
+    Fetches run on ``workers`` threads; merging happens on the calling
+    thread, so the archive has a single writer.
+    """
+    def __init__(self, client: Client, archive: TrafficArchive, workers: int = 16) -> None:
+        self.client = client
+        self.archive = archive
+        self.workers = workers
+
+
+    def archive_org(self, org: str) -> Dict[str, Exception]:
+        return self.archive_repos(repo.full_name for repo in self.client.get_org_repos(org))
+
+
+    def archive_repos(self, repos: Iterable[str]) -> Dict[str, Exception]:
+        """
+        Archives ``owner/name`` repositories and returns the errors by
+        repository (e.g. ``Forbidden`` without push access).
+        """
+        errors: Dict[str, Exception] = {}
+        fetches = {
+            "views": lambda owner, name: self.client.get_traffic(owner, name, kind="views").views,
+            "clones": lambda owner, name: self.client.get_traffic(owner, name, kind="clones").clones,
+            "referrers": self.client.get_traffic_referrers,
+            "paths": self.client.get_traffic_paths,
+        }
+        with ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(fetch, *full_name.split("/", 1)): (full_name, kind)
+                for full_name in repos
+                for kind, fetch in fetches.items()
+            }
+            for future in as_completed(futures):
+                full_name, kind = futures[future]
+                try:
+                    data = future.result()
+                except Exception as error:
+                    errors[full_name] = error
+                    continue
+                if kind in METRICS:
+                    self.archive.merge(full_name, kind, data)
+                else:
+                    self.archive.record_popular(full_name, kind, data)
+        self.archive.flush()
+        return errors
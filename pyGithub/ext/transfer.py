@@ -0,0 +1,534 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from concurrent.futures import as_completed
+from typing import (
+    Any, 
+    BinaryIO, 
+    Callable, 
+    Dict, 
+    Iterable, 
+    Iterator, 
+    List, 
+    Optional, 
+    Set, 
+    Tuple, 
+    Union, 
+    TYPE_CHECKING
+)
+
+import hashlib
+import io
+import json
+import mimetypes
+import mmap
+import os
+import queue
+import random
+import shutil
+import tarfile
+import tempfile
+import threading
+import zipfile
+
+import requests
+import urllib3
+
+from pyGithub.asset import ReleaseAsset
+from pyGithub.release import Release
+from pyGithub.ext import deadline as deadlines
+from pyGithub.ext.http import Route
+from pyGithub.ext.deadline import ContextThreadPoolExecutor
+from pyGithub.ext.uritemplate import expand
+from pyGithub.ext.exceptions import ChecksumMismatch, GitHubError
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+Progress = Callable[[int, int], None]
+
+
+def verify_digest(buffer: Any, digest: Optional[str]) -> None:
+    """
+    Checks ``buffer`` against an ``algorithm:hex`` digest such as the
+    ``sha256:...`` GitHub publishes for release assets.
+    """
+    if not digest:
+        return
+    algorithm, expected = digest.split(":", 1)
+    actual = hashlib.new(algorithm, buffer).hexdigest()
+    if actual != expected.lower():
+        raise ChecksumMismatch(f"Expected {digest}, got {algorithm}:{actual}.")
+
+
+class AssetDownloader:
+    """
+    Downloads release assets straight to disk.
+
+    The target is preallocated as ``<path>.part`` and memory-mapped; the
+    asset is split into ``chunk_size`` HTTP Range requests fetched on 
+    ``workers`` threads, each read directly into its slice of the map, so
+    the body is never buffered. Finished chunks are recorded in 
+    ``<path>.part.json``, and a later call resumes with the missing ones.
+    Size and digest are verified before the file is moved into place.
+    A dropped range is retried up to ``retries`` times, ``backoff`` 
+    seconds apart, doubling after each attempt, with jitter.
+    """
+    CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(
+        self, 
+        http: Http, 
+        token: Optional[str] = None, 
+        workers: int = 4, 
+        chunk_size: int = CHUNK_SIZE, 
+        retries: int = 3, 
+        backoff: float = 0.5
+    ) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.retries = retries
+        self.backoff = backoff
+
+
+    def download(self, asset: ReleaseAsset, path: str, progress: Optional[Progress] = None) -> str:
+        size = asset.size or 0
+        part_path = f"{path}.part"
+        state_path = f"{path}.part.json"
+        identity = {"id": asset.id, "updated_at": asset.updated_at, "size": size, "chunk_size": self.chunk_size}
+        done = self._load_state(state_path, identity) if os.path.exists(part_path) else set()
+
+        if size == 0:
+            open(part_path, "wb").close()
+            verify_digest(b"", asset.digest)
+        else:
+            url, token = self._resolve(asset.url)
+            with open(part_path, "r+b" if os.path.exists(part_path) else "w+b") as handle:
+                handle.truncate(size)
+                with mmap.mmap(handle.fileno(), size) as buffer:
+                    self._fetch_chunks(url, token, buffer, size, done, state_path, identity, progress)
+                    buffer.flush()
+                    try:
+                        verify_digest(buffer, asset.digest)
+                    except ChecksumMismatch:
+                        os.remove(state_path)
+                        raise
+        os.replace(part_path, path)
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return path
+
+
+    def _resolve(self, url: str) -> Tuple[str, Optional[str]]:
+        """
+        Follows the API's redirect to the storage URL once, so the range 
+        requests go straight to storage without credentials.
+        """
+        response = self.http.open(Route('GET', url, self.token), allow_redirects=False)
+        response.close()
+        if response.is_redirect and "Location" in response.headers:
+            return response.headers["Location"], None
+        return url, self.token
+
+
+    def _fetch_chunks(
+        self, 
+        url: str, 
+        token: Optional[str], 
+        buffer: mmap.mmap, 
+        size: int, 
+        done: Set[int], 
+        state_path: str, 
+        identity: Dict[str, Any], 
+        progress: Optional[Progress]
+    ) -> None:
+        chunks = [
+            (index, start, min(start + self.chunk_size, size))
+            for index, start in enumerate(range(0, size, self.chunk_size))
+            if index not in done
+        ]
+        completed = sum(min(self.chunk_size, size - index * self.chunk_size) for index in done)
+        lock = threading.Lock()
+        with ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self._fetch_range, url, token, buffer, start, end, size): (index, end - start)
+                for index, start, end in chunks
+            }
+            for future in as_completed(futures):
+                future.result()
+                index, length = futures[future]
+                with lock:
+                    done.add(index)
+                    completed += length
+                    with open(state_path, "w", encoding="utf-8") as state:
+                        json.dump({**identity, "done": sorted(done)}, state)
+                if progress is not None:
+                    progress(completed, size)
+
+
+    def _fetch_range(
+        self, 
+        url: str, 
+        token: Optional[str], 
+        buffer: mmap.mmap, 
+        start: int, 
+        end: int, 
+        size: int
+    ) -> None:
+        for attempt in range(self.retries + 1):
+            view = memoryview(buffer)[start:end]
+            try:
+                response = self.http.open(
+                    Route('GET', url, token, resource=None), 
+                    headers={"Range": f"bytes={start}-{end - 1}"}
+                )
+                with response:
+                    if response.status_code != 206 and (start, end) != (0, size):
+                        raise GitHubError(f"'{url}' does not support range requests.")
+                    received = 0
+                    while received < len(view):
+                        count = response.raw.readinto(view[received:])
+                        if not count:
+                            raise ConnectionError("Connection closed before the range was complete.")
+                        received += count
+                return
+            except (requests.RequestException, urllib3.exceptions.HTTPError, OSError):
+                # Dropped connections surface from requests while connecting
+                # and from urllib3 (or the socket) while reading the body.
+                if attempt == self.retries:
+                    raise
+            finally:
+                view.release()
+            deadlines.sleep(self.backoff * 2 ** attempt * random.uniform(0.8, 1.2))
+
+
+    @staticmethod
+    def _load_state(state_path: str, identity: Dict[str, Any]) -> Set[int]:
+        try:
+            with open(state_path, "r", encoding="utf-8") as state:
+                data = json.load(state)
+        except (OSError, ValueError):
+            return set()
+        if any(data.get(key) != value for key, value in identity.items()):
+            return set()
+        return set(data.get("done", []))
+
+
+class _UploadBody:
+    """
+    A read-only, length-aware view over an upload source that reports
+    progress as the HTTP layer consumes it. Regular files are 
+    memory-mapped and handed out as slices of the map; other file objects
+    are read in blocks.
+    """
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, source: BinaryIO, progress: Optional[Progress] = None) -> None:
+        self._source = source
+        self._progress = progress
+        self._map: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        self._start = source.tell()
+        source.seek(0, os.SEEK_END)
+        self._length = source.tell() - self._start
+        source.seek(self._start)
+        self._sent = 0
+        try:
+            if self._length:
+                self._map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._map)[self._start:self._start + self._length]
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            self._map = None
+
+
+    def __len__(self) -> int:
+        return self._length
+
+
+    def read(self, size: int = -1) -> Union[bytes, memoryview]:
+        size = max(size, self.BLOCK_SIZE)
+        if self._view is not None:
+            data = self._view[self._sent:self._sent + size]
+        else:
+            data = self._source.read(min(size, self._length - self._sent))
+        self._sent += len(data)
+        if self._progress is not None and len(data):
+            self._progress(self._sent, self._length)
+        return data
+
+
+    def close(self) -> None:
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class AssetUploader:
+    """
+    Uploads release assets from a path or binary file object without
+    loading them into memory.
+
+    The body is streamed with a known ``Content-Length``; regular files 
+    are memory-mapped, so peak memory stays flat regardless of asset size.
+    :meth:`upload_many` runs several uploads concurrently.
+    """
+    def __init__(self, http: Http, token: Optional[str] = None, workers: int = 4) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+
+
+    def upload(
+        self, 
+        release: Release, 
+        source: Union[str, BinaryIO], 
+        name: Optional[str] = None, 
+        label: Optional[str] = None, 
+        content_type: Optional[str] = None, 
+        progress: Optional[Progress] = None
+    ) -> ReleaseAsset:
+        if isinstance(source, str):
+            with open(source, "rb") as handle:
+                return self.upload(release, handle, name or os.path.basename(source), label, content_type, progress)
+        if name is None:
+            name = os.path.basename(getattr(source, "name", "")) 
+            if not name:
+                raise ValueError("A name is required when uploading from a file object.")
+        content_type = content_type or mimetypes.guess_type(name)[0] or "application/octet-stream"
+        body = _UploadBody(source, progress)
+        try:
+            asset_data = self.http.request(
+                Route('POST', expand(release.upload_url, name=name, label=label), self.token),
+                data=body,
+                headers={"Content-Type": content_type, "Content-Length": str(len(body))}
+            )
+        finally:
+            body.close()
+        return ReleaseAsset(asset_data)
+
+
+    def upload_many(
+        self, 
+        release: Release, 
+        sources: Iterable[Union[str, Tuple[BinaryIO, str]]], 
+        progress: Optional[Callable[[str, int, int], None]] = None
+    ) -> List[ReleaseAsset]:
+        """
+        Uploads paths, or ``(file object, name)`` pairs, concurrently. 
+        ``progress`` receives the asset name with each update.
+        """
+        def upload(source: Union[str, Tuple[BinaryIO, str]]) -> ReleaseAsset:
+            handle, name = (source, os.path.basename(source)) if isinstance(source, str) else source
+            report = (lambda sent, total: progress(name, sent, total)) if progress else None
+            return self.upload(release, handle, name=name, progress=report)
+
+        with ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(upload, sources))
+
+
+class _Pipe(io.RawIOBase):
+    """
+    A readable stream fed by a background thread that copies ``source``
+    in ``block_size`` pieces through a bounded queue, so network reads 
+    overlap with decompression and disk writes downstream.
+    """
+    def __init__(self, source: BinaryIO, block_size: int = 256 * 1024, depth: int = 16) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=depth)
+        self._buffer = memoryview(b"")
+        self._error: Optional[BaseException] = None
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._pump, args=(source, block_size), daemon=True)
+        self._thread.start()
+
+
+    def _pump(self, source: BinaryIO, block_size: int) -> None:
+        try:
+            while not self._closed.is_set():
+                block = source.read(block_size)
+                self._put(block)
+                if not block:
+                    return
+        except BaseException as error:
+            self._error = error
+            self._put(b"")
+
+
+    def _put(self, block: bytes) -> None:
+        while not self._closed.is_set():
+            try:
+                self._queue.put(block, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+    def readable(self) -> bool:
+        return True
+
+
+    def readinto(self, target: Any) -> int:
+        if not self._buffer:
+            block = self._queue.get()
+            if not block:
+                self._queue.put(b"")
+                if self._error is not None:
+                    raise self._error
+                return 0
+            self._buffer = memoryview(block)
+        count = min(len(target), len(self._buffer))
+        target[:count] = self._buffer[:count]
+        self._buffer = self._buffer[count:]
+        return count
+
+
+    def close(self) -> None:
+        self._closed.set()
+        super().close()
+
+
+def _safe_path(name: str) -> Optional[str]:
+    """
+    Strips the ``owner-repo-sha/`` prefix GitHub archives wrap everything
+    in, and rejects absolute or escaping member paths.
+    """
+    parts = [part for part in name.replace("\\", "/").split("/") if part not in ("", ".")]
+    if len(parts) < 2 or ".." in parts or os.path.isabs(name):
+        return None
+    return "/".join(parts[1:])
+
+
+class ArchiveDownloader:
+    """
+    Streams repository ``tarball`` / ``zipball`` snapshots.
+
+    Tarballs flow through a pipeline: a reader thread pulls the response
+    body, ``tarfile`` decompresses it in stream mode, and each member is 
+    copied to disk (or yielded) as it is reached, so the archive is never
+    held in memory. Zip archives keep their index at the end, so zipballs
+    are spooled to a temporary file on disk first.
+    """
+    COPY_SIZE = 1024 * 1024
+
+    def __init__(self, http: Http, token: Optional[str] = None, workers: int = 4) -> None:
+        self.http = http
+        self.token = token
+        self.workers = workers
+
+
+    def _open(self, owner: str, repo_name: str, ref: Optional[str], format: str) -> Any:
+        if format not in ("tarball", "zipball"):
+            raise ValueError(f"Unknown archive format '{format}'.")
+        path = f"/repos/{owner}/{repo_name}/{format}" + (f"/{ref}" if ref else "")
+        response = self.http.open(Route('GET', path, self.token), headers={"Accept": "*/*"})
+        response.raw.decode_content = True
+        return response
+
+
+    def _entries(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        ref: Optional[str], 
+        format: str
+    ) -> Iterator[Tuple[str, BinaryIO]]:
+        with self._open(owner, repo_name, ref, format) as response:
+            if format == "tarball":
+                with _Pipe(response.raw) as pipe:
+                    with tarfile.open(fileobj=io.BufferedReader(pipe), mode="r|*") as archive:
+                        for member in archive:
+                            path = _safe_path(member.name)
+                            if path is not None and member.isfile():
+                                yield path, archive.extractfile(member)
+                return
+            with tempfile.TemporaryFile() as spool:
+                shutil.copyfileobj(response.raw, spool, self.COPY_SIZE)
+                spool.seek(0)
+                with zipfile.ZipFile(spool) as archive:
+                    for info in archive.infolist():
+                        path = _safe_path(info.filename)
+                        if path is not None and not info.is_dir():
+                            with archive.open(info) as member:
+                                yield path, member
+
+
+    def members(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        ref: Optional[str] = None, 
+        format: str = "tarball"
+    ) -> Iterator[Tuple[str, bytes]]:
+        """
+        Yields ``(path, content)`` for every file, one member at a time.
+        """
+        for path, member in self._entries(owner, repo_name, ref, format):
+            yield path, member.read()
+
+
+    def extract(
+        self, 
+        owner: str, 
+        repo_name: str, 
+        dest: str, 
+        ref: Optional[str] = None, 
+        format: str = "tarball"
+    ) -> List[str]:
+        """
+        Writes every file under ``dest`` and returns their relative paths.
+        """
+        written: List[str] = []
+        for path, member in self._entries(owner, repo_name, ref, format):
+            target = os.path.join(dest, *path.split("/"))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as handle:
+                shutil.copyfileobj(member, handle, self.COPY_SIZE)
+            written.append(path)
+        return written
+
+
+    def extract_many(
+        self, 
+        repos: Iterable[str], 
+        dest: str, 
+        ref: Optional[str] = None, 
+        format: str = "tarball"
+    ) -> Dict[str, List[str]]:
+        """
+        Extracts several ``owner/name`` repositories concurrently into
+        ``dest/owner/name``.
+        """
+        def extract(full_name: str) -> List[str]:
+            owner, repo_name = full_name.split("/", 1)
+            return self.extract(owner, repo_name, os.path.join(dest, owner, repo_name), ref, format)
+
+        repos = list(repos)
+        with ContextThreadPoolExecutor(max_workers=self.workers) as executor:
+            return dict(zip(repos, executor.map(extract, repos)))
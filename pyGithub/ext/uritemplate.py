@@ -0,0 +1,157 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Union
+from urllib.parse import quote
+
+import re
+
+
+_RESERVED = ":/?#[]@!$&'()*+,;="
+
+# operator: (first, separator, named, if-empty, allow reserved)
+_OPERATORS: Dict[str, Tuple[str, str, bool, str, bool]] = {
+    "":  ("",  ",", False, "",  False),
+    "+": ("",  ",", False, "",  True),
+    "#": ("#", ",", False, "",  True),
+    ".": (".", ".", False, "",  False),
+    "/": ("/", "/", False, "",  False),
+    ";": (";", ";", True,  "",  False),
+    "?": ("?", "&", True,  "=", False),
+    "&": ("&", "&", True,  "=", False),
+}
+
+_EXPRESSION = re.compile(r"\{([^}]*)\}")
+
+
+class _VarSpec:
+    def __init__(self, spec: str) -> None:
+        self.explode = spec.endswith("*")
+        self.prefix = None
+        if self.explode:
+            spec = spec[:-1]
+        elif ":" in spec:
+            spec, prefix = spec.split(":", 1)
+            self.prefix = int(prefix)
+        self.name = spec
+
+
+class _Expression:
+    def __init__(self, body: str) -> None:
+        operator = body[:1] if body[:1] in _OPERATORS and body[:1] != "" else ""
+        self.first, self.sep, self.named, self.ifemp, self.reserved = _OPERATORS[operator]
+        self.varspecs = [_VarSpec(spec) for spec in body[len(operator):].split(",")]
+
+
+    def _quote(self, value: Any) -> str:
+        if isinstance(value, bool):
+            value = str(value).lower()
+        return quote(str(value), safe=_RESERVED if self.reserved else "")
+
+
+    def expand(self, variables: Dict[str, Any]) -> str:
+        parts: List[str] = []
+        for spec in self.varspecs:
+            value = variables.get(spec.name)
+            if value is None or value == [] or value == {}:
+                continue
+            if isinstance(value, (list, tuple)):
+                items = [self._quote(item) for item in value]
+                if spec.explode:
+                    if self.named:
+                        parts.extend(f"{spec.name}={item}" if item else f"{spec.name}{self.ifemp}" for item in items)
+                    else:
+                        parts.extend(items)
+                    continue
+                joined = ",".join(items)
+            elif isinstance(value, dict):
+                pairs = [(self._quote(key), self._quote(item)) for key, item in value.items()]
+                if spec.explode:
+                    parts.extend(f"{key}={item}" for key, item in pairs)
+                    continue
+                joined = ",".join(f"{key},{item}" for key, item in pairs)
+            else:
+                text = str(value).lower() if isinstance(value, bool) else str(value)
+                if spec.prefix is not None:
+                    text = text[:spec.prefix]
+                joined = self._quote(text)
+            if self.named:
+                parts.append(f"{spec.name}={joined}" if joined else f"{spec.name}{self.ifemp}")
+            else:
+                parts.append(joined)
+        if not parts:
+            return ""
+        return self.first + self.sep.join(parts)
+
+
+class URITemplate:
+    """
+    A compiled RFC 6570 URI template, as used by the ``*_url`` fields
+    in GitHub API payloads (for example ``.../branches{/branch}``).
+
+    The template is parsed once; :meth:`expand` only walks the parts.
+    """
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self._parts: List[Union[str, _Expression]] = []
+        position = 0
+        for match in _EXPRESSION.finditer(template):
+            if match.start() > position:
+                self._parts.append(template[position:match.start()])
+            self._parts.append(_Expression(match.group(1)))
+            position = match.end()
+        if position < len(template):
+            self._parts.append(template[position:])
+
+
+    @property
+    def variables(self) -> List[str]:
+        return [
+            spec.name
+            for part in self._parts
+            if isinstance(part, _Expression)
+            for spec in part.varspecs
+        ]
+
+
+    def expand(self, **variables: Any) -> str:
+        return "".join(
+            part if isinstance(part, str) else part.expand(variables)
+            for part in self._parts
+        )
+
+
+    def __repr__(self) -> str:
+        return f"URITemplate(template={self.template})"
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> URITemplate:
+    return URITemplate(template)
+
+
+def expand(template: str, **variables: Any) -> str:
+    return compile_template(template).expand(**variables)
@@ -22,12 +22,32 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from __future__ import annotations
+from typing import List, Optional, TYPE_CHECKING
+
+from pyGithub.user import User
+from pyGithub.label import Label
+from pyGithub.milestone import Milestone
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
 class Issue:
     """
     Represents a GitHub issue or pull request.
     """
-    def __init__(self, issue_data: dict) -> None:
+    def __init__(
+        self, 
+        issue_data: dict, 
+        http: Optional[Http] = None, 
+        token: Optional[str] = None
+    ) -> None:
         self._issue_data = issue_data or {}
+        self._http = http
+        self._token = token
+        self._user: Optional[User] = None
+        self._assignees: Optional[List[User]] = None
 
 
     @property
@@ -55,6 +75,47 @@ class Issue:
         return self._issue_data.get("state")
 
 
+    @property
+    def locked(self) -> bool:
+        return self._issue_data.get("locked", False)
+
+
+    @property
+    def comments(self) -> int:
+        return self._issue_data.get("comments", 0)
+
+
+    @property
+    def is_pull_request(self) -> bool:
+        return "pull_request" in self._issue_data
+
+
+    @property
+    def labels(self) -> List[Label]:
+        return [Label(label) for label in self._issue_data.get("labels", [])]
+
+
+    @property
+    def label_names(self) -> List[str]:
+        return [label.get("name") for label in self._issue_data.get("labels", [])]
+
+
+    @property
+    def assignees(self) -> List[User]:
+        if self._assignees is None:
+            self._assignees = [
+                User(assignee, http=self._http, token=self._token, completed=False)
+                for assignee in self._issue_data.get("assignees") or []
+            ]
+        return self._assignees
+
+
+    @property
+    def milestone(self) -> Optional[Milestone]:
+        milestone = self._issue_data.get("milestone")
+        return Milestone(milestone) if milestone else None
+
+
     @property
     def created_at(self) -> str:
         return self._issue_data.get("created_at")
@@ -66,8 +127,15 @@ class Issue:
 
 
     @property
-    def user(self) -> dict:
-        return self._issue_data.get("user")
+    def closed_at(self) -> Optional[str]:
+        return self._issue_data.get("closed_at")
+
+
+    @property
+    def user(self) -> Optional[User]:
+        if self._user is None and self._issue_data.get("user") is not None:
+            self._user = User(self._issue_data["user"], http=self._http, token=self._token, completed=False)
+        return self._user
 
 
     @property
@@ -75,4 +143,4 @@ class Issue:
         return self._issue_data.get("html_url")
 
     def __repr__(self) -> str:
-        return f"Issue(title={self.title}, state={self.state}, user={self.user.get('login') if self.user else None})"
\ No newline at end of file
+        return f"Issue(title={self.title}, state={self.state}, user={self.user.login if self.user else None})"
\ No newline at end of file
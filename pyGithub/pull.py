@@ -0,0 +1,326 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from typing import List, Optional, TYPE_CHECKING
+
+from pyGithub.user import User
+from pyGithub.issue import Issue
+from pyGithub.comment import IssueComment
+from pyGithub.commit import CommitFile
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
+def _parse(moment: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(moment.replace("Z", "+00:00")) if moment else None
+
+
+class PullRequest(Issue):
+    """
+    Represents a GitHub pull request.
+
+    Size fields (``additions``, ``deletions``, ``changed_files``) are only
+    present on pull requests fetched one by one, not on listings.
+    """
+    @property
+    def draft(self) -> bool:
+        return self._issue_data.get("draft", False)
+
+
+    @property
+    def merged(self) -> bool:
+        return self._issue_data.get("merged", self.merged_at is not None)
+
+
+    @property
+    def merged_at(self) -> Optional[str]:
+        return self._issue_data.get("merged_at")
+
+
+    @property
+    def merge_commit_sha(self) -> Optional[str]:
+        return self._issue_data.get("merge_commit_sha")
+
+
+    @property
+    def head_ref(self) -> str:
+        return (self._issue_data.get("head") or {}).get("ref")
+
+
+    @property
+    def head_sha(self) -> str:
+        return (self._issue_data.get("head") or {}).get("sha")
+
+
+    @property
+    def base_ref(self) -> str:
+        return (self._issue_data.get("base") or {}).get("ref")
+
+
+    @property
+    def requested_reviewers(self) -> List[User]:
+        return [
+            User(reviewer, http=self._http, token=self._token, completed=False)
+            for reviewer in self._issue_data.get("requested_reviewers") or []
+        ]
+
+
+    @property
+    def additions(self) -> Optional[int]:
+        return self._issue_data.get("additions")
+
+
+    @property
+    def deletions(self) -> Optional[int]:
+        return self._issue_data.get("deletions")
+
+
+    @property
+    def changed_files(self) -> Optional[int]:
+        return self._issue_data.get("changed_files")
+
+
+    @property
+    def is_pull_request(self) -> bool:
+        return True
+
+
+    def __repr__(self) -> str:
+        return f"PullRequest(number={self.number}, title={self.title}, state={self.state})"
+
+
+class Review:
+    """
+    Represents a review submitted on a pull request.
+    """
+    def __init__(
+        self, 
+        review_data: dict, 
+        http: Optional[Http] = None, 
+        token: Optional[str] = None
+    ) -> None:
+        self._review_data = review_data or {}
+        self._http = http
+        self._token = token
+        self._user: Optional[User] = None
+
+
+    @property
+    def id(self) -> int:
+        return self._review_data.get("id")
+
+
+    @property
+    def user(self) -> Optional[User]:
+        if self._user is None and self._review_data.get("user") is not None:
+            self._user = User(self._review_data["user"], http=self._http, token=self._token, completed=False)
+        return self._user
+
+
+    @property
+    def state(self) -> str:
+        """
+        ``APPROVED``, ``CHANGES_REQUESTED``, ``COMMENTED``, ``DISMISSED``
+        or ``PENDING``.
+        """
+        return self._review_data.get("state")
+
+
+    @property
+    def body(self) -> str:
+        return self._review_data.get("body")
+
+
+    @property
+    def commit_id(self) -> str:
+        return self._review_data.get("commit_id")
+
+
+    @property
+    def submitted_at(self) -> Optional[str]:
+        return self._review_data.get("submitted_at")
+
+
+    @property
+    def html_url(self) -> str:
+        return self._review_data.get("html_url")
+
+
+    def __repr__(self) -> str:
+        return f"Review(id={self.id}, state={self.state}, user={self.user.login if self.user else None})"
+
+
+class ReviewComment(IssueComment):
+    """
+    Represents a comment on a line of a pull request's diff.
+    """
+    @property
+    def path(self) -> str:
+        return self._comment_data.get("path")
+
+
+    @property
+    def line(self) -> Optional[int]:
+        return self._comment_data.get("line")
+
+
+    @property
+    def commit_id(self) -> str:
+        return self._comment_data.get("commit_id")
+
+
+    @property
+    def diff_hunk(self) -> str:
+        return self._comment_data.get("diff_hunk")
+
+
+    @property
+    def in_reply_to_id(self) -> Optional[int]:
+        return self._comment_data.get("in_reply_to_id")
+
+
+    @property
+    def pull_request_review_id(self) -> Optional[int]:
+        return self._comment_data.get("pull_request_review_id")
+
+
+    def __repr__(self) -> str:
+        return f"ReviewComment(id={self.id}, path={self.path}, user={self.user.login if self.user else None})"
+
+
+class CheckRun:
+    """
+    Represents a check run reported on a commit.
+    """
+    def __init__(self, check_data: dict) -> None:
+        self._check_data = check_data or {}
+
+
+    @property
+    def id(self) -> int:
+        return self._check_data.get("id")
+
+
+    @property
+    def name(self) -> str:
+        return self._check_data.get("name")
+
+
+    @property
+    def status(self) -> str:
+        return self._check_data.get("status")
+
+
+    @property
+    def conclusion(self) -> Optional[str]:
+        return self._check_data.get("conclusion")
+
+
+    @property
+    def started_at(self) -> Optional[str]:
+        return self._check_data.get("started_at")
+
+
+    @property
+    def completed_at(self) -> Optional[str]:
+        return self._check_data.get("completed_at")
+
+
+    @property
+    def app(self) -> Optional[str]:
+        return (self._check_data.get("app") or {}).get("slug")
+
+
+    @property
+    def html_url(self) -> str:
+        return self._check_data.get("html_url")
+
+
+    def __repr__(self) -> str:
+        return f"CheckRun(name={self.name}, status={self.status}, conclusion={self.conclusion})"
+
+
+class PullRequestBundle:
+    """
+    A pull request together with its reviews, review comments, changed 
+    files and the check runs of its head commit. Parts that were not 
+    requested are empty.
+    """
+    def __init__(
+        self, 
+        pull: PullRequest, 
+        reviews: Optional[List[Review]] = None, 
+        comments: Optional[List[ReviewComment]] = None, 
+        files: Optional[List[CommitFile]] = None, 
+        checks: Optional[List[CheckRun]] = None
+    ) -> None:
+        self.pull = pull
+        self.reviews = reviews or []
+        self.comments = comments or []
+        self.files = files or []
+        self.checks = checks or []
+
+
+    @property
+    def first_review(self) -> Optional[Review]:
+        """
+        The earliest submitted review by someone other than the author.
+        """
+        author = self.pull.user.login if self.pull.user else None
+        reviews = [
+            review for review in self.reviews 
+            if review.submitted_at and (review.user is None or review.user.login != author)
+        ]
+        return min(reviews, key=lambda review: review.submitted_at, default=None)
+
+
+    @property
+    def time_to_first_review(self) -> Optional[float]:
+        """
+        Seconds from opening the pull request to its first review.
+        """
+        review = self.first_review
+        if review is None or not self.pull.created_at:
+            return None
+        return (_parse(review.submitted_at) - _parse(self.pull.created_at)).total_seconds()
+
+
+    @property
+    def approvals(self) -> List[Review]:
+        return [review for review in self.reviews if review.state == "APPROVED"]
+
+
+    @property
+    def checks_passed(self) -> bool:
+        return all(check.conclusion in ("success", "neutral", "skipped") for check in self.checks)
+
+
+    def __repr__(self) -> str:
+        return (
+            f"PullRequestBundle(number={self.pull.number}, reviews={len(self.reviews)}, "
+            f"comments={len(self.comments)}, files={len(self.files)}, checks={len(self.checks)})"
+        )
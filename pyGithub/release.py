@@ -22,6 +22,12 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from __future__ import annotations
+from typing import List
+
+from pyGithub.asset import ReleaseAsset
+
+
 class Release:
     """
     Represents a GitHub release.
@@ -55,5 +61,40 @@ class Release:
         return self._release_data.get("published_at")
 
 
+    @property
+    def draft(self) -> bool:
+        return self._release_data.get("draft")
+
+
+    @property
+    def prerelease(self) -> bool:
+        return self._release_data.get("prerelease")
+
+
+    @property
+    def url(self) -> str:
+        return self._release_data.get("url")
+
+
+    @property
+    def html_url(self) -> str:
+        return self._release_data.get("html_url")
+
+
+    @property
+    def assets_url(self) -> str:
+        return self._release_data.get("assets_url")
+
+
+    @property
+    def upload_url(self) -> str:
+        return self._release_data.get("upload_url")
+
+
+    @property
+    def assets(self) -> List[ReleaseAsset]:
+        return [ReleaseAsset(asset) for asset in self._release_data.get("assets") or []]
+
+
     def __repr__(self) -> str:
         return f"Release(tag_name={self.tag_name})"
\ No newline at end of file
@@ -22,232 +22,439 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+
+import threading
+
+from pyGithub.user import User
+from pyGithub.issue import Issue
+from pyGithub.pull import PullRequest
+from pyGithub.commit import Commit
+from pyGithub.branch import Branch
+from pyGithub.release import Release
+from pyGithub.milestone import Milestone
+from pyGithub.label import Label
+from pyGithub.event import Event
+from pyGithub.tag import Tag
+from pyGithub.ext.exceptions import GitHubError
+
+if TYPE_CHECKING:
+    from pyGithub.ext.http import Http
+
+
 class Repository:
     """
     Represents a GitHub repository.
+
+    A repository created from a partial payload (``completed=False``) costs
+    nothing until a field that is not already present is read; a single
+    request then fills in the rest, even when threads sharing the handle
+    read at the same time.
+
+    The ``get_*`` methods follow the ``*_url`` templates of the payload
+    through the bound :class:`Http`, sharing its connections and cache.
     """
-    def __init__(self, repo_data: dict) -> None:
+    def __init__(
+        self, 
+        repo_data: dict, 
+        http: Optional[Http] = None, 
+        token: Optional[str] = None, 
+        completed: bool = True
+    ) -> None:
         self._repo_data = repo_data or {}
+        self._http = http
+        self._token = token
+        self._completed = completed or http is None
+        self._lock: Optional[threading.Lock] = None if self._completed else threading.Lock()
+        self._owner: Optional[User] = None
+
+
+    def _get(self, key: str) -> Any:
+        if key not in self._repo_data and not self._completed:
+            with self._lock:
+                if not self._completed:
+                    self._complete()
+        return self._repo_data.get(key)
+
+
+    def _complete(self) -> None:
+        full_name = self._repo_data.get("full_name")
+        if full_name is not None:
+            owner, repo_name = full_name.split("/", 1)
+            repository = self._http.fetch_repo(owner=owner, repo_name=repo_name, token=self._token)
+            self._repo_data = {**self._repo_data, **repository._repo_data}
+            self._owner = None
+        self._completed = True
 
 
     @property
     def id(self) -> int:
-        return self._repo_data.get("id")
+        return self._get("id")
 
 
     @property
     def node_id(self) -> str:
-        return self._repo_data.get("node_id")
+        return self._get("node_id")
 
 
     @property
     def name(self) -> str:
-        return self._repo_data.get("name")
+        return self._get("name")
 
 
     @property
     def full_name(self) -> str:
-        return self._repo_data.get("full_name")
+        return self._get("full_name")
 
 
     @property
-    def owner(self) -> dict:
-        return self._repo_data.get("owner")
+    def owner(self) -> Optional[User]:
+        if self._owner is None:
+            owner_data = self._get("owner")
+            if owner_data is not None:
+                self._owner = User(owner_data, http=self._http, token=self._token, completed=False)
+        return self._owner
 
 
     @property
     def html_url(self) -> str:
-        return self._repo_data.get("html_url")
+        return self._get("html_url")
 
 
     @property
     def description(self) -> str:
-        return self._repo_data.get("description")
+        return self._get("description")
 
 
     @property
     def fork(self) -> bool:
-        return self._repo_data.get("fork")
+        return self._get("fork")
 
 
     @property
     def url(self) -> str:
-        return self._repo_data.get("url")
+        return self._get("url")
 
 
     @property
     def forks_url(self) -> str:
-        return self._repo_data.get("forks_url")
+        return self._get("forks_url")
 
 
     @property
     def keys_url(self) -> str:
-        return self._repo_data.get("keys_url")
+        return self._get("keys_url")
 
 
     @property
     def collaborators_url(self) -> str:
-        return self._repo_data.get("collaborators_url")
+        return self._get("collaborators_url")
 
 
     @property
     def teams_url(self) -> str:
-        return self._repo_data.get("teams_url")
+        return self._get("teams_url")
 
 
     @property
     def hooks_url(self) -> str:
-        return self._repo_data.get("hooks_url")
+        return self._get("hooks_url")
 
 
     @property
     def issue_events_url(self) -> str:
-        return self._repo_data.get("issue_events_url")
+        return self._get("issue_events_url")
 
 
     @property
     def events_url(self) -> str:
-        return self._repo_data.get("events_url")
+        return self._get("events_url")
 
 
     @property
     def assignees_url(self) -> str:
-        return self._repo_data.get("assignees_url")
+        return self._get("assignees_url")
 
 
     @property
     def branches_url(self) -> str:
-        return self._repo_data.get("branches_url")
+        return self._get("branches_url")
 
 
     @property
     def tags_url(self) -> str:
-        return self._repo_data.get("tags_url")
+        return self._get("tags_url")
 
 
     @property
     def blobs_url(self) -> str:
-        return self._repo_data.get("blobs_url")
+        return self._get("blobs_url")
 
 
     @property
     def git_tags_url(self) -> str:
-        return self._repo_data.get("git_tags_url")
+        return self._get("git_tags_url")
 
 
     @property
     def git_refs_url(self) -> str:
-        return self._repo_data.get("git_refs_url")
+        return self._get("git_refs_url")
 
 
     @property
     def trees_url(self) -> str:
-        return self._repo_data.get("trees_url")
+        return self._get("trees_url")
 
 
     @property
     def statuses_url(self) -> str:
-        return self._repo_data.get("statuses_url")
+        return self._get("statuses_url")
 
 
     @property
     def languages_url(self) -> str:
-        return self._repo_data.get("languages_url")
+        return self._get("languages_url")
+
+
+    @property
+    def contributors_url(self) -> str:
+        return self._get("contributors_url")
+
+
+    @property
+    def issues_url(self) -> str:
+        return self._get("issues_url")
+
+
+    @property
+    def pulls_url(self) -> str:
+        return self._get("pulls_url")
+
+
+    @property
+    def commits_url(self) -> str:
+        return self._get("commits_url")
+
+
+    @property
+    def releases_url(self) -> str:
+        return self._get("releases_url")
+
+
+    @property
+    def labels_url(self) -> str:
+        return self._get("labels_url")
+
+
+    @property
+    def milestones_url(self) -> str:
+        return self._get("milestones_url")
+
+
+    @property
+    def stargazers_url(self) -> str:
+        return self._get("stargazers_url")
 
 
     @property
     def stargazers_count(self) -> int:
-        return self._repo_data.get("stargazers_count")
+        return self._get("stargazers_count")
 
 
     @property
     def watchers_count(self) -> int:
-        return self._repo_data.get("watchers_count")
+        return self._get("watchers_count")
 
 
     @property
     def size(self) -> int:
-        return self._repo_data.get("size")
+        return self._get("size")
 
 
     @property
     def default_branch(self) -> str:
-        return self._repo_data.get("default_branch")
+        return self._get("default_branch")
 
 
     @property
     def open_issues_count(self) -> int:
-        return self._repo_data.get("open_issues_count")
+        return self._get("open_issues_count")
 
 
     @property
     def is_template(self) -> bool:
-        return self._repo_data.get("is_template")
+        return self._get("is_template")
 
 
     @property
     def topics(self) -> list:
-        return self._repo_data.get("topics")
+        return self._get("topics")
 
 
     @property
     def has_issues(self) -> bool:
-        return self._repo_data.get("has_issues")
+        return self._get("has_issues")
 
 
     @property
     def has_projects(self) -> bool:
-        return self._repo_data.get("has_projects")
+        return self._get("has_projects")
 
 
     @property
     def has_wiki(self) -> bool:
-        return self._repo_data.get("has_wiki")
+        return self._get("has_wiki")
 
 
     @property
     def has_pages(self) -> bool:
-        return self._repo_data.get("has_pages")
+        return self._get("has_pages")
 
 
     @property
     def has_downloads(self) -> bool:
-        return self._repo_data.get("has_downloads")
+        return self._get("has_downloads")
 
 
     @property
     def archived(self) -> bool:
-        return self._repo_data.get("archived")
+        return self._get("archived")
 
 
     @property
     def disabled(self) -> bool:
-        return self._repo_data.get("disabled")
+        return self._get("disabled")
 
 
     @property
     def visibility(self) -> str:
-        return self._repo_data.get("visibility")
+        return self._get("visibility")
 
 
     @property
     def created_at(self) -> str:
-        return self._repo_data.get("created_at")
+        return self._get("created_at")
 
 
     @property
     def updated_at(self) -> str:
-        return self._repo_data.get("updated_at")
+        return self._get("updated_at")
 
 
     @property
     def pushed_at(self) -> str:
-        return self._repo_data.get("pushed_at")
+        return self._get("pushed_at")
 
 
     @property
     def homepage(self) -> str:
-        return self._repo_data.get("homepage")
+        return self._get("homepage")
+
+    def _template(self, key: str, path: str) -> str:
+        if self._http is None:
+            raise GitHubError("Repository is not bound to a client.")
+        template = self._repo_data.get(key)
+        if template is None:
+            template = f"{self._http.base}/repos/{self._repo_data.get('full_name')}{path}"
+        return template
+
+
+    def _follow(self, key: str, path: str, **variables: Any) -> Iterator[Any]:
+        return self._http.follow(self._template(key, path), token=self._token, **variables)
+
+
+    def _fetch(self, key: str, path: str, **variables: Any) -> Any:
+        return self._http.fetch_url(self._template(key, path), token=self._token, **variables)
+
+
+    def get_branches(self) -> List[Branch]:
+        return [Branch(branch) for branch in self._follow("branches_url", "/branches{/branch}")]
+
+
+    def get_branch(self, branch: str) -> Branch:
+        return Branch(self._fetch("branches_url", "/branches{/branch}", branch=branch))
+
+
+    def get_tags(self) -> List[Tag]:
+        return [Tag(tag) for tag in self._follow("tags_url", "/tags")]
+
+
+    def get_contributors(self) -> List[User]:
+        return [
+            User(contributor, http=self._http, token=self._token, completed=False)
+            for contributor in self._follow("contributors_url", "/contributors")
+        ]
+
+
+    def get_issues(self) -> List[Issue]:
+        return [
+            Issue(issue, http=self._http, token=self._token)
+            for issue in self._follow("issues_url", "/issues{/number}")
+        ]
+
+
+    def get_issue(self, number: int) -> Issue:
+        return Issue(
+            self._fetch("issues_url", "/issues{/number}", number=number),
+            http=self._http,
+            token=self._token
+        )
+
+
+    def get_pull_requests(self) -> List[PullRequest]:
+        return [
+            PullRequest(pull, http=self._http, token=self._token)
+            for pull in self._follow("pulls_url", "/pulls{/number}")
+        ]
+
+
+    def get_commits(self) -> List[Commit]:
+        return [Commit(commit) for commit in self._follow("commits_url", "/commits{/sha}")]
+
+
+    def get_commit(self, sha: str) -> Commit:
+        return Commit(self._fetch("commits_url", "/commits{/sha}", sha=sha))
+
+
+    def get_releases(self) -> List[Release]:
+        return [Release(release) for release in self._follow("releases_url", "/releases{/id}")]
+
+
+    def get_labels(self) -> List[Label]:
+        return [Label(label) for label in self._follow("labels_url", "/labels{/name}")]
+
+
+    def get_milestones(self) -> List[Milestone]:
+        return [
+            Milestone(milestone) 
+            for milestone in self._follow("milestones_url", "/milestones{/number}")
+        ]
+
+
+    def get_events(self) -> List[Event]:
+        return [Event(event) for event in self._follow("events_url", "/events")]
+
+
+    def get_forks(self) -> List[Repository]:
+        return [
+            Repository(fork, http=self._http, token=self._token)
+            for fork in self._follow("forks_url", "/forks")
+        ]
+
+
+    def get_stargazers(self) -> List[User]:
+        return [
+            User(stargazer, http=self._http, token=self._token, completed=False)
+            for stargazer in self._follow("stargazers_url", "/stargazers")
+        ]
+
+
+    def get_languages(self) -> Dict[str, int]:
+        return self._fetch("languages_url", "/languages")
+
 
     def __repr__(self) -> str:
-        return f"Repository(name={self.name}, owner={self.owner.get('login') if self.owner else None})"
+        # Only data already loaded: a repr must never trigger a request.
+        owner = (self._repo_data.get("owner") or {}).get("login")
+        return f"Repository(name={self._repo_data.get('name')}, owner={owner})"
@@ -40,5 +40,24 @@ class Traffic:
         return self._traffic_data.get("uniques")
 
 
+    @property
+    def views(self) -> list:
+        return self._traffic_data.get("views") or []
+
+
+    @property
+    def clones(self) -> list:
+        return self._traffic_data.get("clones") or []
+
+
+    @property
+    def points(self) -> list:
+        """
+        The per-day ``{timestamp, count, uniques}`` entries, whichever of
+        ``views`` or ``clones`` this payload carries.
+        """
+        return self.views or self.clones
+
+
     def __repr__(self) -> str:
         return f"Traffic(count={self.count}, uniques={self.uniques})"
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""
+MIT License
+
+Copyright (c) 2024 Akami Yen
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+1. The above copyright notice and this permission notice shall be included in all
+   copies or substantial portions of the Software.
+
+2. THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+   OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+   SOFTWARE.
+"""
+
+from __future__ import annotations
+from typing import List
+
+
+class GitTreeEntry:
+    """
+    Represents one entry (blob, tree or commit) of a git tree.
+    """
+    def __init__(self, entry_data: dict) -> None:
+        self._entry_data = entry_data or {}
+
+
+    @property
+    def path(self) -> str:
+        return self._entry_data.get("path")
+
+
+    @property
+    def mode(self) -> str:
+        return self._entry_data.get("mode")
+
+
+    @property
+    def type(self) -> str:
+        return self._entry_data.get("type")
+
+
+    @property
+    def sha(self) -> str:
+        return self._entry_data.get("sha")
+
+
+    @property
+    def size(self) -> int:
+        return self._entry_data.get("size")
+
+
+    @property
+    def url(self) -> str:
+        return self._entry_data.get("url")
+
+
+    def __repr__(self) -> str:
+        return f"GitTreeEntry(path={self.path}, type={self.type})"
+
+
+class GitTree:
+    """
+    Represents a git tree.
+    """
+    def __init__(self, tree_data: dict) -> None:
+        self._tree_data = tree_data or {}
+
+
+    @property
+    def sha(self) -> str:
+        return self._tree_data.get("sha")
+
+
+    @property
+    def url(self) -> str:
+        return self._tree_data.get("url")
+
+
+    @property
+    def truncated(self) -> bool:
+        return self._tree_data.get("truncated", False)
+
+
+    @property
+    def entries(self) -> List[GitTreeEntry]:
+        return [GitTreeEntry(entry) for entry in self._tree_data.get("tree") or []]
+
+
+    @property
+    def blobs(self) -> List[GitTreeEntry]:
+        return [entry for entry in self.entries if entry.type == "blob"]
+
+
+    def __repr__(self) -> str:
+        return f"GitTree(sha={self.sha}, entries={len(self._tree_data.get('tree') or [])})"
@@ -22,172 +22,267 @@ furnished to do so, subject to the following conditions:
    SOFTWARE.
 """
 
+from __future__ import annotations
+from typing import Any, Iterator, List, Optional, TYPE_CHECKING
+
+import threading
+
+from pyGithub.ext.exceptions import GitHubError
+
+if TYPE_CHECKING:
+    from pyGithub.repository import Repository
+    from pyGithub.ext.http import Http
+
+
 class User:
     """
     Represents a GitHub user.
+
+    A user created from a partial payload (``completed=False``), such as a
+    repository owner, fetches the full profile the first time a field that
+    is not already present is read. Handles may be shared between threads;
+    concurrent first reads wait for a single fetch.
+
+    The ``get_*`` methods follow the ``*_url`` templates of the payload
+    through the bound :class:`Http`, sharing its connections and cache.
     """
-    def __init__(self, user_data: dict) -> None:
+    def __init__(
+        self, 
+        user_data: dict, 
+        http: Optional[Http] = None, 
+        token: Optional[str] = None, 
+        completed: bool = True
+    ) -> None:
         self._user_data = user_data or {}
+        self._http = http
+        self._token = token
+        self._completed = completed or http is None
+        self._lock: Optional[threading.Lock] = None if self._completed else threading.Lock()
+
+
+    def _get(self, key: str) -> Any:
+        if key not in self._user_data and not self._completed:
+            with self._lock:
+                if not self._completed:
+                    self._complete()
+        return self._user_data.get(key)
+
+
+    def _complete(self) -> None:
+        login = self._user_data.get("login")
+        if login is not None:
+            user = self._http.fetch_user(username=login, token=self._token)
+            self._user_data = {**self._user_data, **user._user_data}
+        self._completed = True
 
 
     @property
     def login(self) -> str:
-        return self._user_data.get("login")
+        return self._get("login")
 
 
     @property
     def id(self) -> int:
-        return self._user_data.get("id")
+        return self._get("id")
 
 
     @property
     def node_id(self) -> str:
-        return self._user_data.get("node_id")
+        return self._get("node_id")
 
 
     @property
     def avatar_url(self) -> str:
-        return self._user_data.get("avatar_url")
+        return self._get("avatar_url")
 
 
     @property
     def gravatar_id(self) -> str:
-        return self._user_data.get("gravatar_id")
+        return self._get("gravatar_id")
 
 
     @property
     def url(self) -> str:
-        return self._user_data.get("url")
+        return self._get("url")
 
 
     @property
     def html_url(self) -> str:
-        return self._user_data.get("html_url")
+        return self._get("html_url")
 
 
     @property
     def followers_url(self) -> str:
-        return self._user_data.get("followers_url")
+        return self._get("followers_url")
 
 
     @property
     def following_url(self) -> str:
-        return self._user_data.get("following_url")
+        return self._get("following_url")
 
 
     @property
     def gists_url(self) -> str:
-        return self._user_data.get("gists_url")
+        return self._get("gists_url")
 
 
     @property
     def starred_url(self) -> str:
-        return self._user_data.get("starred_url")
+        return self._get("starred_url")
 
 
     @property
     def subscriptions_url(self) -> str:
-        return self._user_data.get("subscriptions_url")
+        return self._get("subscriptions_url")
 
 
     @property
     def organizations_url(self) -> str:
-        return self._user_data.get("organizations_url")
+        return self._get("organizations_url")
 
 
     @property
     def repos_url(self) -> str:
-        return self._user_data.get("repos_url")
+        return self._get("repos_url")
 
 
     @property
     def events_url(self) -> str:
-        return self._user_data.get("events_url")
+        return self._get("events_url")
 
 
     @property
     def received_events_url(self) -> str:
-        return self._user_data.get("received_events_url")
+        return self._get("received_events_url")
 
 
     @property
     def type(self) -> str:
-        return self._user_data.get("type")
+        return self._get("type")
 
 
     @property
     def site_admin(self) -> bool:
-        return self._user_data.get("site_admin")
+        return self._get("site_admin")
 
 
     @property
     def name(self) -> str:
-        return self._user_data.get("name")
+        return self._get("name")
 
 
     @property
     def company(self) -> str:
-        return self._user_data.get("company")
+        return self._get("company")
 
 
     @property
     def blog(self) -> str:
-        return self._user_data.get("blog")
+        return self._get("blog")
 
 
     @property
     def location(self) -> str:
-        return self._user_data.get("location")
+        return self._get("location")
 
 
     @property
     def email(self) -> str:
-        return self._user_data.get("email")
+        return self._get("email")
 
 
     @property
     def hireable(self) -> bool:
-        return self._user_data.get("hireable")
+        return self._get("hireable")
 
 
     @property
     def bio(self) -> str:
-        return self._user_data.get("bio")
+        return self._get("bio")
 
 
     @property
     def twitter_username(self) -> str:
-        return self._user_data.get("twitter_username")
+        return self._get("twitter_username")
 
 
     @property
     def public_repos(self) -> int:
-        return self._user_data.get("public_repos")
+        return self._get("public_repos")
 
 
     @property
     def public_gists(self) -> int:
-        return self._user_data.get("public_gists")
+        return self._get("public_gists")
 
 
     @property
     def followers(self) -> int:
-        return self._user_data.get("followers")
+        return self._get("followers")
 
 
     @property
     def following(self) -> int:
-        return self._user_data.get("following")
+        return self._get("following")
 
 
     @property
     def created_at(self) -> str:
-        return self._user_data.get("created_at")
+        return self._get("created_at")
 
 
     @property
     def updated_at(self) -> str:
-        return self._user_data.get("updated_at")
+        return self._get("updated_at")
+
+    def _template(self, key: str, path: str) -> str:
+        if self._http is None:
+            raise GitHubError("User is not bound to a client.")
+        template = self._user_data.get(key)
+        if template is None:
+            template = f"{self._http.base}/users/{self._user_data.get('login')}{path}"
+        return template
+
+
+    def _follow(self, key: str, path: str, **variables: Any) -> Iterator[Any]:
+        return self._http.follow(self._template(key, path), token=self._token, **variables)
+
+
+    def _users(self, key: str, path: str) -> List[User]:
+        return [
+            User(user, http=self._http, token=self._token, completed=False)
+            for user in self._follow(key, path)
+        ]
+
+
+    def _repositories(self, key: str, path: str) -> List[Repository]:
+        from pyGithub.repository import Repository
+        return [
+            Repository(repo, http=self._http, token=self._token)
+            for repo in self._follow(key, path)
+        ]
+
+
+    def get_repos(self) -> List[Repository]:
+        return self._repositories("repos_url", "/repos")
+
+
+    def get_starred(self) -> List[Repository]:
+        return self._repositories("starred_url", "/starred{/owner}{/repo}")
+
+
+    def get_subscriptions(self) -> List[Repository]:
+        return self._repositories("subscriptions_url", "/subscriptions")
+
+
+    def get_followers(self) -> List[User]:
+        return self._users("followers_url", "/followers")
+
+
+    def get_following(self) -> List[User]:
+        return self._users("following_url", "/following{/other_user}")
+
 
     def __repr__(self) -> str:
-        return f"User(login={self.login}, id={self.id})"
+        # Only data already loaded: a repr must never trigger a request.
+        return f"User(login={self._user_data.get('login')}, id={self._user_data.get('id')})"
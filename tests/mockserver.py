@@ -0,0 +1,71 @@
+"""
+A minimal local stand-in for the GitHub API, used by the tests.
+"""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class MockServer:
+    """
+    Serves routes registered with :meth:`route` on a random local port.
+
+    A handler is called as ``handler(request, query, body)`` and returns
+    ``(status, headers, body)``; dict and list bodies are sent as JSON.
+    Every request is appended to :attr:`log` as ``(method, path, query,
+    headers)``.
+    """
+    def __init__(self):
+        self.routes = []
+        self.log = []
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                with server._lock:
+                    server.log.append((self.command, url.path, query, dict(self.headers)))
+                for method, pattern, handler in server.routes:
+                    if method == self.command and pattern.fullmatch(url.path):
+                        status, headers, out = handler(self, query, body)
+                        break
+                else:
+                    status, headers, out = 404, {}, {"message": "Not Found"}
+                headers = dict(headers)
+                if isinstance(out, (dict, list)):
+                    out = json.dumps(out).encode()
+                    headers.setdefault("Content-Type", "application/json")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(out)))
+                self.end_headers()
+                self.wfile.write(out)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+
+    def route(self, method, path, handler):
+        self.routes.append((method, re.compile(path), handler))
+
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
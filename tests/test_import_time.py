@@ -0,0 +1,59 @@
+"""
+Guards the lazy loading of ``pyGithub``: importing the package must not
+pull in its submodules, and so neither ``requests``.
+"""
+import os
+import subprocess
+import sys
+import unittest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(code: str) -> list:
+    """
+    Runs ``code`` under ``-X importtime`` and returns the imported module
+    names, in import order.
+    """
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line and not line.rstrip().endswith("package")
+    ]
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_import_does_not_load_requests(self):
+        modules = imported_modules("import pyGithub")
+        self.assertIn("pyGithub", modules)
+        self.assertFalse(
+            [name for name in modules if name == "requests" or name.startswith("requests.")],
+            "'import pyGithub' imported requests"
+        )
+
+
+    def test_import_does_not_load_submodules(self):
+        modules = imported_modules("import pyGithub")
+        self.assertEqual([name for name in modules if name.startswith("pyGithub.")], [])
+
+
+    def test_attribute_access_loads_on_demand(self):
+        # import_module() itself is not logged, only what it imports.
+        modules = imported_modules("import pyGithub; pyGithub.Client")
+        self.assertIn("pyGithub.ext.http", modules)
+        self.assertIn("requests", modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests for the write journal: a retried write keeps its journal record, so
+resuming the same input never repeats a write that already landed.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from mockserver import MockServer
+from pyGithub import Client
+from pyGithub.ext.bulk import BulkWriter, WriteOp
+from pyGithub.ext.journal import WriteJournal
+from pyGithub.ext.ratelimit import AdaptiveThrottle
+
+
+class JournalResumeTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "writes.jsonl")
+        self.server = MockServer()
+        self.created = []
+        self.limited = 1
+
+        def create(request, query, body):
+            if self.limited:
+                self.limited -= 1
+                return 403, {"Retry-After": "0"}, {"message": "You have exceeded a secondary rate limit."}
+            self.created.append(body)
+            return 201, {}, {"id": len(self.created), "number": len(self.created), "title": "A"}
+
+        self.server.route("POST", r"/repos/o/r/issues", create)
+
+
+    def tearDown(self):
+        self.server.close()
+        shutil.rmtree(self.directory)
+
+
+    def run_bulk(self, operations):
+        journal = WriteJournal(self.path, resume=True)
+        client = Client("token", journal=journal)
+        client.http.base = self.server.url
+        writer = BulkWriter(client, throttle=AdaptiveThrottle(interval=0.01, min_interval=0.01))
+        try:
+            return list(writer.run(operations))
+        finally:
+            journal.close()
+
+
+    def test_retry_then_resume(self):
+        operations = [WriteOp("issue", "o", "r", title="A"), WriteOp("issue", "o", "r", title="A")]
+        results = self.run_bulk(operations)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(len(self.created), 2)
+        # The rejected attempt and its retry share one record.
+        with open(self.path, encoding="utf-8") as journal:
+            keys = {json.loads(line)["key"] for line in journal}
+        self.assertEqual(len(keys), 2)
+
+        results = self.run_bulk(operations)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(len(self.created), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
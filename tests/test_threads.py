@@ -0,0 +1,100 @@
+"""
+Stress tests for sharing one Client across worker threads: every thread
+gets its own requests.Session, and the sharded response cache and the
+rate-limit counters stay consistent under contention.
+"""
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from mockserver import MockServer
+from pyGithub import Client
+from pyGithub.ext.cache import CachedResponse, ResponseCache
+
+
+USERS = 200
+REQUESTS = 640
+
+
+class SharedClientTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockServer()
+        self.served = 0
+        lock = threading.Lock()
+
+        def user(request, query, body):
+            login = request.path.rsplit("/", 1)[1]
+            with lock:
+                self.served += 1
+                remaining = 1000000 - self.served
+            time.sleep(0.002)
+            headers = {
+                "ETag": f'"{login}"',
+                "X-RateLimit-Limit": "1000000",
+                "X-RateLimit-Remaining": str(remaining),
+                "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            }
+            return 200, headers, {"login": login, "id": int(login[1:])}
+
+        self.server.route("GET", r"/users/u\d+", user)
+
+
+    def tearDown(self):
+        self.server.close()
+
+
+    def run_threads(self, threads):
+        client = Client("token")
+        client.http.base = self.server.url
+        sessions = {}
+
+        def fetch(index):
+            sessions.setdefault(threading.get_ident(), set()).add(id(client.http.session))
+            return client.get_user(f"u{index % USERS}").id
+
+        try:
+            with ThreadPoolExecutor(threads) as executor:
+                results = list(executor.map(fetch, range(REQUESTS)))
+            self.assertEqual(results, [index % USERS for index in range(REQUESTS)])
+            # One session per worker thread, and never shared between them.
+            self.assertTrue(all(len(ids) == 1 for ids in sessions.values()))
+            self.assertEqual(len(set().union(*sessions.values())), len(sessions))
+            self.assertLessEqual(len(list(client.http._sessions)), threads)
+            self.assertEqual(len(client.http.cache), USERS)
+            self.assertLess(client.http.rate_limits.get("core").remaining, 1000000)
+        finally:
+            client.close()
+
+
+    def test_one_thread(self):
+        self.run_threads(1)
+
+
+    def test_eight_threads(self):
+        self.run_threads(8)
+
+
+    def test_sixty_four_threads(self):
+        self.run_threads(64)
+
+
+class ResponseCacheContentionTest(unittest.TestCase):
+    def test_concurrent_get_and_set_stay_bounded(self):
+        cache = ResponseCache(maxsize=256, shards=16)
+
+        def work(worker):
+            for index in range(2000):
+                key = ("token", f"/users/u{(worker * 7919 + index) % 1024}", ())
+                if cache.get(key) is None:
+                    cache.set(key, CachedResponse({"index": index}, {}, '"etag"', None))
+            return worker
+
+        with ThreadPoolExecutor(64) as executor:
+            self.assertEqual(sorted(executor.map(work, range(64))), list(range(64)))
+        self.assertLessEqual(len(cache), 256)
+        self.assertGreater(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()